@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Decoding benchmark: a `getUpdates` response with 100 updates.
+
+Times :meth:`Update.from_array` over all updates of the payload (the json is already parsed),
+and the full path including `json.loads`, like :meth:`pytgbot.bot.Bot.get_updates` does it.
+Also times the schema driven :mod:`pytgbot.api_types.engine`, and decoding only the fields a router needs
+(see :func:`pytgbot.api_types.engine.projector`).
+
+Example:
+    python benchmarks/decode_updates.py --repeat 7 --number 200
+"""
+import argparse
+import json
+import timeit
+
+from pytgbot.api_types import engine
+from pytgbot.api_types.receivable.updates import Update
+
+from sample_updates import mixed_updates
+
+__author__ = 'luckydonald'
+
+ROUTING_FIELDS = ["update_id", "message.chat.id", "message.text", "message.entities"]
+
+
+def get_updates_payload(count, seed):
+    """ The raw http body telegram answers `getUpdates` with. """
+    return json.dumps({"ok": True, "result": mixed_updates(count, seed=seed)})
+# end def get_updates_payload
+
+
+def decode(result):
+    return [Update.from_array(update) for update in result]
+# end def decode
+
+
+def best_of(func, repeat, number):
+    """ :return: the fastest time of one call of `func`, in seconds. """
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+# end def best_of
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure decoding a getUpdates response.")
+    parser.add_argument("--count", type=int, default=100, help="Updates in the payload. Telegram sends at most 100.")
+    parser.add_argument("--repeat", type=int, default=7, help="Repetitions, the fastest one is reported.")
+    parser.add_argument("--number", type=int, default=200, help="Decodes per repetition.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the updates.")
+    args = parser.parse_args()
+
+    payload = get_updates_payload(args.count, args.seed)
+    result = json.loads(payload)["result"]
+
+    from_array = best_of(lambda: decode(result), args.repeat, args.number)
+    full = best_of(lambda: decode(json.loads(payload)["result"]), args.repeat, args.number)
+    engine_decode = best_of(lambda: engine.decode_list(Update, result, list_level=1), args.repeat, args.number)
+    project = engine.projector(Update, ROUTING_FIELDS)
+    projected = best_of(lambda: [project(update) for update in result], args.repeat, args.number)
+    print("{count} updates, {size} bytes of json".format(count=args.count, size=len(payload)))
+    print("from_array:         {total:8.3f} ms per payload, {single:6.2f} us per update".format(
+        total=from_array * 1000, single=from_array * 1000000 / args.count
+    ))
+    print("json + from_array:  {total:8.3f} ms per payload, {single:6.2f} us per update".format(
+        total=full * 1000, single=full * 1000000 / args.count
+    ))
+    print("engine.decode_list: {total:8.3f} ms per payload, {single:6.2f} us per update".format(
+        total=engine_decode * 1000, single=engine_decode * 1000000 / args.count
+    ))
+    print("routing projection: {total:8.3f} ms per payload, {single:6.2f} us per update".format(
+        total=projected * 1000, single=projected * 1000000 / args.count
+    ))
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Inline answer benchmark: serializing the `results` of :meth:`pytgbot.bot.Bot.answer_inline_query`.
+
+Compares the json of every result's `to_array()` dict (:meth:`InlineQueryResult.to_json`) with writing the json
+directly from the fields (:func:`pytgbot.api_types.engine.dumps_list`).
+
+Example:
+    python benchmarks/inline_answer.py --count 50
+"""
+import argparse
+import json
+import random
+import timeit
+
+from pytgbot.api_types import engine
+from pytgbot.api_types.sendable.inline import InlineQueryResultArticle, InputTextMessageContent
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup, InlineKeyboardButton
+
+from sample_updates import WORDS
+
+__author__ = 'luckydonald'
+
+
+def make_results(count, seed):
+    """ Search results, like an inline bot answers with. """
+    rnd = random.Random(seed)
+    results = []
+    for i in range(count):
+        title = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 4))).title()
+        results.append(InlineQueryResultArticle(
+            id=str(i), title=title,
+            input_message_content=InputTextMessageContent(
+                "<b>{title}</b>\n{text}".format(title=title, text=" ".join(rnd.choice(WORDS) for _ in range(30))),
+                parse_mode="html", disable_web_page_preview=True,
+            ),
+            reply_markup=InlineKeyboardMarkup([[
+                InlineKeyboardButton("More", callback_data="more:{i}".format(i=i)),
+                InlineKeyboardButton("Share", switch_inline_query=title),
+            ]]),
+            description=" ".join(rnd.choice(WORDS) for _ in range(10)),
+            thumb_url="https://example.com/thumb/{i}.jpg".format(i=i), thumb_width=90, thumb_height=90,
+        ))
+    # end for
+    return results
+# end def make_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure serializing inline query results.")
+    parser.add_argument("--count", type=int, default=50, help="Results per answer. Telegram allows at most 50.")
+    parser.add_argument("--repeat", type=int, default=7, help="Repetitions, the fastest one is reported.")
+    parser.add_argument("--number", type=int, default=200, help="Answers per repetition.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the results.")
+    args = parser.parse_args()
+
+    results = make_results(args.count, args.seed)
+    assert json.loads(engine.dumps_list(results)) == [result.to_array() for result in results]
+    timings = [
+        ("to_json", lambda: "[" + ",".join([result.to_json() for result in results]) + "]"),
+        ("engine.dumps_list", lambda: engine.dumps_list(results)),
+    ]
+    print("{count} results".format(count=args.count))
+    for name, func in timings:
+        duration = min(timeit.repeat(func, repeat=args.repeat, number=args.number)) / args.number
+        print("{name:<18} {total:7.3f} ms per answer, {single:6.2f} us per result, {size} bytes".format(
+            name=name + ":", total=duration * 1000, single=duration * 1000000 / args.count, size=len(func()),
+        ))
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
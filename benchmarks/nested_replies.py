@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Nesting benchmark: updates with long `reply_to_message` chains.
+
+Times decoding and encoding one update per depth, with :meth:`Update.from_array`/:meth:`Update.to_array`,
+the received dict kept (:meth:`Update.from_array_keep_raw`) and the schema driven :mod:`pytgbot.api_types.engine`.
+Depths beyond the recursion limit show if anything on the way still recurses per level.
+
+Example:
+    python benchmarks/nested_replies.py --depths 1 10 100 1000 10000
+"""
+import argparse
+import random
+import sys
+import timeit
+
+from pytgbot.api_types import engine
+from pytgbot.api_types.receivable.updates import Update
+
+from sample_updates import make_reply_chain_update
+
+__author__ = 'luckydonald'
+
+
+def best_of(func, repeat, number):
+    """ :return: the fastest time of one call of `func`, in seconds. """
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+# end def best_of
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure decoding and encoding long reply chains.")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 10, 100, 1000, 10000], help="Reply depths.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions, the fastest one is reported.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the updates.")
+    args = parser.parse_args()
+
+    print("recursion limit: {limit}".format(limit=sys.getrecursionlimit()))
+    for depth in args.depths:
+        array = make_reply_chain_update(random.Random(args.seed), 100000, depth)
+        number = max(1, 2000 // (depth + 1))
+        timings = [
+            ("from_array", lambda: Update.from_array(array)),
+            ("to_array", lambda: update.to_array()),
+            ("keep_raw", lambda: Update.from_array_keep_raw(array).to_array()),
+            ("engine decode", lambda: engine.decode(Update, array)),
+            ("engine encode", lambda: engine.encode(update)),
+        ]
+        update = None
+        results = []
+        for name, func in timings:
+            try:
+                update = Update.from_array(array)
+                duration = best_of(func, args.repeat, number)
+                results.append("{name} {single:7.2f} us".format(name=name, single=duration * 1000000 / (depth + 1)))
+            except RuntimeError:  # RecursionError in python 3.5+
+                results.append("{name} recursion limit".format(name=name))
+            # end try
+        # end for
+        print("depth {depth:>6}, per message: {results}".format(depth=depth, results=", ".join(results)))
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
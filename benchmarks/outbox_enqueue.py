@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Outbox benchmark: latency of :meth:`pytgbot.extra.outbox.Outbox.enqueue` for `send_message` calls.
+
+Compares the batched commits (the default) to waiting for the commit of every single call with `flush()`.
+The bot doesn't send anything, it only acknowledges the calls, so delivery runs too.
+
+Example:
+    python benchmarks/outbox_enqueue.py --count 5000
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import timeit
+
+from pytgbot.bot import Bot
+from pytgbot.extra.outbox import Outbox
+
+__author__ = 'luckydonald'
+
+
+class AcknowledgingBot(Bot):
+    def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
+        return {"message_id": 1}
+    # end def do
+# end class AcknowledgingBot
+
+
+def measure(outbox, count, flush):
+    timer = timeit.default_timer
+    durations = []
+    for i in range(count):
+        start = timer()
+        outbox.enqueue("send_message", 1000 + i % 50, "Reply number {i}.".format(i=i))
+        if flush:
+            outbox.flush()
+        # end if
+        durations.append(timer() - start)
+    # end for
+    durations.sort()
+    return sum(durations) / count, durations[int(count * 0.99)]
+# end def measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure enqueueing calls into the outbox.")
+    parser.add_argument("--count", type=int, default=5000, help="Calls to enqueue.")
+    parser.add_argument("--commit-interval", type=float, default=0.05, help="Seconds between the batched commits.")
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+    try:
+        for name, flush in (("batched", False), ("flush every call", True)):
+            outbox = Outbox(
+                AcknowledgingBot("123:benchmark"), os.path.join(folder, name + ".sqlite"), rate=1000.0,
+                commit_interval=args.commit_interval
+            )
+            mean, p99 = measure(outbox, args.count if not flush else args.count // 10, flush)
+            outbox.close()
+            print("{name:<18} {mean:8.1f} us mean, {p99:8.1f} us 99th percentile".format(
+                name=name + ":", mean=mean * 1000000, p99=p99 * 1000000
+            ))
+        # end for
+    finally:
+        shutil.rmtree(folder)
+    # end try
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
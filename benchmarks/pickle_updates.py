@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Pickle benchmark: size and round trip time of parsed `Update`s, like sending them to other processes
+with :mod:`multiprocessing`.
+
+Example:
+    python benchmarks/pickle_updates.py --count 1000
+"""
+import argparse
+import json
+import pickle
+import timeit
+
+from pytgbot.api_types.receivable.updates import Update
+
+from sample_updates import mixed_updates
+
+__author__ = 'luckydonald'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure pickling parsed updates.")
+    parser.add_argument("--count", type=int, default=1000, help="Number of updates.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions, the fastest one is reported.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the updates.")
+    args = parser.parse_args()
+
+    arrays = mixed_updates(args.count, seed=args.seed)
+    updates = [Update.from_array(array) for array in arrays]
+    print("{count} updates, json: {size:.1f} bytes per update".format(
+        count=args.count, size=float(sum(len(json.dumps(array)) for array in arrays)) / args.count
+    ))
+    for protocol in sorted({2, pickle.HIGHEST_PROTOCOL}):
+        # one pickle per update, like putting each on a multiprocessing queue.
+        pickles = [pickle.dumps(update, protocol) for update in updates]
+        assert [pickle.loads(data).to_array() for data in pickles] == arrays
+        dumps = min(timeit.repeat(
+            lambda: [pickle.dumps(update, protocol) for update in updates], repeat=args.repeat, number=1
+        ))
+        loads = min(timeit.repeat(lambda: [pickle.loads(data) for data in pickles], repeat=args.repeat, number=1))
+        print("protocol {protocol}: {size:6.1f} bytes, dumps {dumps:5.2f} us, loads {loads:5.2f} us per update".format(
+            protocol=protocol, size=float(sum(len(data) for data in pickles)) / args.count,
+            dumps=dumps * 1000000 / args.count, loads=loads * 1000000 / args.count,
+        ))
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Raw mode benchmark: a `getUpdates` response with `return_python_objects=False`, reading a few fields per update
+like `examples/mlfw.py` does.
+
+Compares :class:`pytgbot.dict_view.DictView` to the deep copy of `DictObject.objectify` (only measured if DictObject
+is installed). Both include the `json.loads`, as the views change the parsed json in place.
+
+Example:
+    python benchmarks/raw_updates.py --count 100
+"""
+import argparse
+import json
+import timeit
+
+from pytgbot.dict_view import DictView
+
+from sample_updates import mixed_updates
+
+try:
+    from DictObject import DictObject
+except ImportError:
+    DictObject = None
+# end try
+
+__author__ = 'luckydonald'
+
+
+def read(response):
+    queries = []
+    for update in response.result:
+        if "inline_query" in update:
+            queries.append((update.inline_query.id, update.inline_query.query, update.inline_query.offset))
+        elif "message" in update:
+            queries.append((update.message.chat.id, update.message.get("text"), None))
+        # end if
+    # end for
+    return queries
+# end def read
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure reading raw getUpdates responses.")
+    parser.add_argument("--count", type=int, default=100, help="Number of updates per response.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions, the fastest one is reported.")
+    parser.add_argument("--number", type=int, default=100, help="Responses per repetition.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the updates.")
+    args = parser.parse_args()
+
+    text = json.dumps({"ok": True, "result": mixed_updates(args.count, seed=args.seed)})
+    variants = [
+        ("json.loads only", lambda: json.loads(text)),
+        ("DictView", lambda: read(DictView(json.loads(text)))),
+    ]
+    if DictObject is not None:
+        variants.insert(1, ("DictObject.objectify", lambda: read(DictObject.objectify(json.loads(text)))))
+    # end if
+    assert len(set(repr(func()) for name, func in variants[1:])) == 1
+    print("{count} updates per response".format(count=args.count))
+    for name, func in variants:
+        duration = min(timeit.repeat(func, repeat=args.repeat, number=args.number)) / args.number
+        print("{name:<21} {total:8.3f} ms per response, {single:6.2f} us per update".format(
+            name=name + ":", total=duration * 1000, single=duration * 1000000 / args.count
+        ))
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic updates for the benchmarks.
+
+Everything is build with the real `pytgbot.api_types` classes and serialized with `to_array()`,
+so the payloads look like what telegram sends.
+"""
+import random
+
+from pytgbot.api_types.receivable.inline import InlineQuery
+from pytgbot.api_types.receivable.media import MessageEntity, PhotoSize, Location
+from pytgbot.api_types.receivable.peer import User, Chat
+from pytgbot.api_types.receivable.updates import Update, Message, CallbackQuery
+
+__author__ = 'luckydonald'
+
+# Share of each update kind in `mixed_updates(...)`. Roughly what a busy group bot sees.
+MIX_MESSAGE = 0.80
+MIX_CALLBACK_QUERY = 0.12
+MIX_INLINE_QUERY = 0.08
+
+WORDS = ["pony", "apple", "cider", "rainbow", "dash", "twilight", "sparkle", "derpy", "muffin", "cake"]
+
+
+def make_user(user_id):
+    return User(id=user_id, first_name="User{}".format(user_id), last_name="Mc{}".format(user_id % 7),
+                username="user_{}".format(user_id) if user_id % 3 else None)
+# end def make_user
+
+
+def make_chat(chat_id):
+    if chat_id > 0:
+        return Chat(id=chat_id, type="private", first_name="User{}".format(chat_id))
+    # end if
+    return Chat(id=chat_id, type="supergroup", title="Group {}".format(-chat_id), username="group_{}".format(-chat_id))
+# end def make_chat
+
+
+def make_message(rnd, message_id, chat_id, user_id, date, reply_depth=0):
+    """
+    :param reply_depth: How many `reply_to_message` levels to nest.
+    :type  reply_depth: int
+    """
+    kind = rnd.random()
+    text = None
+    entities = None
+    photo = None
+    caption = None
+    if kind < 0.15:  # command
+        text = "/search " + " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 4)))
+        entities = [MessageEntity(type="bot_command", offset=0, length=7)]
+    elif kind < 0.85:  # plain text
+        text = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 40)))
+        if rnd.random() < 0.2:
+            entities = [MessageEntity(type="mention", offset=0, length=len(text.split(" ")[0]))]
+        # end if
+    else:  # photo
+        photo = [
+            PhotoSize(file_id="AgADBAAD{}{}".format(message_id, size), width=90 * size, height=60 * size,
+                      file_size=1500 * size * size)
+            for size in (1, 4, 8)
+        ]
+        caption = rnd.choice(WORDS) if rnd.random() < 0.5 else None
+    # end if
+    reply_to_message = None
+    if reply_depth > 0:
+        reply_to_message = make_message(rnd, message_id - 1, chat_id, user_id + 1, date - 60, reply_depth - 1)
+    # end if
+    return Message(
+        message_id=message_id, date=date, chat=make_chat(chat_id), from_peer=make_user(user_id),
+        reply_to_message=reply_to_message, text=text, entities=entities, photo=photo, caption=caption,
+    )
+# end def make_message
+
+
+def make_message_update(rnd, update_id, reply_depth=None):
+    user_id = rnd.randint(10000, 13000)
+    chat_id = user_id if rnd.random() < 0.4 else -rnd.randint(1000, 1050)
+    if reply_depth is None:
+        reply_depth = 1 if rnd.random() < 0.25 else 0
+    # end if
+    message = make_message(rnd, update_id % 100000, chat_id, user_id, 1480000000 + update_id, reply_depth)
+    return Update(update_id=update_id, message=message)
+# end def make_message_update
+
+
+def make_reply_chain_update(rnd, update_id, depth):
+    """
+    A message update, replying to a message replying to a message ... `depth` levels deep.
+    Build as json level by level, so there is no limit to the depth.
+
+    :return: the update, as received from telegram.
+    :rtype: dict
+    """
+    array = make_message_update(rnd, update_id, reply_depth=0).to_array()
+    message = array["message"]
+    for _ in range(depth):
+        reply = make_message(
+            rnd, message["message_id"] - 1, message["chat"]["id"], message["from"]["id"] + 1, message["date"] - 60
+        ).to_array()
+        message["reply_to_message"] = reply
+        message = reply
+    # end for
+    return array
+# end def make_reply_chain_update
+
+
+def make_callback_query_update(rnd, update_id):
+    user_id = rnd.randint(10000, 13000)
+    chat_id = -rnd.randint(1000, 1050)
+    message = make_message(rnd, update_id % 100000, chat_id, 1234, 1480000000 + update_id)
+    callback_query = CallbackQuery(
+        id=str(update_id * 31), from_peer=make_user(user_id), chat_instance=str(chat_id * 7),
+        message=message, data="page:{}".format(rnd.randint(0, 20)),
+    )
+    return Update(update_id=update_id, callback_query=callback_query)
+# end def make_callback_query_update
+
+
+def make_inline_query_update(rnd, update_id):
+    user_id = rnd.randint(10000, 13000)
+    location = Location(longitude=rnd.uniform(-180, 180), latitude=rnd.uniform(-90, 90)) if rnd.random() < 0.1 else None
+    inline_query = InlineQuery(
+        id=str(update_id * 17), from_peer=make_user(user_id), query=" ".join(rnd.sample(WORDS, rnd.randint(0, 3))),
+        offset=str(rnd.choice([0, 0, 0, 50, 100])), location=location,
+    )
+    return Update(update_id=update_id, inline_query=inline_query)
+# end def make_inline_query_update
+
+
+def mixed_updates(count, first_update_id=100000, seed=4458):
+    """
+    Builds `count` updates with increasing `update_id`, mixing messages, callback queries and inline queries.
+
+    :param count: How many updates to generate.
+    :type  count: int
+
+    :param first_update_id: The `update_id` of the first update.
+    :type  first_update_id: int
+
+    :param seed: Random seed, so runs are comparable.
+
+    :return: list of updates, as dicts (`Update.to_array()`)
+    :rtype: list of dict
+    """
+    rnd = random.Random(seed)
+    updates = []
+    for update_id in range(first_update_id, first_update_id + count):
+        kind = rnd.random()
+        if kind < MIX_MESSAGE:
+            update = make_message_update(rnd, update_id)
+        elif kind < MIX_MESSAGE + MIX_CALLBACK_QUERY:
+            update = make_callback_query_update(rnd, update_id)
+        else:
+            update = make_inline_query_update(rnd, update_id)
+        # end if
+        updates.append(update.to_array())
+    # end for
+    return updates
+# end def mixed_updates
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Analytics benchmark: per chat message counts over many archived updates.
+
+Compares building :class:`Update` objects with :meth:`Update.from_array` to the columns of
+:class:`pytgbot.extra.update_columns.UpdateColumns`.
+
+Example:
+    python benchmarks/update_columns.py --count 100000
+"""
+import argparse
+import timeit
+from collections import Counter
+
+from pytgbot.api_types.receivable.updates import Update
+from pytgbot.extra.update_columns import UpdateColumns, KIND_MESSAGE
+
+from sample_updates import mixed_updates
+
+__author__ = 'luckydonald'
+
+
+def count_with_objects(arrays):
+    counter = Counter()
+    for array in arrays:
+        update = Update.from_array(array)
+        if update.message:
+            counter[update.message.chat.id] += 1
+        # end if
+    # end for
+    return counter
+# end def count_with_objects
+
+
+def count_with_columns(arrays):
+    columns = UpdateColumns(arrays)
+    return Counter(chat_id for chat_id, kind in zip(columns.chat_id, columns.kind) if kind == KIND_MESSAGE)
+# end def count_with_columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per chat message counts over many updates.")
+    parser.add_argument("--count", type=int, default=20000, help="Number of updates.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions, the fastest one is reported.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the updates.")
+    args = parser.parse_args()
+
+    arrays = mixed_updates(args.count, seed=args.seed)
+    assert count_with_objects(arrays) == count_with_columns(arrays)
+    print("{count} updates".format(count=args.count))
+    for name, func in (("Update.from_array", count_with_objects), ("UpdateColumns", count_with_columns)):
+        duration = min(timeit.repeat(lambda: func(arrays), repeat=args.repeat, number=1))
+        print("{name:<18} {total:8.1f} ms, {single:6.2f} us per update".format(
+            name=name + ":", total=duration * 1000, single=duration * 1000000 / args.count
+        ))
+    # end for
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Memory benchmark: bytes per parsed `Update`.
+
+Parses synthetic updates (see `sample_updates.py`) with :meth:`Update.from_array`, keeps them all alive,
+and measures the memory allocated for them with :mod:`tracemalloc` (python 3.4+).
+
+With `--intern` the :class:`User` and :class:`Chat` objects are shared, see :func:`peer.intern_peers`.
+The memory of the cache is included.
+
+Example:
+    python benchmarks/update_memory.py --count 50000 --intern
+"""
+import argparse
+import gc
+import tracemalloc
+
+from pytgbot.api_types.receivable.peer import intern_peers
+from pytgbot.api_types.receivable.updates import Update
+
+from sample_updates import mixed_updates
+
+__author__ = 'luckydonald'
+
+
+def measure(arrays):
+    """
+    Parses all the `arrays` and returns the memory the resulting `Update`s need.
+
+    :param arrays: updates as dicts, like received from telegram.
+    :type  arrays: list of dict
+
+    :return: (list of the parsed updates, allocated bytes)
+    :rtype: tuple of (list of Update, int)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        updates = [Update.from_array(array) for array in arrays]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    # end try
+    return updates, after - before
+# end def measure
+
+
+def count_objects(update):
+    """ Number of api type objects in this update, nested ones included. """
+    count = 0
+    stack = [update]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif hasattr(obj, "to_array"):
+            count += 1
+            stack.extend(getattr(obj, slot, None) for slot in _all_slots(type(obj)))
+            stack.extend(getattr(obj, "__dict__", {}).values())  # classes without __slots__
+        # end if
+    # end while
+    return count
+# end def count_objects
+
+
+def _all_slots(cls):
+    for klass in cls.__mro__:
+        for slot in getattr(klass, "__slots__", ()):
+            yield slot
+        # end for
+    # end for
+# end def _all_slots
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory of parsed updates.")
+    parser.add_argument("--count", type=int, default=20000, help="Number of updates to parse.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the updates.")
+    parser.add_argument("--intern", action="store_true", help="Share identical User and Chat objects.")
+    args = parser.parse_args()
+
+    if args.intern:
+        intern_peers(max_size=10000)
+    # end if
+    arrays = mixed_updates(args.count, seed=args.seed)
+    updates, size = measure(arrays)
+    objects = sum(count_objects(update) for update in updates)
+    print("{count} updates, {objects} api objects: {size:.1f} KiB".format(
+        count=len(updates), objects=objects, size=size / 1024.0
+    ))
+    print("bytes per Update:     {value:.1f}".format(value=float(size) / len(updates)))
+    print("bytes per api object: {value:.1f}".format(value=float(size) / objects))
+    print("instances have __dict__: {value}".format(value=hasattr(updates[0], "__dict__")))
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Load test for a webhook receiver.
+
+Posts synthetic updates (see `sample_updates.py`) with a fixed rate over a given number of parallel connections,
+like telegram does with `max_connections` in `Bot.set_webhook(...)`, and reports throughput and latency percentiles.
+
+Without `--url` the :class:`pytgbot.other.webhook_simpleserver.HookHandler` is started locally,
+parsing every update with :meth:`Update.from_array`.
+
+Example:
+    python benchmarks/webhook_load.py --rate 500 --connections 40 --count 20000
+"""
+import argparse
+import json
+import threading
+import time
+
+from pytgbot.api_types.receivable.updates import Update
+from pytgbot.other.webhook_simpleserver import HookHandler, ThreadedHookHTTPServer
+
+from sample_updates import mixed_updates
+
+try:
+    from httplib import HTTPConnection  # python 2
+    from urlparse import urlparse
+except ImportError:
+    from http.client import HTTPConnection  # python 3
+    from urllib.parse import urlparse
+# end try
+
+__author__ = 'luckydonald'
+
+try:
+    clock = time.perf_counter  # python 3
+except AttributeError:
+    clock = time.time  # python 2
+# end try
+
+
+class ParsingHookHandler(HookHandler):
+    """ Does what a bot does first with a webhook update: Parsing it. """
+    def handle_hook(self, payload):
+        Update.from_array(payload)
+    # end def handle_hook
+
+    def log_message(self, format, *args):
+        pass  # one line per request would be the bottleneck.
+    # end def log_message
+# end class ParsingHookHandler
+
+
+def percentile(sorted_values, percent):
+    """
+    Nearest-rank percentile.
+
+    :param sorted_values: ascending sorted values
+    :type  sorted_values: list of float
+
+    :param percent: e.g. `99.9`
+    :type  percent: float
+    """
+    if not sorted_values:
+        return float("nan")
+    # end if
+    rank = int(len(sorted_values) * percent / 100.0 + 0.5)
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+# end def percentile
+
+
+class LoadTest(object):
+    def __init__(self, url, payloads, rate, connections):
+        """
+        :param url: the webhook url.
+        :type  url: str
+
+        :param payloads: json encoded updates to send, in that order.
+        :type  payloads: list of bytes
+
+        :param rate: requests per second, `0` sends as fast as possible.
+        :type  rate: float
+
+        :param connections: number of parallel connections.
+        :type  connections: int
+        """
+        self.url = urlparse(url)
+        self.payloads = payloads
+        self.rate = rate
+        self.connections = connections
+        self.latencies = []
+        self.errors = 0
+        self._next = 0
+        self._lock = threading.Lock()
+        self._start = None
+    # end def __init__
+
+    def _take(self):
+        """ :return: index of the next payload to send, or `None` if all are sent. """
+        with self._lock:
+            i = self._next
+            if i >= len(self.payloads):
+                return None
+            # end if
+            self._next += 1
+            return i
+        # end with
+    # end def _take
+
+    def _worker(self):
+        conn = HTTPConnection(self.url.hostname, self.url.port or 80)
+        headers = {"Content-Type": "application/json"}
+        path = self.url.path or "/"
+        latencies = []
+        errors = 0
+        while True:
+            i = self._take()
+            if i is None:
+                break
+            # end if
+            if self.rate:
+                # open loop: the latency counts from the planned sending time,
+                # so a stalling server can't hide it's queueing delay (coordinated omission).
+                scheduled = self._start + i / self.rate
+                delay = scheduled - clock()
+                if delay > 0:
+                    time.sleep(delay)
+                # end if
+            else:
+                scheduled = clock()
+            # end if
+            try:
+                conn.request("POST", path, body=self.payloads[i], headers=headers)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    errors += 1
+                # end if
+            except Exception:
+                errors += 1
+                conn.close()
+                conn = HTTPConnection(self.url.hostname, self.url.port or 80)
+                continue
+            # end try
+            latencies.append(clock() - scheduled)
+        # end while
+        conn.close()
+        with self._lock:
+            self.latencies.extend(latencies)
+            self.errors += errors
+        # end with
+    # end def _worker
+
+    def run(self):
+        """
+        :return: the time it took, in seconds.
+        :rtype: float
+        """
+        threads = [threading.Thread(target=self._worker) for _ in range(self.connections)]
+        self._start = clock()
+        for thread in threads:
+            thread.start()
+        # end for
+        for thread in threads:
+            thread.join()
+        # end for
+        return clock() - self._start
+    # end def run
+
+    def report(self, duration):
+        latencies = sorted(self.latencies)
+        lines = [
+            "requests:   {done} ok, {errors} failed, in {duration:.2f}s".format(
+                done=len(latencies), errors=self.errors, duration=duration
+            ),
+            "throughput: {rate:.1f} updates/s".format(rate=len(latencies) / duration if duration else 0.0),
+        ]
+        for name, percent in (("p50", 50), ("p99", 99), ("p999", 99.9)):
+            lines.append("{name:<11} {value:.3f} ms".format(name=name + ":", value=percentile(latencies, percent) * 1000))
+        # end for
+        if latencies:
+            lines.append("max:        {value:.3f} ms".format(value=latencies[-1] * 1000))
+        # end if
+        return "\n".join(lines)
+    # end def report
+# end class LoadTest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test a telegram webhook receiver.")
+    parser.add_argument("--url", help="Webhook to test. Starts the local HookHandler if not given.")
+    parser.add_argument("--port", type=int, default=22113, help="Port of the local HookHandler.")
+    parser.add_argument("--rate", type=float, default=0, help="Updates per second. 0 means as fast as possible.")
+    parser.add_argument("--connections", type=int, default=40, help="Parallel connections, like `max_connections`.")
+    parser.add_argument("--count", type=int, default=10000, help="Number of updates to send.")
+    parser.add_argument("--seed", type=int, default=4458, help="Random seed for the updates.")
+    args = parser.parse_args()
+
+    payloads = [json.dumps(update).encode("utf-8") for update in mixed_updates(args.count, seed=args.seed)]
+
+    server = None
+    url = args.url
+    if not url:
+        server = ThreadedHookHTTPServer(("127.0.0.1", args.port), ParsingHookHandler)
+        threading.Thread(target=server.serve_forever).start()
+        url = "http://127.0.0.1:{port}/".format(port=args.port)
+    # end if
+    try:
+        test = LoadTest(url, payloads, rate=args.rate, connections=args.connections)
+        duration = test.run()
+        print("{url}: {count} updates, {connections} connections, rate {rate}".format(
+            url=url, count=args.count, connections=args.connections, rate=args.rate or "unlimited"
+        ))
+        print(test.report(duration))
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+        # end if
+    # end try
+# end def main
+
+
+if __name__ == '__main__':
+    main()
+# end if
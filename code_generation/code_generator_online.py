@@ -326,6 +326,7 @@ def safe_to_file(folder, results):
 
     bot_template = get_template("bot.template")
     clazzfile_template = get_template("classfile.template")
+    schema_template = get_template("schema.template")
     for path, clazz_list in clazzes.items():
         clazz_imports = set()
         for clazz_ in clazz_list:
@@ -335,9 +336,17 @@ def safe_to_file(folder, results):
         # end for
         clazz_imports = list(clazz_imports)
         clazz_imports.sort()
+        # the types used by the fields, bound on module level instead of importing in every call.
+        clazz_names = [clazz_.clazz for clazz_ in clazz_list]
+        type_imports = set()
+        for clazz_ in clazz_list:
+            type_imports.update(import_ for import_ in clazz_.imports if import_.name not in clazz_names)
+        # end for
+        type_imports = [import_ for import_ in type_imports if import_ not in clazz_imports]
+        type_imports.sort()
         try:
             with open(path, "w") as f:
-                result = clazzfile_template.render(clazzes=clazz_list, imports=clazz_imports)
+                result = clazzfile_template.render(clazzes=clazz_list, imports=clazz_imports, type_imports=type_imports)
                 result = result.replace("\t", "    ")
                 f.write(result)
                 # end with
@@ -345,6 +354,14 @@ def safe_to_file(folder, results):
             raise  # lol
             # end try
     # end for classes
+    schema_clazzes = [
+        (get_type_path(result.clazz).rstrip("."), result) for result in results if isinstance(result, Clazz)
+    ]
+    if schema_clazzes:
+        with open(calc_path_and_create_folders(folder, "pytgbot.api_types.schema."), "w") as f:
+            f.write(schema_template.render(clazzes=schema_clazzes))
+        # end with
+    # end if
     if functions:
         txt = bot_template.render(functions=functions)
         with open(functions[0].filepath, "w") as f:
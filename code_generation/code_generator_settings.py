@@ -104,6 +104,18 @@ CLASS_TYPE_PATHS = {  # class: import, master_class, descr
 
 }
 
+CLASS_SLOTS_INHERITED = {  # class: fields set by the (hand written) parent class, so subclasses don't repeat the slots.
+    "InlineQueryResult": ["id", "type"],
+}
+
+CLASS_PROJECTABLE = [  # classes whose from_array can decode only some fields, see engine.projector()
+    "Update", "Message",
+]
+
+CLASS_HASHABLE = [  # value like classes, hashable by their fields like `==`. All other classes only when frozen.
+    "User", "Chat", "PhotoSize", "MessageEntity", "KeyboardButton", "InlineKeyboardButton",
+]
+
 WHITELISTED_FUNCS = [  # Array with names of functions which have no parameters table and thus wouldn't be detected.
     "getMe",
     "getWebhookInfo",
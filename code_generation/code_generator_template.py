@@ -3,11 +3,14 @@ from jinja2 import Template, Environment, FileSystemLoader
 from jinja2.exceptions import TemplateSyntaxError
 from luckydonaldUtils.logger import logging
 from collections import Mapping
+import ast
 import os
+import re
 
 
 from code_generator import safe_var_translations, get_type_path, convert_to_underscore
-from code_generator_settings import CLASS_TYPE_PATHS, CLASS_TYPE_PATHS__IMPORT
+from code_generator_settings import CLASS_TYPE_PATHS, CLASS_TYPE_PATHS__IMPORT, CLASS_TYPE_PATHS__PARENT
+from code_generator_settings import CLASS_SLOTS_INHERITED, CLASS_HASHABLE, CLASS_PROJECTABLE
 
 __author__ = 'luckydonald'
 logger = logging.getLogger(__name__)
@@ -157,6 +160,64 @@ class Clazz(ClassOrFunction):
     def variables(self):
         return self.parameters + self.keywords
     # end def variables
+
+    @property
+    def slots(self):
+        """ The `__slots__` of the class: all variable names, except those already slotted by a parent class. """
+        inherited = set()
+        parent = self.parent_clazz.string
+        while parent in CLASS_TYPE_PATHS:
+            inherited.update(CLASS_SLOTS_INHERITED.get(parent, []))
+            parent = CLASS_TYPE_PATHS[parent][CLASS_TYPE_PATHS__PARENT]
+        # end while
+        return [variable.name for variable in self.variables if variable.name not in inherited]
+    # end def slots
+
+    @property
+    def is_receivable(self):
+        """ If it is a subclass of `Receivable`, which can keep the received dict. """
+        parent = self.parent_clazz.string
+        while parent in CLASS_TYPE_PATHS:
+            if parent == "Receivable":
+                return True
+            # end if
+            parent = CLASS_TYPE_PATHS[parent][CLASS_TYPE_PATHS__PARENT]
+        # end while
+        return False
+    # end def is_receivable
+
+    @property
+    def is_hashable(self):
+        """ If it should get a `__hash__` from its fields. """
+        return self.clazz in CLASS_HASHABLE
+    # end def is_hashable
+
+    @property
+    def is_projectable(self):
+        """ If `from_array` should have the `fields` parameter, see `engine.projector()`. """
+        return self.clazz in CLASS_PROJECTABLE
+    # end def is_projectable
+
+    @property
+    def schema_fields(self):
+        """
+        The fields for `pytgbot/api_types/schema.py`: `(attribute, json key, type, list level, optional, constant)`.
+        """
+        fields = []
+        for variable in self.variables:
+            type_ = variable.types[0] if len(variable.types) == 1 else Type("object", is_builtin=True)
+            type_path = type_.string if type_.is_builtin else type_.import_path + "." + type_.string
+            constant = None
+            if type_.always_is_value is not None:
+                constant = ast.literal_eval(type_.always_is_value)
+            elif variable.name == "type":
+                match = re.search(r"must be (\w+)", variable.description or "")  # inline query results
+                constant = match.group(1) if match else None
+            # end if
+            fields.append((variable.name, variable.api_name, type_path, type_.is_list, bool(variable.optional), constant))
+        # end for
+        return fields
+    # end def schema_fields
 # end class Clazz
 
 
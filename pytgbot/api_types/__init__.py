@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import logging
 from json import dumps as _json_dumps
+
+from luckydonaldUtils.encoding import unicode_type
 # NOTE: `from . import receivable` import at the bottom of this file
 
 __author__ = 'luckydonald'
@@ -10,6 +12,8 @@ logger = logging.getLogger(__name__)
 
 
 class TgBotApiObject(object):
+    __slots__ = []
+
     def to_array(self):
         array = dict()
         return array
@@ -22,10 +26,102 @@ class TgBotApiObject(object):
         return {}
     # end def
 
+    def to_json(self):
+        """
+        Serializes this object to a json string.
+
+        :return: `json.dumps(self.to_array())`
+        :rtype: str
+        """
+        return _json_dumps(self.to_array())
+    # end def to_json
+
+    def freeze(self):
+        """
+        Returns an immutable copy of this object, with all the objects and lists in it frozen too (lists become tuples).
+        Setting a field of it raises an :class:`AttributeError`.
+
+        The json of a frozen object is only computed once, so reusing it (e.g. the same keyboard for many messages)
+        makes :meth:`to_json` and sending it with the :class:`pytgbot.bot.Bot` cheap.
+
+        :return: the frozen copy. It is still an instance of this class.
+        """
+        return _freeze(self)
+    # end def freeze
+
+    def __reduce__(self):
+        """
+        Compact pickling: only the class and a tuple of the field values, in a fixed order.
+        Trailing `None` values (unset optional fields) are left out.
+
+        Subclasses created at runtime (frozen ones, ones keeping the received dict, lazy ones) are pickled as their
+        api class. The received dict isn't kept, but frozen objects stay frozen.
+
+        Objects of the same class in the fields, like the `reply_to_message` of a message, are pickled as one flat
+        list instead (see :func:`_reduce_chain`), as pickle would recurse for every message of a long chain.
+        This is used by :func:`copy.deepcopy` too.
+        """
+        clazz = _pickled_class(self.__class__)
+        values = [getattr(self, name) for name in _pickled_fields(clazz)]
+        for value in values:
+            if isinstance(value, TgBotApiObject) and _pickled_class(value.__class__) is clazz:
+                return _unpickle_chain, _reduce_chain(self, clazz)
+            # end if
+        # end for
+        while values and values[-1] is None:
+            values.pop()
+        # end while
+        if isinstance(self, Frozen):
+            return _unpickle, (clazz, tuple(values), True)
+        # end if
+        return _unpickle, (clazz, tuple(values))
+    # end def __reduce__
+
+    def __eq__(self, other):
+        """
+        Implements `obj == other`: Objects of the same api class are equal if all their fields are.
+        Frozen copies are equal to the original (tuples compare like the lists they were).
+
+        Like `==`, the hash is from the fields, so equal objects hash equal. Only objects which can be used as keys
+        hash at all: the value like types (`User`, `Chat`, `PhotoSize`, `MessageEntity`, the keyboard buttons)
+        and frozen objects, which cache it (see :meth:`freeze`). The others are unhashable, like a `list`.
+        """
+        if self is other:
+            return True
+        # end if
+        if not isinstance(other, TgBotApiObject):
+            return NotImplemented
+        # end if
+        return _equal(self, other)
+    # end def __eq__
+
+    def __ne__(self, other):
+        """
+        Implements `obj != other`, needed for python 2.
+        """
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+    # end def __ne__
+
+    __hash__ = None  # mutable, see __eq__. The value like classes generate one, frozen ones have it from `Frozen`.
+
     # # # # # # # # # # # # # #
     # helper functions below #
     # # # # # # # # # # # # #
 
+    @classmethod
+    def _new_trusted(cls):
+        """
+        Creates an instance without calling `__init__`, so none of its asserts run.
+
+        Only for the `from_array` decoders, which set every field themselves, with values of the right type.
+        Objects built by hand go through `__init__` and are checked as usual.
+
+        :return: new instance, with no fields set yet.
+        """
+        return cls.__new__(cls)
+    # end def _new_trusted
+
     @classmethod
     def from_array_list(cls, result, list_level):
         """
@@ -70,11 +166,357 @@ class TgBotApiObject(object):
 # end class
 
 
+class Frozen(object):
+    """
+    Mixin of the frozen copies created by :meth:`TgBotApiObject.freeze`.
+    Their class is a subclass of the original one, with this mixin and the `_json` and `_hash` slots
+    caching :meth:`to_json` and :meth:`__hash__`.
+    """
+    __slots__ = []
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{cls} object is frozen, can't set {name!r}.".format(
+            cls=self.__class__.__name__, name=name
+        ))
+    # end def __setattr__
+
+    def __delattr__(self, name):
+        raise AttributeError("{cls} object is frozen, can't delete {name!r}.".format(
+            cls=self.__class__.__name__, name=name
+        ))
+    # end def __delattr__
+
+    def freeze(self):
+        return self  # already is.
+    # end def freeze
+
+    def to_json(self):
+        """
+        Serializes this object to a json string. Only done the first time, later calls return the same string.
+
+        :rtype: str
+        """
+        json = self._json
+        if json is None:
+            json = _json_dumps(self.to_array())
+            object.__setattr__(self, "_json", json)
+        # end if
+        return json
+    # end def to_json
+
+    def __hash__(self):
+        """
+        Implements `hash(obj)`, from the fields. Only computed the first time.
+        Works on long `reply_to_message` chains too, see :func:`_frozen_hash`.
+        """
+        value = self._hash
+        if value is None:
+            value = _frozen_hash(self)
+        # end if
+        return value
+    # end def __hash__
+# end class Frozen
+
+
 # # # # # # #
 # Functions #
 # # # # # # #
 
 
+_frozen_classes = {}  # class: frozen subclass
+
+
+def _frozen_class(clazz):
+    frozen = _frozen_classes.get(clazz)
+    if frozen is None:
+        frozen = _frozen_classes[clazz] = type(clazz.__name__, (Frozen, clazz), {
+            "__slots__": ["_json", "_hash"], "__module__": clazz.__module__,
+        })
+    # end if
+    return frozen
+# end def _frozen_class
+
+
+def _freeze(value):
+    """
+    Immutable copy of the value: :class:`TgBotApiObject` s get frozen, lists and tuples become tuples.
+    Uses a stack instead of recursing, so long `reply_to_message` chains don't hit the recursion limit.
+    """
+    todo = []  # (frozen copy, original), the copies get their fields in this loop.
+    frozen = _frozen_shell(value, todo)
+    while todo:
+        copy, original = todo.pop()
+        for klass in original.__class__.__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if name.startswith("_"):
+                    object.__setattr__(copy, name, None)  # _raw of receivables, as the lists are tuples now.
+                else:
+                    object.__setattr__(copy, name, _frozen_shell(getattr(original, name), todo))
+                # end if
+            # end for
+        # end for
+        object.__setattr__(copy, "_json", None)
+        object.__setattr__(copy, "_hash", None)
+    # end while
+    return frozen
+# end def _freeze
+
+
+def _frozen_shell(value, todo):
+    """
+    The frozen version of `value` for :func:`_freeze`. The fields of new frozen objects are set later,
+    the object and the original are added to `todo` for that.
+    """
+    if isinstance(value, Frozen):
+        return value
+    # end if
+    if isinstance(value, TgBotApiObject):
+        clazz = _frozen_class(value.__class__)
+        frozen = clazz.__new__(clazz)
+        todo.append((frozen, value))
+        return frozen
+    # end if
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen_shell(item, todo) for item in value)  # only as deep as the lists, e.g. keyboard rows.
+    # end if
+    return value
+# end def _frozen_shell
+
+
+def _frozen_hash(frozen):
+    """
+    Computes and caches the hash of a frozen object, and of the frozen objects in it which have none yet.
+    Those are done first, so hashing the tuple of the fields never has to recurse.
+    """
+    todo = [(frozen, False)]  # (frozen object, if the objects in it are hashed already)
+    while todo:
+        value, ready = todo.pop()
+        if value._hash is not None:
+            continue
+        # end if
+        clazz = _pickled_class(value.__class__)
+        fields = tuple(getattr(value, name) for name in _pickled_fields(clazz))
+        if ready:
+            object.__setattr__(value, "_hash", hash((clazz,) + fields))
+            continue
+        # end if
+        todo.append((value, True))
+        items = list(fields)
+        while items:
+            item = items.pop()
+            if isinstance(item, tuple):
+                items.extend(item)
+            elif isinstance(item, Frozen) and item._hash is None:
+                todo.append((item, False))
+            # end if
+        # end while
+    # end while
+    return frozen._hash
+# end def _frozen_hash
+
+
+def _equal(value, other):
+    """
+    If two :class:`TgBotApiObject` s have the same api class and equal fields, for :meth:`TgBotApiObject.__eq__`.
+    Lists and tuples (e.g. of a frozen copy) are equal if their elements are.
+    Uses a stack instead of recursing, so long `reply_to_message` chains don't hit the recursion limit.
+    """
+    todo = [(value, other)]
+    while todo:
+        value, other = todo.pop()
+        if value is other:
+            continue
+        # end if
+        if isinstance(value, TgBotApiObject) and isinstance(other, TgBotApiObject):
+            clazz = _pickled_class(value.__class__)
+            if clazz is not _pickled_class(other.__class__):
+                return False
+            # end if
+            todo.extend((getattr(value, name), getattr(other, name)) for name in _pickled_fields(clazz))
+        elif isinstance(value, (list, tuple)) and isinstance(other, (list, tuple)):
+            if len(value) != len(other):
+                return False
+            # end if
+            todo.extend(zip(value, other))
+        elif isinstance(value, TgBotApiObject) or isinstance(other, TgBotApiObject) or value != other:
+            return False
+        # end if
+    # end while
+    return True
+# end def _equal
+
+
+_pickled_classes = {}  # class: the class to pickle it as
+_pickled_fields_cache = {}  # class: names of the fields, in pickle order
+
+
+def _pickled_class(clazz):
+    """ The api class of `clazz`, skipping the subclasses of :meth:`TgBotApiObject.freeze`, lazy ones etc. """
+    pickled = _pickled_classes.get(clazz)
+    if pickled is None:
+        from .receivable import KeepsRaw
+        pickled = next(klass for klass in clazz.__mro__ if not issubclass(klass, (Frozen, KeepsRaw)))
+        _pickled_classes[clazz] = pickled
+    # end if
+    return pickled
+# end def _pickled_class
+
+
+def _pickled_fields(clazz):
+    """ The public slots of the class, those of the parent classes first. """
+    fields = _pickled_fields_cache.get(clazz)
+    if fields is None:
+        fields = tuple(
+            name for klass in reversed(clazz.__mro__) for name in klass.__dict__.get("__slots__", ())
+            if not name.startswith("_")
+        )
+        _pickled_fields_cache[clazz] = fields
+    # end if
+    return fields
+# end def _pickled_fields
+
+
+def _unpickle(clazz, values, frozen=False):
+    """ Recreates an object pickled by :meth:`TgBotApiObject.__reduce__`. """
+    instance = clazz._new_trusted()
+    fields = _pickled_fields(clazz)
+    for name, value in zip(fields, values):
+        setattr(instance, name, value)
+    # end for
+    for name in fields[len(values):]:
+        setattr(instance, name, None)
+    # end for
+    if frozen:
+        return _freeze(instance)  # the objects in it are already frozen, only this one is copied.
+    # end if
+    return instance
+# end def _unpickle
+
+
+def _reduce_chain(value, clazz):
+    """
+    The arguments of :func:`_unpickle_chain` for `value` and the objects of the same class in it, in its fields,
+    in theirs and so on. Uses a stack instead of recursing.
+
+    :return: `(clazz, nodes, links, frozen)`: the field values of every object, without those of the same class,
+             the `(object index, field index, index of the object in that field)` between them, and the indices
+             of the frozen objects.
+    """
+    fields = _pickled_fields(clazz)
+    nodes = []
+    links = []
+    frozen = []
+    indices = {}  # id of the object: index, an object in several fields is only pickled once.
+    todo = [(None, None, value)]  # (index of the parent, field index, object)
+    while todo:
+        parent, field, value = todo.pop()
+        index = indices.get(id(value))
+        if index is None:
+            index = indices[id(value)] = len(nodes)
+            values = [getattr(value, name) for name in fields]
+            for i, child in enumerate(values):
+                if isinstance(child, TgBotApiObject) and _pickled_class(child.__class__) is clazz:
+                    values[i] = None
+                    todo.append((index, i, child))
+                # end if
+            # end for
+            while values and values[-1] is None:
+                values.pop()
+            # end while
+            nodes.append(tuple(values))
+            if isinstance(value, Frozen):
+                frozen.append(index)
+            # end if
+        # end if
+        if parent is not None:
+            links.append((parent, field, index))
+        # end if
+    # end while
+    return clazz, tuple(nodes), tuple(links), tuple(frozen)
+# end def _reduce_chain
+
+
+def _unpickle_chain(clazz, nodes, links, frozen=()):
+    """ Recreates the objects pickled by :func:`_reduce_chain`, and returns the first one. """
+    frozen = set(frozen)
+    instances = [_unpickle(clazz, values, i in frozen) for i, values in enumerate(nodes)]
+    fields = _pickled_fields(clazz)
+    for parent, field, child in links:
+        object.__setattr__(instances[parent], fields[field], instances[child])  # frozen ones too.
+    # end for
+    return instances[0]
+# end def _unpickle_chain
+
+
+def _to_bool(value):
+    if value is True or value is False:
+        return value
+    # end if
+    if value in (0, 1):
+        return bool(value)
+    # end if
+    try:
+        return _BOOL_STRINGS[value]
+    except (KeyError, TypeError):
+        raise ValueError("Can't parse {value!r} as bool.".format(value=value))
+    # end try
+# end def _to_bool
+
+
+def _to_int(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    # end if
+    return int(value)  # raises ValueError if it's no int.
+# end def _to_int
+
+
+def _to_float(value):
+    if isinstance(value, float):
+        return value
+    # end if
+    return float(value)  # ints are fine too.
+# end def _to_float
+
+
+def _to_unicode(value):
+    if isinstance(value, unicode_type):
+        return value
+    # end if
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    # end if
+    return unicode_type(value)
+# end def _to_unicode
+
+
+_BOOL_STRINGS = {"True": True, "False": False, "true": True, "false": False}
+_BUILTIN_DECODERS = {  # builtin type: function converting a json value to it
+    bool: _to_bool,
+    int: _to_int,
+    float: _to_float,
+    str: _to_unicode,  # json strings are unicode in python 2 too
+    unicode_type: _to_unicode,
+}
+
+
+def _builtin_decoder(required_type):
+    """
+    :return: function converting a json value to the builtin type `required_type`.
+    """
+    decode = _BUILTIN_DECODERS.get(required_type)
+    if decode is None:
+        def decode(value):
+            if isinstance(value, required_type):
+                return value
+            # end if
+            return required_type(value)
+        # end def decode
+    # end if
+    return decode
+# end def _builtin_decoder
+
+
 def from_array_list(required_type, result, list_level, is_builtin):
     """
     Tries to parse the `result` as type given in `required_type`, while traversing into lists as often as specified in `list_level`.
@@ -95,27 +537,31 @@ def from_array_list(required_type, result, list_level, is_builtin):
     logger.debug("Trying parsing as {type}, list_level={list_level}, is_builtin={is_builtin}".format(
         type=required_type.__name__, list_level=list_level, is_builtin=is_builtin
     ))
-    if list_level > 0:
-        assert isinstance(result, (list, tuple))
-        return [from_array_list(required_type, obj, list_level-1, is_builtin) for obj in result]
-    # end if
-    if is_builtin:
-        if isinstance(result, required_type):
-            logger.debug("Already is correct type.")
-            return required_type(result)
-        else:
-            import ast
-            logger.debug("Trying parsing with ast.literal_eval()...")
-            return ast.literal_eval(str(result))  # raises ValueError if it could not parse
-        # end if
-    else:
-        return required_type.from_array(result)
+    decode = _builtin_decoder(required_type) if is_builtin else required_type.from_array
+    return _decode_list(decode, result, list_level)
+# end def from_array_list
+
+
+def _decode_list(decode, result, list_level):
+    """ Applies `decode` to all elements of the `list_level` times nested list `result`. """
+    if list_level == 0:
+        return decode(result)
     # end if
-# end def _parse_builtin_type
+    assert isinstance(result, (list, tuple))
+    if list_level == 1:  # flat list, the usual case.
+        return [decode(obj) for obj in result]
+    # end if
+    return [_decode_list(decode, obj, list_level - 1) for obj in result]
+# end def _decode_list
+
+
+_JSON_SCALARS = (bool, int, float, str, unicode_type)
 
 
 def as_array(obj):
-    if hasattr(obj, "to_array"):
+    if obj is None or isinstance(obj, _JSON_SCALARS):
+        return obj  # already json, the usual case for the elements of lists. No need to check with json.dumps.
+    elif hasattr(obj, "to_array"):
         return obj.to_array()
     elif isinstance(obj, (list, tuple)):
         return [as_array(x) for x in obj]
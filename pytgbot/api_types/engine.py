@@ -0,0 +1,768 @@
+# -*- coding: utf-8 -*-
+"""
+One decoder and encoder for all api types, driven by the field schema in :mod:`pytgbot.api_types.schema`.
+
+On first use a `decode_<Class>` and `encode_<Class>` function is compiled for every class in the schema,
+with one line per field, like a hand written `from_array`/`to_array` would be. Nested types call each other directly.
+The `from_array` and `to_array` of the classes in the schema call these, so there is only one implementation.
+
+Usage::
+
+    from pytgbot.api_types import engine
+    from pytgbot.api_types.receivable.updates import Update
+
+    update = engine.decode(Update, array)
+    updates = engine.decode_list(Update, result, list_level=1)
+    array = engine.encode(update)
+
+Decoding creates the objects without checking the fields (see `_new_trusted`). `User` and `Chat` are interned,
+if enabled with :func:`pytgbot.api_types.receivable.peer.intern_peers`.
+Encoding returns the received dict for unchanged received objects (see `from_array_keep_raw`), everything else
+is build from the fields (changed received ones keep the fields unknown to their class). The values are converted
+to their type, and the fields with a limit (see :data:`pytgbot.api_types.limits.FIELD_LIMITS`) are checked.
+
+Sendable objects can be written as json text directly, without building the dicts of `to_array` first::
+
+    results = engine.dumps_list(inline_query_results)  # '[{"type":"article","id":"1",...},...]'
+
+A projection decodes only the given fields, all the others stay `None`::
+
+    route = engine.projector(Update, ["update_id", "message.chat.id", "message.text", "message.entities"])
+    update = route(array)  # update.message.chat.id is set, update.message.sticker is None, even if there is one.
+"""
+import importlib
+import json
+import threading
+from json.encoder import encode_basestring_ascii as _json_string  # the C version, as used by json.dumps
+
+from luckydonaldUtils.encoding import unicode_type
+from luckydonaldUtils.logger import logging
+
+from .schema import SCHEMA
+
+__author__ = 'luckydonald'
+__all__ = ["decode", "decode_list", "decoder", "encode", "dumps", "dumps_list", "projector"]
+logger = logging.getLogger(__name__)
+
+
+_BUILTINS = ("int", "str", "bool", "float")
+_LOCAL_FIELDS = {  # import path: {attribute: value}. Set by the hand written classes, not part of the api.
+    "pytgbot.api_types.receivable.media.Sticker": {"mime_type": "image/webp"},
+}
+_INTERNED = (  # import paths of the classes decoded through the cache of `peer.intern_peers()`, if enabled.
+    "pytgbot.api_types.receivable.peer.User",
+    "pytgbot.api_types.receivable.peer.Chat",
+)
+_PEER_MODULE = "pytgbot.api_types.receivable.peer"  # has that cache
+_TEXT_TYPES = (str, unicode_type)
+
+_namespace = {}  # globals of the compiled functions: `decode_<Class>`, `encode_<Class>`, `new_<Class>` and `encode`.
+_decoders = {}  # class: decode function
+_encoders = {}  # class: encode function. Subclasses (see `freeze`, `from_array_keep_raw`) are added on first use.
+_paths = {}  # class: import path, the key in the schema
+_writers = {}  # class: write function, see `dumps`. Like `_encoders`, subclasses are added on first use.
+_projectors = {}  # (class, fields): projected decode function
+_lock = threading.Lock()
+
+
+def decode(clazz, array):
+    """
+    Deserializes a new `clazz` from the given dictionary, what `clazz.from_array(array)` does.
+
+    :param clazz: The api type, e.g. :class:`pytgbot.api_types.receivable.updates.Update`.
+    :type  clazz: class
+
+    :param array: The received dictionary.
+    :type  array: dict
+
+    :return: new `clazz` instance, or `None` if the array is empty.
+    """
+    return decoder(clazz)(array)
+# end def decode
+
+
+def decode_list(clazz, result, list_level):
+    """
+    Like `clazz.from_array_list(result, list_level)`.
+
+    :param list_level: "list of" * list_level
+    :type  list_level: int
+    """
+    decode_function = decoder(clazz)
+    if list_level == 0:
+        return decode_function(result)
+    # end if
+    return [decode_list(clazz, item, list_level - 1) if list_level > 1 else decode_function(item) for item in result]
+# end def decode_list
+
+
+def decoder(clazz):
+    """
+    The compiled decode function, for calling it in a loop without looking it up every time.
+
+    :param clazz: The api type.
+    :type  clazz: class
+
+    :return: function(array) -> `clazz` instance
+    """
+    if not _decoders:
+        _compile()
+    # end if
+    try:
+        return _decoders[clazz]
+    except KeyError:
+        raise TypeError("{clazz!r} is not in the schema.".format(clazz=clazz))
+    # end try
+# end def decoder
+
+
+def encode(obj):
+    """
+    Serializes the api object to a dictionary, what `obj.to_array()` does.
+
+    :param obj: The api object.
+    :type  obj: pytgbot.api_types.TgBotApiObject
+
+    :return: dictionary representation of this object.
+    :rtype: dict
+    """
+    try:
+        encode_function = _encoders[obj.__class__]
+    except KeyError:
+        encode_function = _encoder(obj.__class__)
+    # end try
+    return encode_function(obj)
+# end def encode
+
+
+def dumps(obj):
+    """
+    Serializes the api object to json, like `obj.to_json()`, but writing the json text directly from the fields,
+    without building the dict of `to_array()` first. The json is compact, without spaces.
+
+    :param obj: The api object.
+    :type  obj: pytgbot.api_types.TgBotApiObject
+
+    :rtype: str
+    """
+    parts = []
+    write(obj, parts.append)
+    return "".join(parts)
+# end def dumps
+
+
+def dumps_list(objs):
+    """
+    Serializes the api objects to a json array, e.g. the `results` of `answer_inline_query`.
+    All of them are written into the same buffer, which is joined to a string once at the end.
+
+    :param objs: The api objects.
+    :type  objs: list of pytgbot.api_types.TgBotApiObject
+
+    :rtype: str
+    """
+    parts = ["["]
+    append = parts.append
+    for i, obj in enumerate(objs):
+        if i:
+            append(",")
+        # end if
+        write(obj, append)
+    # end for
+    append("]")
+    return "".join(parts)
+# end def dumps_list
+
+
+def write(obj, append):
+    """
+    Writes the json of the api object, in parts.
+
+    :param obj: The api object.
+    :type  obj: pytgbot.api_types.TgBotApiObject
+
+    :param append: Called with each part of the json text, e.g. `list.append`.
+    :type  append: function
+    """
+    try:
+        write_function = _writers[obj.__class__]
+    except KeyError:
+        write_function = _writer(obj.__class__)
+    # end try
+    write_function(obj, append)
+# end def write
+
+
+def _writer(clazz):
+    """ The write function of the class, or of the nearest parent class in the schema. """
+    from . import Frozen
+    if not _decoders:
+        _compile()
+    # end if
+    if issubclass(clazz, Frozen):
+        def write_function(obj, append):
+            append(obj.to_json())  # cached
+        # end def write_function
+    else:
+        for klass in clazz.__mro__:
+            if klass in _decoders:
+                write_function = _namespace.get("write_" + klass.__name__, _write_encoded)
+                break
+            # end if
+        else:
+            write_function = _write_encoded
+        # end for
+    # end if
+    _writers[clazz] = write_function
+    return write_function
+# end def _writer
+
+
+def _write_encoded(obj, append):
+    """ For the classes without a write function, e.g. received ones, which could still have the received dict. """
+    append(_json_value(encode(obj)))
+# end def _write_encoded
+
+
+def _json_value(value):
+    """ Compact json of builtin values, like lists of strings. """
+    return json.dumps(value, separators=(",", ":"))
+# end def _json_value
+
+
+def _write_list(value, write_item, append, list_level):
+    """ Writes the `list_level` times nested list, calling `write_item(item, append)` for the elements. """
+    append("[")
+    for i, item in enumerate(value):
+        if i:
+            append(",")
+        # end if
+        if list_level > 1:
+            _write_list(item, write_item, append, list_level - 1)
+        else:
+            write_item(item, append)
+        # end if
+    # end for
+    append("]")
+# end def _write_list
+
+
+def projector(clazz, fields):
+    """
+    A decode function only setting the given fields, for reading a few values out of many received objects.
+    All other fields are `None`, and are neither decoded nor checked.
+    The objects are incomplete, so they are meant for reading, not for `to_array()` or sending them again.
+
+    The fields are attribute names, nested ones separated by a dot, e.g. `"message.chat.id"`.
+    For lists, like `"message.entities.type"`, it applies to every element.
+    A field without sub fields, like `"message.entities"`, is decoded completely.
+
+    The compiled function is cached, so it's cheap to call this again with the same fields.
+
+    :param clazz: The api type, e.g. :class:`pytgbot.api_types.receivable.updates.Update`.
+    :type  clazz: class
+
+    :param fields: The attributes to decode, e.g. `["message.chat.id", "message.text"]`.
+    :type  fields: list of str
+
+    :return: function(array) -> `clazz` instance, or `None` if the array is empty.
+    :raises ValueError: A field which doesn't exist.
+    """
+    given = (clazz, tuple(fields))
+    try:
+        return _projectors[given]  # called for every update with the same list, so no sorting before the lookup.
+    except KeyError:
+        pass
+    # end try
+    key = (clazz, tuple(sorted(set(fields))))
+    if key in _projectors:
+        return _projectors.setdefault(given, _projectors[key])
+    # end if
+    if not _decoders:
+        _compile()
+    # end if
+    if clazz not in _paths:
+        raise TypeError("{clazz!r} is not in the schema.".format(clazz=clazz))
+    # end if
+    tree = {}  # attribute: sub tree. Empty means the whole field.
+    for field in key[1]:
+        node = tree
+        for attribute in field.split("."):
+            node = node.setdefault(attribute, {})
+        # end for
+    # end for
+    sources = []
+    name = _projection_source(_paths[clazz], tree, sources, key[1])
+    namespace = dict(_namespace)
+    exec(compile("\n\n".join(sources), "<pytgbot.api_types.engine projection>", "exec"), namespace)
+    with _lock:
+        project = _projectors.setdefault(key, namespace[name])
+        return _projectors.setdefault(given, project)
+    # end with
+# end def projector
+
+
+def _projection_source(path, tree, sources, fields):
+    """
+    Adds the source code of the projected decode function of the class to `sources`,
+    and the ones of the nested projected classes.
+
+    :return: the name of the function.
+    """
+    name = "project{index}_{name}".format(index=len(sources), name=path.rpartition(".")[2])
+    sources.append(None)  # reserves the index, nested functions are added while building this one.
+    index = len(sources) - 1
+    known = set(field[0] for field in SCHEMA[path])
+    for attribute in tree:
+        if attribute not in known:
+            raise ValueError("{path} has no field {attribute!r} (fields: {fields!r}).".format(
+                path=path, attribute=attribute, fields=list(fields)
+            ))
+        # end if
+    # end for
+    lines = [
+        "def {name}(array):".format(name=name),
+        "    if not array:",
+        "        return None",
+        "    instance = new_{name}()".format(name=path.rpartition(".")[2]),
+    ]
+    for attribute, key, type_path, list_level, optional, constant in SCHEMA[path]:
+        if constant is not None:
+            lines.append("    instance.{attribute} = {constant!r}".format(attribute=attribute, constant=constant))
+        elif attribute not in tree:
+            lines.append("    instance.{attribute} = None".format(attribute=attribute))
+        elif type_path in _BUILTINS:
+            if tree[attribute]:
+                raise ValueError("{path}.{attribute} is a {type}, it has no field {sub!r}.".format(
+                    path=path, attribute=attribute, type=type_path, sub=next(iter(tree[attribute]))
+                ))
+            # end if
+            lines.append("    instance.{attribute} = array.get({key!r})".format(attribute=attribute, key=key))
+        else:
+            if tree[attribute] and type_path in SCHEMA:
+                function = _projection_source(type_path, tree[attribute], sources, fields)
+            elif tree[attribute]:
+                raise ValueError("{path}.{attribute} can't be projected, {type} has different subclasses.".format(
+                    path=path, attribute=attribute, type=type_path
+                ))
+            else:
+                function = "decode_" + type_path.rpartition(".")[2]
+            # end if
+            lines.append("    value = array.get({key!r})".format(key=key))
+            lines.append("    instance.{attribute} = {expression} if value is not None else None".format(
+                attribute=attribute, expression=_list_expression(function, "value", list_level)
+            ))
+        # end if
+    # end for
+    for attribute, value in _LOCAL_FIELDS.get(path, {}).items():
+        lines.append("    instance.{attribute} = {value!r}".format(attribute=attribute, value=value))
+    # end for
+    lines.append("    return instance")
+    sources[index] = "\n".join(lines)
+    return name
+# end def _projection_source
+
+
+def _encoder(clazz):
+    """ The encode function of the class, or the one of the nearest parent class in the schema. """
+    if not _decoders:
+        _compile()
+    # end if
+    for klass in clazz.__mro__:
+        if klass in _decoders:  # not _encoders, which could already contain a different subclass of it.
+            encode_function = _encoders[klass]
+            break
+        # end if
+    else:
+        encode_function = clazz.to_array  # e.g. abstract types like InputMessageContent, or custom classes.
+    # end for
+    _encoders[clazz] = encode_function
+    return encode_function
+# end def _encoder
+
+
+def _compile():
+    """ Compiles the decode and encode functions of all the classes in the schema, once. """
+    from .receivable import Receivable
+    with _lock:
+        if _decoders:
+            return  # other thread was faster
+        # end if
+        classes = dict((path, _resolve(path)) for path in SCHEMA)
+        received = set(path for path, clazz in classes.items() if issubclass(clazz, Receivable))
+        namespace = {
+            "encode": encode, "write": write, "write_list": _write_list, "string": _json_string, "json": _json_value,
+            "json_float": _json_float, "text_types": _TEXT_TYPES, "peer": importlib.import_module(_PEER_MODULE),
+            "to_int": int, "to_float": float, "to_bool": bool, "to_str": _to_str,
+        }
+        sources = []
+        for path, fields in SCHEMA.items():
+            clazz = classes[path]
+            name = clazz.__name__
+            namespace["new_" + name] = clazz._new_trusted
+            for field in fields:
+                type_path = field[2]
+                if type_path not in _BUILTINS and type_path not in SCHEMA:  # e.g. the abstract InputMessageContent
+                    referenced = _resolve(type_path)
+                    namespace["decode_" + referenced.__name__] = referenced.from_array
+                # end if
+            # end for
+            limits = _field_limits(clazz, fields) if path not in received else {}
+            for attribute, (limit, _, _) in limits.items():
+                namespace["limit_{name}_{attribute}".format(name=name, attribute=attribute)] = limit
+            # end for
+            if path in _INTERNED:
+                namespace["class_" + name] = clazz
+            # end if
+            sources.append(_decoder_source(path, fields, _LOCAL_FIELDS.get(path, {}), path in _INTERNED))
+            sources.append(_encoder_source(path, fields, issubclass(clazz, Receivable), limits))
+            if path not in received:  # received ones are written from the dict, which could be kept.
+                sources.append(_writer_source(path, fields, received, limits))
+            # end if
+        # end for
+        exec(compile("\n\n".join(sources), "<pytgbot.api_types.engine>", "exec"), namespace)
+        _namespace.update(namespace)
+        for path, clazz in classes.items():
+            _encoders[clazz] = namespace["encode_" + clazz.__name__]
+            _paths[clazz] = path
+            _decoders[clazz] = namespace["decode_" + clazz.__name__]  # last, it's the `_compile()` was done check
+        # end for
+        logger.debug("Compiled the decoders, encoders and writers of {count} classes.".format(count=len(classes)))
+    # end with
+# end def _compile
+
+
+def _field_limits(clazz, fields):
+    """
+    The :data:`pytgbot.api_types.limits.FIELD_LIMITS` of the fields of the class, including the ones of its bases.
+
+    :return: `{attribute: (limit, field name for the error, attribute with the parse_mode or None)}`
+    :rtype: dict
+    """
+    from .limits import FIELD_LIMITS
+    limits = {}
+    for field in fields:
+        attribute = field[0]
+        for klass in clazz.__mro__:
+            name = "{clazz}.{attribute}".format(clazz=klass.__name__, attribute=attribute)
+            if name in FIELD_LIMITS:
+                limit, parse_mode = FIELD_LIMITS[name]
+                limits[attribute] = (limit, name, parse_mode)
+                break
+            # end if
+        # end for
+    # end for
+    return limits
+# end def _field_limits
+
+
+def _resolve(path):
+    """ The class of the import path, e.g. `"pytgbot.api_types.receivable.peer.User"`. """
+    module, _, name = path.rpartition(".")
+    return getattr(importlib.import_module(module), name)
+# end def _resolve
+
+
+def _list_expression(function, variable, list_level):
+    """ Source code applying `function` to all elements of the `list_level` times nested list `variable`. """
+    if list_level == 0:
+        return "{function}({variable})".format(function=function, variable=variable)
+    # end if
+    item = "item{level}".format(level=list_level)
+    return "[{inner} for {item} in {variable}]".format(
+        inner=_list_expression(function, item, list_level - 1), item=item, variable=variable
+    )
+# end def _list_expression
+
+
+def _self_references(path, fields):
+    """
+    The attributes of the class' own type, like the `reply_to_message` of a message.
+    Those chains are decoded and encoded in a loop instead of recursing, so deep ones don't hit the recursion limit.
+    """
+    return set(field[0] for field in fields if field[2] == path and field[3] == 0 and field[5] is None)
+# end def _self_references
+
+
+def _decoder_source(path, fields, local_fields, interned=False):
+    name = path.rpartition(".")[2]
+    self_references = _self_references(path, fields)
+    indent = "        " if self_references else "    "
+    lines = [
+        "def decode_{name}(array):".format(name=name),
+        "    if not array:",
+        "        return None",
+    ]
+    if interned:
+        lines.append("    if peer._peer_cache is not None:")
+        lines.append("        return peer._peer_cache.get(class_{name}, array)  # shared frozen instance".format(
+            name=name
+        ))
+    # end if
+    lines.append("    result = instance = new_{name}()".format(name=name))
+    if self_references:
+        lines.append("    todo = []  # (parent, attribute, array) of the nested ones, decoded in this loop.")
+        lines.append("    while True:")
+    # end if
+    for attribute, key, type_path, list_level, optional, constant in fields:
+        if constant is not None:
+            lines.append(indent + "instance.{attribute} = {constant!r}".format(attribute=attribute, constant=constant))
+        elif type_path in _BUILTINS:
+            lines.append(indent + "instance.{attribute} = array.get({key!r})".format(attribute=attribute, key=key))
+        elif attribute in self_references:
+            lines.append(indent + "instance.{attribute} = None".format(attribute=attribute))
+            lines.append(indent + "value = array.get({key!r})".format(key=key))
+            lines.append(indent + "if value:")
+            lines.append(indent + "    todo.append((instance, {attribute!r}, value))".format(attribute=attribute))
+        else:
+            function = "decode_" + type_path.rpartition(".")[2]
+            lines.append(indent + "value = array.get({key!r})".format(key=key))
+            lines.append(indent + "instance.{attribute} = {expression} if value is not None else None".format(
+                attribute=attribute, expression=_list_expression(function, "value", list_level)
+            ))
+        # end if
+    # end for
+    for attribute, value in local_fields.items():
+        lines.append(indent + "instance.{attribute} = {value!r}".format(attribute=attribute, value=value))
+    # end for
+    if self_references:
+        lines.extend([
+            "        if not todo:",
+            "            return result",
+            "        parent, attribute, array = todo.pop()",
+            "        instance = new_{name}()".format(name=name),
+            "        setattr(parent, attribute, instance)",
+        ])
+    else:
+        lines.append("    return result")
+    # end if
+    return "\n".join(lines)
+# end def _decoder_source
+
+
+def _encoder_source(path, fields, is_receivable, limits=None):
+    """
+    Source of the `encode_<Class>(obj)` function. The values are converted to their type, e.g. `int(obj.date)`,
+    and the fields in `limits` (see :func:`_field_limits`) are checked first.
+    """
+    name = path.rpartition(".")[2]
+    self_references = _self_references(path, fields)
+    indent = "    "
+    lines = ["def encode_{name}(obj):".format(name=name)]
+    if self_references:
+        lines.extend([
+            "    result = None",
+            "    todo = [(None, None, obj)]  # (parent array, key, object) of the nested ones, encoded in this loop.",
+            "    while todo:",
+            "        parent, key, obj = todo.pop()",
+        ])
+        indent += "    "
+    # end if
+    if is_receivable:
+        lines.append(indent + "array = obj._get_raw()  # unchanged since received")
+        lines.append(indent + "if array is None:")
+        indent += "    "
+        lines.append(indent + "array = obj._unknown_fields()  # copy on write, see Receivable.to_array")
+    else:
+        lines.append(indent + "array = {}")
+    # end if
+    for attribute, key, type_path, list_level, optional, constant in fields:
+        if constant is not None:
+            lines.append(indent + "array[{key!r}] = {constant!r}".format(key=key, constant=constant))
+            continue
+        # end if
+        if type_path in _BUILTINS and list_level == 0:
+            expression = "array[{key!r}] = {value}".format(key=key, value=_PYTHON_VALUES[type_path])
+        elif type_path in _BUILTINS:
+            expression = "array[{key!r}] = {value}".format(
+                key=key, value=_list_expression("to_" + type_path, "value", list_level)
+            )
+        elif attribute in self_references:
+            expression = "todo.append((array, {key!r}, value))".format(key=key)
+        else:
+            expression = "array[{key!r}] = {value}".format(key=key, value=_list_expression("encode", "value", list_level))
+        # end if
+        lines.append(indent + "value = obj.{attribute}".format(attribute=attribute))
+        inner = indent
+        if optional or attribute in self_references:
+            lines.append(indent + "if value is not None:")
+            inner += "    "
+        # end if
+        if attribute in (limits or {}):
+            _, field, parse_mode = limits[attribute]
+            lines.append(inner + "limit_{name}_{attribute}.check(value, {field!r}{parse_mode})".format(
+                name=name, attribute=attribute, field=field, parse_mode=", obj." + parse_mode if parse_mode else "",
+            ))
+        # end if
+        lines.append(inner + expression)
+    # end for
+    if self_references:
+        lines.extend([
+            "        if parent is None:",
+            "            result = array",
+            "        else:",
+            "            parent[key] = array",
+            "    return result",
+        ])
+    else:
+        lines.append("    return array")
+    # end if
+    return "\n".join(lines)
+# end def _encoder_source
+
+
+_PYTHON_VALUES = {  # builtin type: source code converting `value` to it, for the dicts of `encode`.
+    "str": "value if isinstance(value, text_types) else str(value)",
+    "int": "int(value)",
+    "float": "float(value)",
+    "bool": "bool(value)",
+}
+_JSON_VALUES = {  # builtin type: source code of the json of `value`, coerced like `to_array()` does.
+    "str": "string({value} if isinstance({value}, text_types) else str({value}))",
+    "int": "'%d' % int({value})",
+    "float": "json_float({value})",
+    "bool": "('true' if {value} else 'false')",
+}
+
+
+def _to_str(value):
+    """ Like :data:`_PYTHON_VALUES`, for the elements of lists. """
+    return value if isinstance(value, _TEXT_TYPES) else str(value)
+# end def _to_str
+
+
+def _json_float(value):
+    """ Json of a float. `repr` is what `json.dumps` uses too, except for `NaN` and `Infinity`. """
+    value = float(value)
+    if value - value == 0:  # not nan or infinite
+        return repr(value)
+    # end if
+    return _json_value(value)
+# end def _json_float
+
+
+def _writer_source(path, fields, received, limits=None):
+    """
+    Source of the `write_<Class>(obj, append)` function, writing the json text of the object in parts.
+
+    Fields which are always there are concatenated into one part, and the separators are known in advance,
+    except for optional fields before the first required one. Those use the `sep` variable.
+
+    Fields in `limits` (see :func:`_field_limits`) are checked before they are written,
+    with the `limit_<Class>_<attribute>` of the namespace.
+    """
+    name = path.rpartition(".")[2]
+    lines = ["def write_{name}(obj, append):".format(name=name)]
+    pending = []  # parts of the next `append`, either string literals or source expressions.
+    prefix = "{"  # before the next field, if `dynamic` is false.
+    dynamic = False  # if `sep` is needed, as an optional field might or might not have been written before.
+
+    def literal(text):
+        if pending and isinstance(pending[-1], tuple):
+            pending[-1] = (pending[-1][0] + text,)
+        else:
+            pending.append((text,))
+        # end if
+    # end def literal
+
+    def flush(indent="    "):
+        if pending:
+            lines.append(indent + "append({parts})".format(
+                parts=" + ".join(repr(part[0]) if isinstance(part, tuple) else part for part in pending)
+            ))
+        # end if
+        del pending[:]
+    # end def flush
+
+    def check(attribute, value, indent="    "):
+        if attribute in (limits or {}):
+            _, field, parse_mode = limits[attribute]
+            lines.append(indent + "limit_{name}_{attribute}.check({value}, {field!r}{parse_mode})".format(
+                name=name, attribute=attribute, value=value, field=field,
+                parse_mode=", obj." + parse_mode if parse_mode else "",
+            ))
+        # end if
+    # end def check
+
+    for attribute, key, type_path, list_level, optional, constant in fields:
+        key_json = json.dumps(key) + ":"
+        value = "obj." + attribute if not optional else "value"
+        if constant is not None:
+            value_parts, nested = [(json.dumps(constant),)], None
+        elif type_path in _BUILTINS and list_level == 0:
+            value_parts, nested = [_JSON_VALUES[type_path].format(value=value)], None
+        elif type_path in _BUILTINS:
+            value_parts, nested = ["json({value})".format(value=value)], None
+        else:
+            if type_path in SCHEMA and type_path not in received:
+                function = "write_" + type_path.rpartition(".")[2]
+            else:
+                function = "write"  # looks up the class, e.g. for the subclasses of the abstract InputMessageContent
+            # end if
+            value_parts = []
+            if list_level == 0:
+                nested = "{function}({value}, append)".format(function=function, value=value)
+            else:
+                nested = "write_list({value}, {function}, append, {level})".format(
+                    value=value, function=function, level=list_level
+                )
+            # end if
+        # end if
+        if optional and constant is None:
+            flush()
+            if not dynamic and prefix == "{":
+                lines.append("    sep = '{'  # becomes ',' after the first field")
+                dynamic = True
+            # end if
+            lines.append("    value = obj.{attribute}".format(attribute=attribute))
+            lines.append("    if value is not None:")
+            check(attribute, value, "        ")
+            if dynamic:
+                pending.append("sep")
+                literal(key_json)
+            else:
+                literal(prefix + key_json)
+            # end if
+            pending.extend(value_parts)
+            flush("        ")
+            if nested:
+                lines.append("        " + nested)
+            # end if
+            if dynamic:
+                lines.append("        sep = ','")
+            # end if
+        else:
+            check(attribute, value)  # runs before the pending parts are appended, which doesn't matter.
+            if dynamic:
+                pending.append("sep")
+                literal(key_json)
+                dynamic = False
+            else:
+                literal(prefix + key_json)
+            # end if
+            for part in value_parts:
+                if isinstance(part, tuple):
+                    literal(part[0])
+                else:
+                    pending.append(part)
+                # end if
+            # end for
+            if nested:
+                flush()
+                lines.append("    " + nested)
+            # end if
+            prefix = ","
+        # end if
+    # end for
+    if dynamic:
+        flush()
+        lines.append("    append('}' if sep == ',' else '{}')")
+    elif prefix == "{":
+        literal("{}")  # no fields at all
+        flush()
+    else:
+        literal("}")
+        flush()
+    # end if
+    return "\n".join(lines)
+# end def _writer_source
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Limits of the telegram api, checked before sending, while the values are serialized anyway.
+
+Telegram answers a request outside of those limits with an error, after a full round trip. Here it raises a
+:class:`pytgbot.exceptions.TgApiLimitException` right away, saying which value is how much too long::
+
+    TgApiLimitException: InlineKeyboardButton.callback_data is 71 bytes, but must be 1-64 bytes: 'vote:...'
+
+The checks run in `to_array()` (and the json writers of :mod:`pytgbot.api_types.engine`) of the classes in
+:data:`FIELD_LIMITS`, and in the :class:`pytgbot.bot.Bot` methods for their parameters.
+"""
+import re
+
+from luckydonaldUtils.logger import logging
+
+from ..exceptions import TgApiLimitException
+
+__author__ = 'luckydonald'
+__all__ = [
+    "Limit", "CHARACTERS", "BYTES", "ITEMS", "FIELD_LIMITS",
+    "MESSAGE_TEXT", "CALLBACK_DATA", "INLINE_QUERY_RESULTS", "INLINE_QUERY_RESULT_ID", "INLINE_QUERY_NEXT_OFFSET",
+    "SWITCH_PM_PARAMETER", "without_markup",
+]
+logger = logging.getLogger(__name__)
+
+
+CHARACTERS = "characters"  # as telegram counts them: UTF-16 code units, so most emoji count 2.
+BYTES = "bytes"  # of the UTF-8 encoding
+ITEMS = "items"  # of a list
+
+
+class Limit(object):
+    """
+    The allowed size of a value.
+    """
+    __slots__ = ["minimum", "maximum", "unit"]
+
+    def __init__(self, minimum, maximum, unit):
+        """
+        :param minimum: The smallest allowed size.
+        :type  minimum: int
+
+        :param maximum: The biggest allowed size.
+        :type  maximum: int
+
+        :param unit: How the size is measured: :data:`CHARACTERS`, :data:`BYTES` or :data:`ITEMS`.
+        :type  unit: str
+        """
+        super(Limit, self).__init__()
+        self.minimum = minimum
+        self.maximum = maximum
+        self.unit = unit
+    # end def __init__
+
+    def size(self, value, parse_mode=None):
+        """
+        The size of the value, in the unit of this limit.
+
+        :param value: A text or a list.
+
+        :keyword parse_mode: For texts with "html" or "markdown" markup: telegram counts the text without the markup.
+                             To never reject a valid text, everything which could be markup isn't counted.
+        :type    parse_mode: str
+
+        :rtype: int
+        """
+        if self.unit == ITEMS:
+            return len(value)
+        # end if
+        if parse_mode:
+            value = without_markup(value, parse_mode)
+        # end if
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")  # python 2 str
+        # end if
+        if self.unit == BYTES:
+            return len(value.encode("utf-8"))
+        # end if
+        return len(value.encode("utf-16-le")) // 2
+    # end def size
+
+    def check(self, value, field, parse_mode=None):
+        """
+        Raises, if the value is outside of this limit.
+
+        :param value: A text or a list.
+
+        :param field: Name of the value for the error, e.g. `"InlineKeyboardButton.callback_data"`.
+        :type  field: str
+
+        :keyword parse_mode: See :meth:`size`.
+        :type    parse_mode: str
+
+        :raises pytgbot.exceptions.TgApiLimitException: The value is too short or too long.
+        """
+        length = len(value)
+        if self.minimum <= length and length * 4 <= self.maximum:
+            return  # short enough no matter the encoding, the usual case.
+        # end if
+        size = self.size(value, parse_mode)
+        if self.minimum <= size <= self.maximum:
+            return
+        # end if
+        preview = value if self.unit == ITEMS else value[:40] + (u"..." if len(value) > 40 else u"")
+        raise TgApiLimitException(
+            "{field} is {size} {unit}, but must be {limit}: {preview!r}".format(
+                field=field, size=size, unit=self.unit, limit=self, preview=preview,
+            ) if self.unit != ITEMS else "{field} has {size} {unit}, but must have {limit}.".format(
+                field=field, size=size, unit=self.unit, limit=self,
+            ),
+            field=field, value=value, size=size, limit=self,
+        )
+    # end def check
+
+    def __str__(self):
+        """
+        Implements `str(limit_instance)`, e.g. `"1-64 bytes"`.
+        """
+        return "{self.minimum}-{self.maximum} {self.unit}".format(self=self)
+    # end def __str__
+
+    def __repr__(self):
+        return "Limit(minimum={self.minimum!r}, maximum={self.maximum!r}, unit={self.unit!r})".format(self=self)
+    # end def __repr__
+# end class Limit
+
+
+MESSAGE_TEXT = Limit(1, 4096, CHARACTERS)  # after the markup is parsed
+CALLBACK_DATA = Limit(1, 64, BYTES)
+INLINE_QUERY_RESULTS = Limit(0, 50, ITEMS)
+INLINE_QUERY_RESULT_ID = Limit(1, 64, BYTES)
+INLINE_QUERY_NEXT_OFFSET = Limit(0, 64, BYTES)
+SWITCH_PM_PARAMETER = Limit(1, 64, CHARACTERS)  # only A-Z, a-z, 0-9, _ and -
+
+FIELD_LIMITS = {  # "Class.attribute": (limit, attribute with the parse_mode or None). Subclasses included.
+    "InlineKeyboardButton.callback_data": (CALLBACK_DATA, None),
+    "InlineQueryResult.id": (INLINE_QUERY_RESULT_ID, None),
+    "InputTextMessageContent.message_text": (MESSAGE_TEXT, "parse_mode"),
+}
+
+_HTML_TAG = re.compile(r"<[^>]*>")
+_HTML_ENTITY = re.compile(r"&#?\w+;")
+_MARKDOWN = re.compile(r"\]\([^)]*\)|[*_`\[\]]")  # the link targets, and the formatting characters.
+
+
+def without_markup(text, parse_mode):
+    """
+    The text, without anything which could be html or markdown markup.
+    At most as long as the text telegram shows, as it is used to never reject valid texts.
+
+    :param text: The text, with markup.
+    :type  text: str
+
+    :param parse_mode: "html" or "markdown", in any case.
+    :type  parse_mode: str
+
+    :rtype: str
+    """
+    parse_mode = parse_mode.lower()
+    if parse_mode == "html":
+        return _HTML_ENTITY.sub("&", _HTML_TAG.sub("", text))
+    elif parse_mode == "markdown":
+        return _MARKDOWN.sub("", text)
+    # end if
+    return text  # telegram rejects unknown ones itself.
+# end def without_markup
@@ -1,21 +1,252 @@
 # -*- coding: utf-8 -*-
+from luckydonaldUtils.encoding import unicode_type
 from luckydonaldUtils.logger import logging
 
-from pytgbot.api_types import TgBotApiObject
+from pytgbot.api_types import TgBotApiObject, Frozen
+from pytgbot.api_types.engine import decode, encode
 
 __author__ = 'luckydonald'
-__all__ = ["inline", "media", "peer", "responses", "updates", "Receivable", "Result"]
+__all__ = ["inline", "lazy", "media", "peer", "responses", "updates", "Receivable", "Result"]
 logger = logging.getLogger(__name__)
 
 
 class Receivable(TgBotApiObject):
-    pass
+    """
+    Base class of all the types telegram sends us.
+
+    If created with :meth:`from_array_keep_raw`, the object keeps a reference to the received dict,
+    and :meth:`to_array` returns that very dict instead of building a new one, as long as the object
+    (and the objects in it) wasn't changed. After a change :meth:`to_array` builds a new dict (copy on write):
+    the fields unknown to the class are copied from the received dict, the known ones are written as usual.
+    The received dict is never modified.
+    """
+    __slots__ = ["_raw"]
+
+    def __init__(self):
+        super(Receivable, self).__init__()
+        self._raw = None  # the received dict, see from_array_keep_raw(...). A _Changed after setting a field.
+    # end def __init__
+
+    def to_array(self):
+        """
+        The fields unknown to this class, if it was received (see :meth:`from_array_keep_raw`).
+        The subclasses in the schema add their fields in :func:`pytgbot.api_types.engine.encode`, which does the same.
+
+        :rtype: dict
+        """
+        array = super(Receivable, self).to_array()
+        if self._raw is not None:
+            array.update(self._unknown_fields())
+        # end if
+        return array
+    # end def to_array
+
+    def _unknown_fields(self):
+        """
+        :return: A new dict, with the fields of the received dict this class doesn't know. Empty if not received.
+        :rtype: dict
+        """
+        raw = self._raw
+        if raw is None:
+            return {}
+        # end if
+        if isinstance(raw, _Changed):
+            raw = raw.raw
+        # end if
+        names = _raw_names(self.__class__)
+        return dict((key, value) for key, value in raw.items() if key not in names)
+    # end def _unknown_fields
+
+    @classmethod
+    def _new_trusted(cls):
+        instance = cls.__new__(cls)
+        instance._raw = None
+        return instance
+    # end def _new_trusted
+
+    @classmethod
+    def from_array_keep_raw(cls, array):
+        """
+        Like :meth:`from_array`, but the new object (and all the objects in it) keep a reference to the `array`,
+        so :meth:`to_array` can return it as is.
+
+        :param array: The received dictionary.
+        :type  array: dict
+
+        :return: new instance, or `None` if the array is empty.
+        """
+        instance = cls.from_array(array)
+        _keep_raw(instance, array)
+        return instance
+    # end def from_array_keep_raw
+
+    def _get_raw(self):
+        """
+        The received dict, if this object (and the objects in it) wasn't changed since.
+
+        :return: The dict this object was created from, or `None`.
+        :rtype: dict | None
+        """
+        raw = self._raw
+        if raw is None or isinstance(raw, _Changed) or not _is_unchanged(self, raw):
+            return None
+        # end if
+        return raw
+    # end def _get_raw
+
+    def _raw_fields(self, raw):
+        """
+        The fields which could have been changed on their own: the objects and lists in it.
+
+        :param raw: The received dict, `self._raw`.
+        :type  raw: dict
+
+        :return: `(value, received value)` of those fields.
+        :rtype: list of tuple
+        """
+        names = _raw_names(self.__class__)
+        return [
+            (getattr(self, names[key]), raw_value) for key, raw_value in raw.items()
+            if isinstance(raw_value, (dict, list)) and key in names
+        ]
+    # end def _raw_fields
 # end class Receivable
 
 
+class KeepsRaw(object):
+    """
+    Mixin for :class:`Receivable` s keeping the received dict: Setting any field marks it as changed.
+    It is still kept, for the fields unknown to the class.
+
+    Only those objects get this `__setattr__`, so normal objects don't pay for it.
+    """
+    __slots__ = []
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_raw":
+            raw = self._raw
+            if raw is not None and not isinstance(raw, _Changed):
+                object.__setattr__(self, "_raw", _Changed(raw))
+            # end if
+        # end if
+    # end def __setattr__
+# end class KeepsRaw
+
+
+class _Changed(object):
+    """ The `_raw` of a :class:`KeepsRaw` changed since received: can't be returned as is anymore. """
+    __slots__ = ["raw"]
+
+    def __init__(self, raw):
+        self.raw = raw  # the received dict
+    # end def __init__
+# end class _Changed
+
+
+_RAW_KEYS = {"from_peer": "from"}  # python attribute: json key, where they differ.
+_raw_names_cache = {}  # class: {json key: attribute}
+_keeps_raw_classes = {}  # class: subclass with KeepsRaw
+
+
+def _raw_names(clazz):
+    """
+    :return: the attribute names of all fields of the class, by json key.
+    :rtype: dict
+    """
+    names = _raw_names_cache.get(clazz)
+    if names is None:
+        names = {}
+        for klass in clazz.__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if not name.startswith("_"):
+                    names[_RAW_KEYS.get(name, name)] = name
+                # end if
+            # end for
+        # end for
+        _raw_names_cache[clazz] = names
+    # end if
+    return names
+# end def _raw_names
+
+
+def _keeps_raw_class(clazz):
+    """ The subclass of `clazz` with :class:`KeepsRaw`, an instance can be switched to. """
+    if issubclass(clazz, KeepsRaw):
+        return clazz
+    # end if
+    subclass = _keeps_raw_classes.get(clazz)
+    if subclass is None:
+        subclass = _keeps_raw_classes[clazz] = type(clazz.__name__, (KeepsRaw, clazz), {
+            "__slots__": [], "__module__": clazz.__module__,
+        })
+    # end if
+    return subclass
+# end def _keeps_raw_class
+
+
+def _keep_raw(value, raw):
+    """
+    Stores the received dicts in the :class:`Receivable` objects of `value`, and in the ones in those.
+    Uses a stack instead of recursing, so long `reply_to_message` chains don't hit the recursion limit.
+    """
+    todo = [(value, raw)]
+    while todo:
+        value, raw = todo.pop()
+        if isinstance(value, Receivable):
+            if not isinstance(raw, dict) or value._raw is raw:
+                continue  # lazy objects already have it, and don't need to decode everything now.
+            # end if
+            if isinstance(value, Frozen):
+                continue  # can't, and might be shared (see peer.intern_peers)
+            # end if
+            value.__class__ = _keeps_raw_class(value.__class__)
+            value._raw = raw
+            names = _raw_names(value.__class__)
+            for key, child in raw.items():
+                if isinstance(child, (dict, list)) and key in names:
+                    todo.append((getattr(value, names[key]), child))
+                # end if
+            # end for
+        elif isinstance(value, list) and isinstance(raw, list):
+            todo.extend(zip(value, raw))
+        # end if
+    # end while
+# end def _keep_raw
+
+
+def _is_unchanged(value, raw):
+    """
+    If the field `value` still represents the received json list or dict `raw`, including everything in it.
+    Uses a stack instead of recursing, like :func:`_keep_raw`.
+    """
+    todo = [(value, raw)]
+    while todo:
+        value, raw = todo.pop()
+        if value is raw:
+            continue  # lists json already had the right type for.
+        # end if
+        if isinstance(value, Receivable):
+            if value._raw is raw:
+                todo.extend(value._raw_fields(raw))
+            elif not isinstance(value, Frozen) or value.to_array() != raw:
+                return False  # frozen ones don't keep it, but can't be changed either.
+            # end if
+        elif isinstance(value, list) and isinstance(raw, list) and len(value) == len(raw):
+            todo.extend(zip(value, raw))
+        else:
+            return False
+        # end if
+    # end while
+    return True
+# end def _is_unchanged
+
+
 class Result(Receivable):
+    __slots__ = []
+
     def to_array(self):
-        return {}
+        return super(Result, self).to_array()  # the unknown fields of a received one
     pass
 # end class Result
 
@@ -26,6 +257,7 @@ class WebhookInfo(Receivable):
 
     https://core.telegram.org/bots/api#webhookinfo
     """
+    __slots__ = ["url", "has_custom_certificate", "pending_update_count", "last_error_date", "last_error_message", "max_connections", "allowed_updates"]
 
     def __init__(self, url, has_custom_certificate, pending_update_count, last_error_date=None,
                  last_error_message=None, max_connections=None, allowed_updates=None):
@@ -63,7 +295,7 @@ class WebhookInfo(Receivable):
         """
         super(WebhookInfo, self).__init__()
         assert (url is not None)
-        assert (isinstance(url, str))
+        assert (isinstance(url, unicode_type))
         self.url = url
 
         assert (has_custom_certificate is not None)
@@ -77,7 +309,7 @@ class WebhookInfo(Receivable):
         assert (last_error_date is None or isinstance(last_error_date, int))
         self.last_error_date = last_error_date
 
-        assert (last_error_message is None or isinstance(last_error_message, str))
+        assert (last_error_message is None or isinstance(last_error_message, unicode_type))
         self.last_error_message = last_error_message
 
         assert (max_connections is None or isinstance(max_connections, int))
@@ -94,20 +326,7 @@ class WebhookInfo(Receivable):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(WebhookInfo, self).to_array()
-        array['url'] = str(self.url)  # type str
-        array['has_custom_certificate'] = bool(self.has_custom_certificate)  # type bool
-        array['pending_update_count'] = int(self.pending_update_count)  # type int
-        if self.last_error_date is not None:
-            array['last_error_date'] = int(self.last_error_date)  # type int
-        if self.last_error_message is not None:
-            array['last_error_message'] = str(self.last_error_message)  # type str
-        if self.max_connections is not None:
-            array['max_connections'] = int(self.max_connections)  # type int
-        if self.allowed_updates is not None:
-            array['allowed_updates'] = self._as_array(self.allowed_updates)  # type list of str
-        return array
-
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -121,24 +340,8 @@ class WebhookInfo(Receivable):
         if array is None or not array:
             return None
         # end if
-        assert (isinstance(array, dict))
-
-        data = {}
-        data['url'] = str(array.get('url'))
-        data['has_custom_certificate'] = bool(array.get('has_custom_certificate'))
-        data['pending_update_count'] = int(array.get('pending_update_count'))
-        data['last_error_date'] = int(array.get('last_error_date')) if array.get(
-            'last_error_date') is not None else None
-        data['last_error_message'] = str(array.get('last_error_message')) if array.get(
-            'last_error_message') is not None else None
-        data['max_connections'] = int(array.get('max_connections')) if array.get(
-            'max_connections') is not None else None
-        data['allowed_updates'] = (
-            WebhookInfo._builtin_from_array_list(
-                required_type=str, value=array.get('allowed_updates'), list_level=1
-            )
-        ) if array.get('allowed_updates') is not None else None
-        return WebhookInfo(**data)
+        assert(isinstance(array, dict))
+        return decode(WebhookInfo, array)
     # end def from_array
 
     def __str__(self):
@@ -155,3 +358,6 @@ class WebhookInfo(Receivable):
         return key in ["url", "has_custom_certificate", "pending_update_count", "last_error_date", "last_error_message", "max_connections", "allowed_updates"]
         # end def __contains__
 # end class WebhookInfo
+
+
+from . import updates  # bottom of file, so updates.py and inline.py are always imported in that order.
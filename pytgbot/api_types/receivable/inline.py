@@ -2,7 +2,10 @@
 from luckydonaldUtils.encoding import unicode_type
 from luckydonaldUtils.logger import logging
 
+from ..engine import decode, encode
 from ..receivable import Result
+from ..receivable.media import Location
+from ..receivable.peer import User
 from ..receivable.updates import UpdateType
 
 __author__ = 'luckydonald'
@@ -15,13 +18,14 @@ class InlineQuery(Result):
 
     https://core.telegram.org/bots/api#inlinequery
     """
+    __slots__ = ["id", "from_peer", "query", "offset", "location"]
+
     def __init__(self, id, from_peer, query, offset, location=None):
         """
         This object represents an incoming inline query. When the user sends an empty query, your bot could return some default or trending results.
 
         https://core.telegram.org/bots/api#inlinequery
 
-
         Parameters:
 
         :param id: Unique identifier for this query
@@ -36,18 +40,15 @@ class InlineQuery(Result):
         :param offset: Offset of the results to be returned, can be controlled by the bot
         :type  offset: str
 
-
         Optional keyword parameters:
 
         :keyword location: Optional. Sender location, only for bots that request user location
         :type    location: pytgbot.api_types.receivable.media.Location
         """
         super(InlineQuery, self).__init__()
-        from pytgbot.api_types.receivable.media import Location
-        from pytgbot.api_types.receivable.peer import User
 
         assert(id is not None)
-        assert(isinstance(id, str))
+        assert(isinstance(id, unicode_type))
         self.id = id
 
         assert(from_peer is not None)
@@ -55,11 +56,11 @@ class InlineQuery(Result):
         self.from_peer = from_peer
 
         assert(query is not None)
-        assert(isinstance(query, str))
+        assert(isinstance(query, unicode_type))
         self.query = query
 
         assert(offset is not None)
-        assert(isinstance(offset, str))
+        assert(isinstance(offset, unicode_type))
         self.offset = offset
 
         assert(location is None or isinstance(location, Location))
@@ -73,14 +74,7 @@ class InlineQuery(Result):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQuery, self).to_array()
-        array['id'] = str(self.id)  # type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['query'] = str(self.query)  # type str
-        array['offset'] = str(self.offset)  # type str
-        if self.location is not None:
-            array['location'] = self.location.to_array()  # type Location
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -95,18 +89,7 @@ class InlineQuery(Result):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.receivable.media import Location
-        from pytgbot.api_types.receivable.peer import User
-
-        data = {}
-
-        data['id'] = str(array.get('id'))
-        data['from_peer'] = User.from_array(array.get('from'))
-        data['query'] = str(array.get('query'))
-        data['offset'] = str(array.get('offset'))
-        data['location'] = Location.from_array(array.get('location')) if array.get('location') is not None else None
-        return InlineQuery(**data)
+        return decode(InlineQuery, array)
     # end def from_array
 
     def __str__(self):
@@ -131,13 +114,14 @@ class ChosenInlineResult(UpdateType):
 
     https://core.telegram.org/bots/api#choseninlineresult
     """
+    __slots__ = ["result_id", "from_peer", "query", "location", "inline_message_id"]
+
     def __init__(self, result_id, from_peer, query, location=None, inline_message_id=None):
         """
         Represents a result of an inline query that was chosen by the user and sent to their chat partner.
 
         https://core.telegram.org/bots/api#choseninlineresult
 
-
         Parameters:
 
         :param result_id: The unique identifier for the result that was chosen
@@ -149,7 +133,6 @@ class ChosenInlineResult(UpdateType):
         :param query: The query that was used to obtain the result
         :type  query: str
 
-
         Optional keyword parameters:
 
         :keyword location: Optional. Sender location, only for bots that require user location
@@ -160,11 +143,8 @@ class ChosenInlineResult(UpdateType):
         """
         super(ChosenInlineResult, self).__init__()
 
-        from ..receivable.peer import User
-        from ..receivable.media import Location
-
         assert(result_id is not None)
-        assert(isinstance(result_id, str))
+        assert(isinstance(result_id, unicode_type))
         self.result_id = result_id
 
         assert(from_peer is not None)
@@ -172,13 +152,13 @@ class ChosenInlineResult(UpdateType):
         self.from_peer = from_peer
 
         assert(query is not None)
-        assert(isinstance(query, str))
+        assert(isinstance(query, unicode_type))
         self.query = query
 
         assert(location is None or isinstance(location, Location))
         self.location = location
 
-        assert(inline_message_id is None or isinstance(inline_message_id, str))
+        assert(inline_message_id is None or isinstance(inline_message_id, unicode_type))
         self.inline_message_id = inline_message_id
     # end def __init__
 
@@ -189,15 +169,7 @@ class ChosenInlineResult(UpdateType):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(ChosenInlineResult, self).to_array()
-        array['result_id'] = str(self.result_id)  # type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['query'] = str(self.query)  # type str
-        if self.location is not None:
-            array['location'] = self.location.to_array()  # type Location
-        if self.inline_message_id is not None:
-            array['inline_message_id'] = str(self.inline_message_id)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -212,17 +184,7 @@ class ChosenInlineResult(UpdateType):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from ..receivable.peer import User
-        from ..receivable.media import Location
-
-        data = {}
-        data['result_id'] = str(array.get('result_id'))
-        data['from_peer'] = User.from_array(array.get('from'))
-        data['query'] = str(array.get('query'))
-        data['location'] = Location.from_array(array.get('location')) if array.get('location') is not None else None
-        data['inline_message_id'] = str(array.get('inline_message_id')) if array.get('inline_message_id') is not None else None
-        return ChosenInlineResult(**data)
+        return decode(ChosenInlineResult, array)
     # end def from_array
 
     def __str__(self):
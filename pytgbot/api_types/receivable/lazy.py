@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Lazy variants of :class:`Update`, :class:`Message` and :class:`CallbackQuery`.
+
+They keep the received dict, and only build the nested objects (`chat`, `from_peer`, `reply_to_message`, `entities`,
+`photo`, ...) on the first access of that attribute. The result is stored in the slot, so the next access is a normal
+attribute lookup.
+
+They are subclasses of the api classes, so code reading attributes can't tell the difference::
+
+    updates = LazyUpdate.from_array_list(result, list_level=1)
+    for update in updates:
+        if update.message and update.message.text == "/start":  # doesn't parse the chat, photos, replies, ...
+            bot.send_message(update.message.chat.id, "Hello!")
+        # end if
+    # end for
+"""
+from luckydonaldUtils.logger import logging
+
+from . import KeepsRaw, _keep_raw, _raw_names
+from .. import _pickled_class
+from .inline import InlineQuery, ChosenInlineResult
+from .media import Audio, Contact, Document, Game, Location, MessageEntity, PhotoSize, Sticker, Venue, Video, Voice
+from .peer import User, Chat
+from .updates import Update, Message, CallbackQuery
+
+__author__ = 'luckydonald'
+__all__ = ["LazyUpdate", "LazyMessage", "LazyCallbackQuery"]
+logger = logging.getLogger(__name__)
+
+
+class LazyReceivable(KeepsRaw):
+    """
+    Decodes the fields listed in `_lazy_fields` from the `_raw` dict on first access.
+
+    Subclasses need `_lazy_fields` with `{attribute: (json key, decode function or None)}`.
+    `None` means the json value is used as is.
+
+    The received dict is kept, so :meth:`to_array` returns it unless a field was changed,
+    like with :meth:`Receivable.from_array_keep_raw`.
+    """
+    __slots__ = []
+    _lazy_fields = {}
+
+    def __getattr__(self, name):
+        # only called if the slot isn't set yet.
+        try:
+            key, decode = self._lazy_fields[name]
+        except KeyError:
+            raise AttributeError("{cls!r} object has no attribute {name!r}".format(
+                cls=self.__class__.__name__, name=name
+            ))
+        # end try
+        raw = self._raw.get(key)
+        value = raw
+        if raw is not None and decode is not None:
+            value = decode(raw)
+            _keep_raw(value, raw)
+        # end if
+        object.__setattr__(self, name, value)  # not forgetting _raw, as it isn't a change.
+        return value
+    # end def __getattr__
+
+    def __setattr__(self, name, value):
+        if name != "_raw" and isinstance(self._raw, dict):
+            # the received dict can't be decoded from anymore, so everything has to be decoded now.
+            for field in self._lazy_fields:
+                getattr(self, field)
+            # end for
+        # end if
+        super(LazyReceivable, self).__setattr__(name, value)
+    # end def __setattr__
+
+    def _raw_fields(self, raw):
+        """
+        Like :meth:`Receivable._raw_fields`, but fields never accessed are unchanged without decoding them first.
+        """
+        names = _raw_names(self.__class__)
+        fields = []
+        for key, raw_value in raw.items():
+            if isinstance(raw_value, (dict, list)) and key in names:
+                try:
+                    value = object.__getattribute__(self, names[key])  # doesn't call __getattr__
+                except AttributeError:
+                    continue  # still not decoded
+                # end try
+                fields.append((value, raw_value))
+            # end if
+        # end for
+        return fields
+    # end def _raw_fields
+
+    @classmethod
+    def from_array(cls, array, fields=None):
+        """
+        Wraps the given dictionary, without decoding anything yet.
+
+        :keyword fields: Only for the classes whose `from_array` has it, like :meth:`Update.from_array`.
+                         Returns that projection instead, which only decodes the given fields, and isn't lazy.
+        :type    fields: list of str
+
+        :return: new lazy instance, or `None` if the array is empty.
+        """
+        if fields is not None:
+            return _pickled_class(cls).from_array(array, fields=fields)
+        # end if
+        if array is None or not array:
+            return None
+        # end if
+        assert(isinstance(array, dict))
+        instance = cls.__new__(cls)
+        instance._raw = array
+        return instance
+    # end def from_array
+
+    @classmethod
+    def from_array_keep_raw(cls, array):
+        """ Same as :meth:`from_array`, the lazy objects always keep the received dict. """
+        return cls.from_array(array)
+    # end def from_array_keep_raw
+# end class LazyReceivable
+
+
+class LazyMessage(LazyReceivable, Message):
+    """
+    A :class:`Message`, decoding its fields on first access.
+    """
+    __slots__ = []
+# end class LazyMessage
+
+
+class LazyCallbackQuery(LazyReceivable, CallbackQuery):
+    """
+    A :class:`CallbackQuery`, decoding its fields on first access.
+    The message in it is a :class:`LazyMessage`.
+    """
+    __slots__ = []
+# end class LazyCallbackQuery
+
+
+class LazyUpdate(LazyReceivable, Update):
+    """
+    An :class:`Update`, decoding its fields on first access.
+    The messages in it are :class:`LazyMessage` s, the callback query a :class:`LazyCallbackQuery`.
+    """
+    __slots__ = []
+# end class LazyUpdate
+
+
+def _list_of(clazz):
+    def decode(value):
+        return clazz.from_array_list(value, list_level=1)
+    # end def decode
+    return decode
+# end def _list_of
+
+
+LazyMessage._lazy_fields = {
+    "message_id": ("message_id", None),
+    "date": ("date", None),
+    "chat": ("chat", Chat.from_array),
+    "from_peer": ("from", User.from_array),
+    "forward_from": ("forward_from", User.from_array),
+    "forward_from_chat": ("forward_from_chat", Chat.from_array),
+    "forward_from_message_id": ("forward_from_message_id", None),
+    "forward_date": ("forward_date", None),
+    "reply_to_message": ("reply_to_message", LazyMessage.from_array),
+    "edit_date": ("edit_date", None),
+    "text": ("text", None),
+    "entities": ("entities", _list_of(MessageEntity)),
+    "audio": ("audio", Audio.from_array),
+    "document": ("document", Document.from_array),
+    "game": ("game", Game.from_array),
+    "photo": ("photo", _list_of(PhotoSize)),
+    "sticker": ("sticker", Sticker.from_array),
+    "video": ("video", Video.from_array),
+    "voice": ("voice", Voice.from_array),
+    "caption": ("caption", None),
+    "contact": ("contact", Contact.from_array),
+    "location": ("location", Location.from_array),
+    "venue": ("venue", Venue.from_array),
+    "new_chat_member": ("new_chat_member", User.from_array),
+    "left_chat_member": ("left_chat_member", User.from_array),
+    "new_chat_title": ("new_chat_title", None),
+    "new_chat_photo": ("new_chat_photo", _list_of(PhotoSize)),
+    "delete_chat_photo": ("delete_chat_photo", None),
+    "group_chat_created": ("group_chat_created", None),
+    "supergroup_chat_created": ("supergroup_chat_created", None),
+    "channel_chat_created": ("channel_chat_created", None),
+    "migrate_to_chat_id": ("migrate_to_chat_id", None),
+    "migrate_from_chat_id": ("migrate_from_chat_id", None),
+    "pinned_message": ("pinned_message", LazyMessage.from_array),
+}
+
+LazyCallbackQuery._lazy_fields = {
+    "id": ("id", None),
+    "from_peer": ("from", User.from_array),
+    "chat_instance": ("chat_instance", None),
+    "message": ("message", LazyMessage.from_array),
+    "inline_message_id": ("inline_message_id", None),
+    "data": ("data", None),
+    "game_short_name": ("game_short_name", None),
+}
+
+LazyUpdate._lazy_fields = {
+    "update_id": ("update_id", None),
+    "message": ("message", LazyMessage.from_array),
+    "edited_message": ("edited_message", LazyMessage.from_array),
+    "channel_post": ("channel_post", LazyMessage.from_array),
+    "edited_channel_post": ("edited_channel_post", LazyMessage.from_array),
+    "inline_query": ("inline_query", InlineQuery.from_array),
+    "chosen_inline_result": ("chosen_inline_result", ChosenInlineResult.from_array),
+    "callback_query": ("callback_query", LazyCallbackQuery.from_array),
+}
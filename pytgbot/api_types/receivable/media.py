@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 __all__ = ["Media", "PhotoSize", "Audio", "MessageEntity"]
 
+from luckydonaldUtils.encoding import unicode_type
+
 from . import Receivable, Result
+from ..engine import decode, encode
+from .peer import User
 
 
 class Media(Receivable):
-    pass
+    __slots__ = []
 
 
 class MessageEntity(Result):
@@ -14,13 +18,14 @@ class MessageEntity(Result):
 
     https://core.telegram.org/bots/api#messageentity
     """
+    __slots__ = ["type", "offset", "length", "url", "user"]
+
     def __init__(self, type, offset, length, url=None, user=None):
         """
         This object represents one special entity in a text message. For example, hashtags, usernames, URLs, etc.
 
         https://core.telegram.org/bots/api#messageentity
 
-
         Parameters:
 
         :param type: Type of the entity. Can be mention (@username), hashtag, bot_command, url, email, bold (bold text), italic (italic text), code (monowidth string), pre (monowidth block), text_link (for clickable text URLs), text_mention (for users without usernames)
@@ -32,7 +37,6 @@ class MessageEntity(Result):
         :param length: Length of the entity in UTF-16 code units
         :type  length: int
 
-
         Optional keyword parameters:
 
         :keyword url: Optional. For “text_link” only, url that will be opened after user taps on the text
@@ -42,10 +46,9 @@ class MessageEntity(Result):
         :type    user: pytgbot.api_types.receivable.peer.User
         """
         super(MessageEntity, self).__init__()
-        from pytgbot.api_types.receivable.peer import User
 
         assert(type is not None)
-        assert(isinstance(type, str))
+        assert(isinstance(type, unicode_type))
         self.type = type
 
         assert(offset is not None)
@@ -56,7 +59,7 @@ class MessageEntity(Result):
         assert(isinstance(length, int))
         self.length = length
 
-        assert(url is None or isinstance(url, str))
+        assert(url is None or isinstance(url, unicode_type))
         self.url = url
 
         assert(user is None or isinstance(user, User))
@@ -70,15 +73,7 @@ class MessageEntity(Result):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(MessageEntity, self).to_array()
-        array['type'] = str(self.type)  # type str
-        array['offset'] = int(self.offset)  # type int
-        array['length'] = int(self.length)  # type int
-        if self.url is not None:
-            array['url'] = str(self.url)  # type str
-        if self.user is not None:
-            array['user'] = self.user.to_array()  # type User
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -93,16 +88,7 @@ class MessageEntity(Result):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.receivable.peer import User
-
-        data = {}
-        data['type'] = str(array.get('type'))
-        data['offset'] = int(array.get('offset'))
-        data['length'] = int(array.get('length'))
-        data['url'] = str(array.get('url')) if array.get('url') is not None else None
-        data['user'] = User.from_array(array.get('user')) if array.get('user') is not None else None
-        return MessageEntity(**data)
+        return decode(MessageEntity, array)
     # end def from_array
 
     def __str__(self):
@@ -122,9 +108,19 @@ class MessageEntity(Result):
         """
         return key in ["type", "offset", "length", "url", "user"]
     # end def __contains__
+
+    def __hash__(self):
+        """
+        Implements `hash(messageentity_instance)`, from the fields, like `==` compares them.
+        Don't change the fields while it's used in a set or as dict key. Frozen copies hash the same, cached.
+        """
+        return hash((MessageEntity, self.type, self.offset, self.length, self.url, self.user))
+    # end def __hash__
 # end class MessageEntity
 
 class DownloadableMedia(Media):
+    __slots__ = []
+
     @staticmethod
     def from_array(array):
         """
@@ -146,13 +142,14 @@ class PhotoSize(Result):
 
     https://core.telegram.org/bots/api#photosize
     """
+    __slots__ = ["file_id", "width", "height", "file_size"]
+
     def __init__(self, file_id, width, height, file_size=None):
         """
         This object represents one size of a photo or a file / sticker thumbnail.
 
         https://core.telegram.org/bots/api#photosize
 
-
         Parameters:
 
         :param file_id: Unique identifier for this file
@@ -164,7 +161,6 @@ class PhotoSize(Result):
         :param height: Photo height
         :type  height: int
 
-
         Optional keyword parameters:
 
         :keyword file_size: Optional. File size
@@ -172,7 +168,7 @@ class PhotoSize(Result):
         """
         super(PhotoSize, self).__init__()
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(width is not None)
@@ -194,13 +190,7 @@ class PhotoSize(Result):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(PhotoSize, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        array['width'] = int(self.width)  # type int
-        array['height'] = int(self.height)  # type int
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -215,13 +205,7 @@ class PhotoSize(Result):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['width'] = int(array.get('width'))
-        data['height'] = int(array.get('height'))
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        return PhotoSize(**data)
+        return decode(PhotoSize, array)
     # end def from_array
 
     def __str__(self):
@@ -237,6 +221,14 @@ class PhotoSize(Result):
         """
         return key in ["file_id", "width", "height", "file_size"]
     # end def __contains__
+
+    def __hash__(self):
+        """
+        Implements `hash(photosize_instance)`, from the fields, like `==` compares them.
+        Don't change the fields while it's used in a set or as dict key. Frozen copies hash the same, cached.
+        """
+        return hash((PhotoSize, self.file_id, self.width, self.height, self.file_size))
+    # end def __hash__
 # end class PhotoSize
 
 
@@ -246,13 +238,14 @@ class Audio(Media):
 
     https://core.telegram.org/bots/api#audio
     """
+    __slots__ = ["file_id", "duration", "performer", "title", "mime_type", "file_size"]
+
     def __init__(self, file_id, duration, performer=None, title=None, mime_type=None, file_size=None):
         """
         This object represents an audio file to be treated as music by the Telegram clients.
 
         https://core.telegram.org/bots/api#audio
 
-
         Parameters:
 
         :param file_id: Unique identifier for this file
@@ -261,7 +254,6 @@ class Audio(Media):
         :param duration: Duration of the audio in seconds as defined by sender
         :type  duration: int
 
-
         Optional keyword parameters:
 
         :keyword performer: Optional. Performer of the audio as defined by sender or by audio tags
@@ -278,20 +270,20 @@ class Audio(Media):
         """
         super(Audio, self).__init__()
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(duration is not None)
         assert(isinstance(duration, int))
         self.duration = duration
         
-        assert(performer is None or isinstance(performer, str))
+        assert(performer is None or isinstance(performer, unicode_type))
         self.performer = performer
         
-        assert(title is None or isinstance(title, str))
+        assert(title is None or isinstance(title, unicode_type))
         self.title = title
         
-        assert(mime_type is None or isinstance(mime_type, str))
+        assert(mime_type is None or isinstance(mime_type, unicode_type))
         self.mime_type = mime_type
         
         assert(file_size is None or isinstance(file_size, int))
@@ -305,18 +297,7 @@ class Audio(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Audio, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        array['duration'] = int(self.duration)  # type int
-        if self.performer is not None:
-            array['performer'] = str(self.performer)  # type str
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.mime_type is not None:
-            array['mime_type'] = str(self.mime_type)  # type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -331,15 +312,7 @@ class Audio(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['duration'] = int(array.get('duration'))
-        data['performer'] = str(array.get('performer')) if array.get('performer') is not None else None
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['mime_type'] = str(array.get('mime_type')) if array.get('mime_type') is not None else None
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        return Audio(**data)
+        return decode(Audio, array)
     # end def from_array
 
     def __str__(self):
@@ -364,19 +337,19 @@ class Document(Media):
 
     https://core.telegram.org/bots/api#document
     """
+    __slots__ = ["file_id", "thumb", "file_name", "mime_type", "file_size"]
+
     def __init__(self, file_id, thumb=None, file_name=None, mime_type=None, file_size=None):
         """
         This object represents a general file (as opposed to photos, voice messages and audio files).
 
         https://core.telegram.org/bots/api#document
 
-
         Parameters:
 
         :param file_id: Unique file identifier
         :type  file_id: str
 
-
         Optional keyword parameters:
 
         :keyword thumb: Optional. Document thumbnail as defined by sender
@@ -393,16 +366,16 @@ class Document(Media):
         """
         super(Document, self).__init__()
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(thumb is None or isinstance(thumb, PhotoSize))
         self.thumb = thumb
         
-        assert(file_name is None or isinstance(file_name, str))
+        assert(file_name is None or isinstance(file_name, unicode_type))
         self.file_name = file_name
         
-        assert(mime_type is None or isinstance(mime_type, str))
+        assert(mime_type is None or isinstance(mime_type, unicode_type))
         self.mime_type = mime_type
         
         assert(file_size is None or isinstance(file_size, int))
@@ -416,17 +389,7 @@ class Document(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Document, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        if self.file_name is not None:
-            array['file_name'] = str(self.file_name)  # type str
-        if self.mime_type is not None:
-            array['mime_type'] = str(self.mime_type)  # type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -441,14 +404,7 @@ class Document(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['thumb'] = PhotoSize.from_array(array.get('thumb')) if array.get('thumb') is not None else None
-        data['file_name'] = str(array.get('file_name')) if array.get('file_name') is not None else None
-        data['mime_type'] = str(array.get('mime_type')) if array.get('mime_type') is not None else None
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        return Document(**data)
+        return decode(Document, array)
     # end def from_array
 
     def __str__(self):
@@ -473,13 +429,14 @@ class Sticker(Media):
 
     https://core.telegram.org/bots/api#sticker
     """
+    __slots__ = ["file_id", "width", "height", "thumb", "emoji", "file_size", "mime_type"]
+
     def __init__(self, file_id, width, height, thumb=None, emoji=None, file_size=None):
         """
         This object represents a sticker.
 
         https://core.telegram.org/bots/api#sticker
 
-
         Parameters:
 
         :param file_id: Unique identifier for this file
@@ -491,7 +448,6 @@ class Sticker(Media):
         :param height: Sticker height
         :type  height: int
 
-
         Optional keyword parameters:
 
         :keyword thumb: Optional. Sticker thumbnail in .webp or .jpg format
@@ -505,7 +461,7 @@ class Sticker(Media):
         """
         super(Sticker, self).__init__()
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(width is not None)
@@ -519,7 +475,7 @@ class Sticker(Media):
         assert(thumb is None or isinstance(thumb, PhotoSize))
         self.thumb = thumb
         
-        assert(emoji is None or isinstance(emoji, str))
+        assert(emoji is None or isinstance(emoji, unicode_type))
         self.emoji = emoji
 
         assert(file_size is None or isinstance(file_size, int))
@@ -534,17 +490,7 @@ class Sticker(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Sticker, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        array['width'] = int(self.width)  # type int
-        array['height'] = int(self.height)  # type int
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        if self.emoji is not None:
-            array['emoji'] = str(self.emoji)  # type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -559,15 +505,7 @@ class Sticker(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['width'] = int(array.get('width'))
-        data['height'] = int(array.get('height'))
-        data['thumb'] = PhotoSize.from_array(array.get('thumb')) if array.get('thumb') is not None else None
-        data['emoji'] = str(array.get('emoji')) if array.get('emoji') is not None else None
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        return Sticker(**data)
+        return decode(Sticker, array)
     # end def from_array
 
     def __str__(self):
@@ -592,13 +530,14 @@ class Video(Media):
 
     https://core.telegram.org/bots/api#video
     """
+    __slots__ = ["file_id", "width", "height", "duration", "thumb", "mime_type", "file_size"]
+
     def __init__(self, file_id, width, height, duration, thumb=None, mime_type=None, file_size=None):
         """
         This object represents a video file.
 
         https://core.telegram.org/bots/api#video
 
-
         Parameters:
 
         :param file_id: Unique identifier for this file
@@ -613,7 +552,6 @@ class Video(Media):
         :param duration: Duration of the video in seconds as defined by sender
         :type  duration: int
 
-
         Optional keyword parameters:
 
         :keyword thumb: Optional. Video thumbnail
@@ -627,7 +565,7 @@ class Video(Media):
         """
         super(Video, self).__init__()
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(width is not None)
@@ -645,7 +583,7 @@ class Video(Media):
         assert(thumb is None or isinstance(thumb, PhotoSize))
         self.thumb = thumb
         
-        assert(mime_type is None or isinstance(mime_type, str))
+        assert(mime_type is None or isinstance(mime_type, unicode_type))
         self.mime_type = mime_type
         
         assert(file_size is None or isinstance(file_size, int))
@@ -659,18 +597,7 @@ class Video(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Video, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        array['width'] = int(self.width)  # type int
-        array['height'] = int(self.height)  # type int
-        array['duration'] = int(self.duration)  # type int
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        if self.mime_type is not None:
-            array['mime_type'] = str(self.mime_type)  # type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -685,16 +612,7 @@ class Video(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['width'] = int(array.get('width'))
-        data['height'] = int(array.get('height'))
-        data['duration'] = int(array.get('duration'))
-        data['thumb'] = PhotoSize.from_array(array.get('thumb')) if array.get('thumb') is not None else None
-        data['mime_type'] = str(array.get('mime_type')) if array.get('mime_type') is not None else None
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        return Video(**data)
+        return decode(Video, array)
     # end def from_array
 
     def __str__(self):
@@ -719,13 +637,14 @@ class Voice(Media):
 
     https://core.telegram.org/bots/api#voice
     """
+    __slots__ = ["file_id", "duration", "mime_type", "file_size"]
+
     def __init__(self, file_id, duration, mime_type=None, file_size=None):
         """
         This object represents a voice note.
 
         https://core.telegram.org/bots/api#voice
 
-
         Parameters:
 
         :param file_id: Unique identifier for this file
@@ -734,7 +653,6 @@ class Voice(Media):
         :param duration: Duration of the audio in seconds as defined by sender
         :type  duration: int
 
-
         Optional keyword parameters:
 
         :keyword mime_type: Optional. MIME type of the file as defined by sender
@@ -745,14 +663,14 @@ class Voice(Media):
         """
         super(Voice, self).__init__()
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(duration is not None)
         assert(isinstance(duration, int))
         self.duration = duration
         
-        assert(mime_type is None or isinstance(mime_type, str))
+        assert(mime_type is None or isinstance(mime_type, unicode_type))
         self.mime_type = mime_type
         
         assert(file_size is None or isinstance(file_size, int))
@@ -766,14 +684,7 @@ class Voice(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Voice, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        array['duration'] = int(self.duration)  # type int
-        if self.mime_type is not None:
-            array['mime_type'] = str(self.mime_type)  # type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -788,13 +699,7 @@ class Voice(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['duration'] = int(array.get('duration'))
-        data['mime_type'] = str(array.get('mime_type')) if array.get('mime_type') is not None else None
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        return Voice(**data)
+        return decode(Voice, array)
     # end def from_array
 
     def __str__(self):
@@ -819,13 +724,14 @@ class Contact(Media):
 
     https://core.telegram.org/bots/api#contact
     """
+    __slots__ = ["phone_number", "first_name", "last_name", "user_id"]
+
     def __init__(self, phone_number, first_name, last_name=None, user_id=None):
         """
         This object represents a phone contact.
 
         https://core.telegram.org/bots/api#contact
 
-
         Parameters:
 
         :param phone_number: Contact's phone number
@@ -834,7 +740,6 @@ class Contact(Media):
         :param first_name: Contact's first name
         :type  first_name: str
 
-
         Optional keyword parameters:
 
         :keyword last_name: Optional. Contact's last name
@@ -845,14 +750,14 @@ class Contact(Media):
         """
         super(Contact, self).__init__()
         assert(phone_number is not None)
-        assert(isinstance(phone_number, str))
+        assert(isinstance(phone_number, unicode_type))
         self.phone_number = phone_number
         
         assert(first_name is not None)
-        assert(isinstance(first_name, str))
+        assert(isinstance(first_name, unicode_type))
         self.first_name = first_name
         
-        assert(last_name is None or isinstance(last_name, str))
+        assert(last_name is None or isinstance(last_name, unicode_type))
         self.last_name = last_name
         
         assert(user_id is None or isinstance(user_id, int))
@@ -866,14 +771,7 @@ class Contact(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Contact, self).to_array()
-        array['phone_number'] = str(self.phone_number)  # type str
-        array['first_name'] = str(self.first_name)  # type str
-        if self.last_name is not None:
-            array['last_name'] = str(self.last_name)  # type str
-        if self.user_id is not None:
-            array['user_id'] = int(self.user_id)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -888,13 +786,7 @@ class Contact(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['phone_number'] = str(array.get('phone_number'))
-        data['first_name'] = str(array.get('first_name'))
-        data['last_name'] = str(array.get('last_name')) if array.get('last_name') is not None else None
-        data['user_id'] = int(array.get('user_id')) if array.get('user_id') is not None else None
-        return Contact(**data)
+        return decode(Contact, array)
     # end def from_array
 
     def __str__(self):
@@ -919,13 +811,14 @@ class Location(Media):
 
     https://core.telegram.org/bots/api#location
     """
+    __slots__ = ["longitude", "latitude"]
+
     def __init__(self, longitude, latitude):
         """
         This object represents a point on the map.
 
         https://core.telegram.org/bots/api#location
 
-
         Parameters:
 
         :param longitude: Longitude as defined by sender
@@ -951,10 +844,7 @@ class Location(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Location, self).to_array()
-        array['longitude'] = float(self.longitude)  # type float
-        array['latitude'] = float(self.latitude)  # type float
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -969,11 +859,7 @@ class Location(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['longitude'] = float(array.get('longitude'))
-        data['latitude'] = float(array.get('latitude'))
-        return Location(**data)
+        return decode(Location, array)
     # end def from_array
 
     def __str__(self):
@@ -998,13 +884,14 @@ class Venue(Media):
 
     https://core.telegram.org/bots/api#venue
     """
+    __slots__ = ["location", "title", "address", "foursquare_id"]
+
     def __init__(self, location, title, address, foursquare_id=None):
         """
         This object represents a venue.
 
         https://core.telegram.org/bots/api#venue
 
-
         Parameters:
 
         :param location: Venue location
@@ -1016,7 +903,6 @@ class Venue(Media):
         :param address: Address of the venue
         :type  address: str
 
-
         Optional keyword parameters:
 
         :keyword foursquare_id: Optional. Foursquare identifier of the venue
@@ -1028,14 +914,14 @@ class Venue(Media):
         self.location = location
         
         assert(title is not None)
-        assert(isinstance(title, str))
+        assert(isinstance(title, unicode_type))
         self.title = title
         
         assert(address is not None)
-        assert(isinstance(address, str))
+        assert(isinstance(address, unicode_type))
         self.address = address
         
-        assert(foursquare_id is None or isinstance(foursquare_id, str))
+        assert(foursquare_id is None or isinstance(foursquare_id, unicode_type))
         self.foursquare_id = foursquare_id
     # end def __init__
 
@@ -1046,13 +932,7 @@ class Venue(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Venue, self).to_array()
-        array['location'] = self.location.to_array()  # type Location
-        array['title'] = str(self.title)  # type str
-        array['address'] = str(self.address)  # type str
-        if self.foursquare_id is not None:
-            array['foursquare_id'] = str(self.foursquare_id)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1067,13 +947,7 @@ class Venue(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['location'] = Location.from_array(array.get('location'))
-        data['title'] = str(array.get('title'))
-        data['address'] = str(array.get('address'))
-        data['foursquare_id'] = str(array.get('foursquare_id')) if array.get('foursquare_id') is not None else None
-        return Venue(**data)
+        return decode(Venue, array)
     # end def from_array
 
     def __str__(self):
@@ -1098,13 +972,14 @@ class UserProfilePhotos(Result):
 
     https://core.telegram.org/bots/api#userprofilephotos
     """
+    __slots__ = ["total_count", "photos"]
+
     def __init__(self, total_count, photos):
         """
         This object represent a user's profile pictures.
 
         https://core.telegram.org/bots/api#userprofilephotos
 
-
         Parameters:
 
         :param total_count: Total number of profile pictures the target user has
@@ -1130,10 +1005,7 @@ class UserProfilePhotos(Result):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(UserProfilePhotos, self).to_array()
-        array['total_count'] = int(self.total_count)  # type int
-        array['photos'] = self._as_array(self.photos)  # type list of list of PhotoSize
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1148,11 +1020,7 @@ class UserProfilePhotos(Result):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['total_count'] = int(array.get('total_count'))
-        data['photos'] = PhotoSize.from_array_list(array.get('photos'), list_level=2)
-        return UserProfilePhotos(**data)
+        return decode(UserProfilePhotos, array)
     # end def from_array
 
     def __str__(self):
@@ -1182,6 +1050,8 @@ class File(Receivable):
 
     https://core.telegram.org/bots/api#file
     """
+    __slots__ = ["file_id", "file_size", "file_path"]
+
     def __init__(self, file_id, file_size=None, file_path=None):
         """
         This object represents a file ready to be downloaded.
@@ -1193,13 +1063,11 @@ class File(Receivable):
 
         https://core.telegram.org/bots/api#file
 
-
         Parameters:
 
         :param file_id: Unique identifier for this file
         :type  file_id: str
 
-
         Optional keyword parameters:
 
         :keyword file_size: Optional. File size, if known
@@ -1211,13 +1079,13 @@ class File(Receivable):
         super(File, self).__init__()
         
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(file_size is None or isinstance(file_size, int))
         self.file_size = file_size
         
-        assert(file_path is None or isinstance(file_path, str))
+        assert(file_path is None or isinstance(file_path, unicode_type))
         self.file_path = file_path
     # end def __init__
 
@@ -1243,13 +1111,7 @@ class File(Receivable):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(File, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        if self.file_path is not None:
-            array['file_path'] = str(self.file_path)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1264,12 +1126,7 @@ class File(Receivable):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        data['file_path'] = str(array.get('file_path')) if array.get('file_path') is not None else None
-        return File(**data)
+        return decode(File, array)
     # end def from_array
 
     def __str__(self):
@@ -1295,13 +1152,14 @@ class Game(Media):
 
     https://core.telegram.org/bots/api#game
     """
+    __slots__ = ["title", "description", "photo", "text", "text_entities", "animation"]
+
     def __init__(self, title, description, photo, text=None, text_entities=None, animation=None):
         """
         This object represents a game. Use BotFather to create and edit games, their short names will act as unique identifiers.
     
         https://core.telegram.org/bots/api#game
 
-
         Parameters:
         
         :param title: Title of the game
@@ -1327,18 +1185,18 @@ class Game(Media):
         """
         super(Game, self).__init__()
         assert(title is not None)
-        assert(isinstance(title, str))
+        assert(isinstance(title, unicode_type))
         self.title = title
         
         assert(description is not None)
-        assert(isinstance(description, str))
+        assert(isinstance(description, unicode_type))
         self.description = description
         
         assert(photo is not None)
         assert(isinstance(photo, list))
         self.photo = photo
         
-        assert(text is None or isinstance(text, str))
+        assert(text is None or isinstance(text, unicode_type))
         self.text = text
         
         assert(text_entities is None or isinstance(text_entities, list))
@@ -1355,17 +1213,7 @@ class Game(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Game, self).to_array()
-        array['title'] = str(self.title)  # type str
-        array['description'] = str(self.description)  # type str
-        array['photo'] = self._as_array(self.photo)  # type list of PhotoSize
-        if self.text is not None:
-            array['text'] = str(self.text)  # type str
-        if self.text_entities is not None:
-            array['text_entities'] = self._as_array(self.text_entities)  # type list of MessageEntity
-        if self.animation is not None:
-            array['animation'] = self.animation.to_array()  # type Animation
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1380,15 +1228,7 @@ class Game(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-        
-        data = {}
-        data['title'] = str(array.get('title'))
-        data['description'] = str(array.get('description'))
-        data['photo'] = PhotoSize.from_array_list(array.get('photo'), list_level=1)
-        data['text'] = str(array.get('text')) if array.get('text') is not None else None
-        data['text_entities'] = MessageEntity.from_array_list(array.get('text_entities'), list_level=1) if array.get('text_entities') is not None else None
-        data['animation'] = Animation.from_array(array.get('animation')) if array.get('animation') is not None else None
-        return Game(**data)
+        return decode(Game, array)
     # end def from_array
 
     def __str__(self):
@@ -1414,13 +1254,14 @@ class Animation(Media):
 
     https://core.telegram.org/bots/api#animation
     """
+    __slots__ = ["file_id", "thumb", "file_name", "mime_type", "file_size"]
+
     def __init__(self, file_id, thumb=None, file_name=None, mime_type=None, file_size=None):
         """
         You can provide an animation for your game so that it looks stylish in chats (check out Lumberjack for an example). This object represents an animation file to be displayed in the message containing a game.
     
         https://core.telegram.org/bots/api#animation
 
-
         Parameters:
         
         :param file_id: Unique file identifier
@@ -1444,16 +1285,16 @@ class Animation(Media):
         super(Animation, self).__init__()
 
         assert(file_id is not None)
-        assert(isinstance(file_id, str))
+        assert(isinstance(file_id, unicode_type))
         self.file_id = file_id
         
         assert(thumb is None or isinstance(thumb, PhotoSize))
         self.thumb = thumb
         
-        assert(file_name is None or isinstance(file_name, str))
+        assert(file_name is None or isinstance(file_name, unicode_type))
         self.file_name = file_name
         
-        assert(mime_type is None or isinstance(mime_type, str))
+        assert(mime_type is None or isinstance(mime_type, unicode_type))
         self.mime_type = mime_type
         
         assert(file_size is None or isinstance(file_size, int))
@@ -1467,17 +1308,7 @@ class Animation(Media):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Animation, self).to_array()
-        array['file_id'] = str(self.file_id)  # type str
-        if self.thumb is not None:
-            array['thumb'] = self.thumb.to_array()  # type PhotoSize
-        if self.file_name is not None:
-            array['file_name'] = str(self.file_name)  # type str
-        if self.mime_type is not None:
-            array['mime_type'] = str(self.mime_type)  # type str
-        if self.file_size is not None:
-            array['file_size'] = int(self.file_size)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1492,14 +1323,7 @@ class Animation(Media):
             return None
         # end if
         assert(isinstance(array, dict))
-        
-        data = {}
-        data['file_id'] = str(array.get('file_id'))
-        data['thumb'] = PhotoSize.from_array(array.get('thumb')) if array.get('thumb') is not None else None
-        data['file_name'] = str(array.get('file_name')) if array.get('file_name') is not None else None
-        data['mime_type'] = str(array.get('mime_type')) if array.get('mime_type') is not None else None
-        data['file_size'] = int(array.get('file_size')) if array.get('file_size') is not None else None
-        return Animation(**data)
+        return decode(Animation, array)
     # end def from_array
 
     def __str__(self):
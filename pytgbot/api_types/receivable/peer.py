@@ -1,15 +1,142 @@
 # -*- coding: utf-8 -*-
+import threading
+
 from luckydonaldUtils.logger import logging
 from luckydonaldUtils.encoding import unicode_type
 
-from pytgbot.api_types.receivable import Result
+from pytgbot.api_types.engine import decode, encode
+from pytgbot.api_types.receivable import Result, _raw_names
 
 __author__ = 'luckydonald'
 logger = logging.getLogger(__name__)
 
 
 class Peer(Result):
-    pass
+    __slots__ = []
+
+
+class PeerCache(object):
+    """
+    Interns the :class:`User` and :class:`Chat` objects decoded by `from_array`:
+    a peer received with exactly the same fields as before is the same (frozen, see :meth:`TgBotApiObject.freeze`)
+    instance again, instead of a new object for every update, reply, forward, ...
+
+    Holds up to `max_size` recently used peers of each class, by id, in two generations of plain dicts (an `OrderedDict`
+    would cost more memory than the sharing saves): once the recent one holds half of them, the older one is dropped,
+    with the peers not used since.
+    Enable it with :func:`intern_peers`.
+    """
+    def __init__(self, max_size=10000):
+        """
+        :keyword max_size: Maximum number of peers kept per class.
+        :type    max_size: int
+        """
+        super(PeerCache, self).__init__()
+        assert(isinstance(max_size, int) and max_size > 0)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._peers = {}  # class: [recently used, older], dicts of id: frozen instance.
+        self._lock = threading.Lock()
+    # end def __init__
+
+    def get(self, clazz, array):
+        """
+        The frozen `clazz` instance for the received dict.
+
+        :param clazz: :class:`User` or :class:`Chat`
+        :param array: the received dict.
+        :type  array: dict
+
+        :return: the shared instance.
+        """
+        names = _raw_names(clazz)
+        for key in array:
+            if key not in names:
+                return _decode(clazz, array, names)  # field we don't know, keep it private.
+            # end if
+        # end for
+        peer_id = array.get("id")
+        with self._lock:
+            generations = self._peers.get(clazz)
+            if generations is None:
+                generations = self._peers[clazz] = [{}, {}]
+            # end if
+            recent, old = generations
+            peer = recent.get(peer_id)
+            if peer is None:
+                peer = old.pop(peer_id, None)
+            # end if
+            if peer is not None and _same_fields(peer, array, names):
+                self.hits += 1
+                recent[peer_id] = peer  # used again, so it stays
+                return peer
+            # end if
+        # end with
+        peer = _decode(clazz, array, names).freeze()  # new, or it changed, e.g. the username.
+        with self._lock:
+            self.misses += 1
+            recent, old = generations
+            recent[peer_id] = peer
+            if len(recent) >= max(self.max_size // 2, 1):
+                generations[:] = [{}, recent]  # drops the old ones, which weren't used since.
+            # end if
+        # end with
+        return peer
+    # end def get
+
+    def clear(self):
+        with self._lock:
+            self._peers.clear()
+        # end with
+    # end def clear
+
+    def __len__(self):
+        return sum(len(recent) + len(old) for recent, old in list(self._peers.values()))
+    # end def __len__
+# end class PeerCache
+
+
+def _decode(clazz, array, names):
+    """ The `clazz` instance of the received dict, built like `from_array` does, without the asserts of `__init__`. """
+    instance = clazz._new_trusted()
+    for key, name in names.items():
+        setattr(instance, name, array.get(key))
+    # end for
+    return instance
+# end def _decode
+
+
+def _same_fields(peer, array, names):
+    """ If the cached `peer` still has the fields of the received dict. """
+    for key, name in names.items():
+        if getattr(peer, name) != array.get(key):
+            return False
+        # end if
+    # end for
+    return True
+# end def _same_fields
+
+
+_peer_cache = None
+
+
+def intern_peers(max_size=10000):
+    """
+    Enables (or disables) interning of the decoded :class:`User` and :class:`Chat` objects, see :class:`PeerCache`.
+
+    Off by default, as the interned peers are frozen: setting a field of them raises an :class:`AttributeError`.
+
+    :keyword max_size: Maximum number of peers kept. `None` or `0` disables interning again.
+    :type    max_size: int
+
+    :return: The cache now used, or `None`.
+    :rtype: PeerCache | None
+    """
+    global _peer_cache
+    _peer_cache = PeerCache(max_size) if max_size else None
+    return _peer_cache
+# end def intern_peers
 
 
 class User(Peer):
@@ -18,6 +145,8 @@ class User(Peer):
 
     https://core.telegram.org/bots/api#user
     """
+    __slots__ = ["id", "first_name", "last_name", "username"]
+
     def __init__(self, id, first_name, last_name=None, username=None):
         """
         This object represents a Telegram user or bot.
@@ -48,13 +177,13 @@ class User(Peer):
         self.id = id
 
         assert(first_name is not None)
-        assert(isinstance(first_name, str))
+        assert(isinstance(first_name, unicode_type))
         self.first_name = first_name
 
-        assert(last_name is None or isinstance(last_name, str))
+        assert(last_name is None or isinstance(last_name, unicode_type))
         self.last_name = last_name
 
-        assert(username is None or isinstance(username, str))
+        assert(username is None or isinstance(username, unicode_type))
         self.username = username
     # end def __init__
 
@@ -65,14 +194,7 @@ class User(Peer):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(User, self).to_array()
-        array['id'] = int(self.id)  # type int
-        array['first_name'] = str(self.first_name)  # type str
-        if self.last_name is not None:
-            array['last_name'] = str(self.last_name)  # type str
-        if self.username is not None:
-            array['username'] = str(self.username)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -87,13 +209,7 @@ class User(Peer):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['id'] = int(array.get('id'))
-        data['first_name'] = str(array.get('first_name'))
-        data['last_name'] = str(array.get('last_name')) if array.get('last_name') is not None else None
-        data['username'] = str(array.get('username')) if array.get('username') is not None else None
-        return User(**data)
+        return decode(User, array)
     # end def from_array
 
     def __str__(self):
@@ -109,6 +225,14 @@ class User(Peer):
         """
         return key in ["id", "first_name", "last_name", "username"]
     # end def __contains__
+
+    def __hash__(self):
+        """
+        Implements `hash(user_instance)`, from the fields, like `==` compares them.
+        Don't change the fields while it's used in a set or as dict key. Frozen copies hash the same, cached.
+        """
+        return hash((User, self.id, self.first_name, self.last_name, self.username))
+    # end def __hash__
 # end class User
 
 
@@ -118,6 +242,8 @@ class Chat(Peer):
 
     https://core.telegram.org/bots/api#chat
     """
+    __slots__ = ["id", "type", "title", "username", "first_name", "last_name", "all_members_are_administrators"]
+
     def __init__(self, id, type, title=None, username=None, first_name=None, last_name=None, all_members_are_administrators=None):
         """
         This object represents a chat.
@@ -158,19 +284,19 @@ class Chat(Peer):
         self.id = id
 
         assert(type is not None)
-        assert(isinstance(type, str))
+        assert(isinstance(type, unicode_type))
         self.type = type
 
-        assert(title is None or isinstance(title, str))
+        assert(title is None or isinstance(title, unicode_type))
         self.title = title
 
-        assert(username is None or isinstance(username, str))
+        assert(username is None or isinstance(username, unicode_type))
         self.username = username
 
-        assert(first_name is None or isinstance(first_name, str))
+        assert(first_name is None or isinstance(first_name, unicode_type))
         self.first_name = first_name
 
-        assert(last_name is None or isinstance(last_name, str))
+        assert(last_name is None or isinstance(last_name, unicode_type))
         self.last_name = last_name
         
         assert(all_members_are_administrators is None or isinstance(all_members_are_administrators, bool))
@@ -184,20 +310,7 @@ class Chat(Peer):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Chat, self).to_array()
-        array['id'] = int(self.id)  # type int
-        array['type'] = str(self.type)  # type str
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.username is not None:
-            array['username'] = str(self.username)  # type str
-        if self.first_name is not None:
-            array['first_name'] = str(self.first_name)  # type str
-        if self.last_name is not None:
-            array['last_name'] = str(self.last_name)  # type str
-        if self.all_members_are_administrators is not None:
-            array['all_members_are_administrators'] = bool(self.all_members_are_administrators)  # type bool
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -212,16 +325,7 @@ class Chat(Peer):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['id'] = int(array.get('id'))
-        data['type'] = str(array.get('type'))
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['username'] = str(array.get('username')) if array.get('username') is not None else None
-        data['first_name'] = str(array.get('first_name')) if array.get('first_name') is not None else None
-        data['last_name'] = str(array.get('last_name')) if array.get('last_name') is not None else None
-        data['all_members_are_administrators'] = bool(array.get('all_members_are_administrators')) if array.get('all_members_are_administrators') is not None else None
-        return Chat(**data)
+        return decode(Chat, array)
     # end def from_array
 
     def __str__(self):
@@ -237,6 +341,14 @@ class Chat(Peer):
         """
         return key in ["id", "type", "title", "username", "first_name", "last_name", "all_members_are_administrators"]
     # end def __contains__
+
+    def __hash__(self):
+        """
+        Implements `hash(chat_instance)`, from the fields, like `==` compares them.
+        Don't change the fields while it's used in a set or as dict key. Frozen copies hash the same, cached.
+        """
+        return hash((Chat, self.id, self.type, self.title, self.username, self.first_name, self.last_name, self.all_members_are_administrators))
+    # end def __hash__
 # end class Chat
 
 
@@ -246,6 +358,8 @@ class ChatMember(Result):
 
     https://core.telegram.org/bots/api#chatmember
     """
+    __slots__ = ["user", "status"]
+
     def __init__(self, user, status):
         """
         This object contains information about one member of the chat.
@@ -268,7 +382,7 @@ class ChatMember(Result):
         self.user = user
 
         assert(status is not None)
-        assert(isinstance(status, str))
+        assert(isinstance(status, unicode_type))
         self.status = status
     # end def __init__
 
@@ -279,10 +393,7 @@ class ChatMember(Result):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(ChatMember, self).to_array()
-        array['user'] = self.user.to_array()  # type User
-        array['status'] = str(self.status)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -297,11 +408,7 @@ class ChatMember(Result):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['user'] = User.from_array(array.get('user'))
-        data['status'] = str(array.get('status'))
-        return ChatMember(**data)
+        return decode(ChatMember, array)
     # end def from_array
 
     def __str__(self):
@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
+from luckydonaldUtils.encoding import unicode_type
 from luckydonaldUtils.logger import logging
 
 from . import Receivable
+from ..engine import decode, encode, projector
+from .media import Audio, Contact, Document, Game, Location, Sticker, Venue, Video, Voice
+from .peer import User, Chat
+# NOTE: `from .inline import InlineQuery, ChosenInlineResult` import at the bottom of this file
 
 __author__ = 'luckydonald'
 logger = logging.getLogger(__name__)
 
 
 class UpdateType(Receivable):
-    pass
+    __slots__ = []
 
 
 class Update(Receivable):
@@ -17,19 +22,19 @@ class Update(Receivable):
 
     https://core.telegram.org/bots/api#update
     """
+    __slots__ = ["update_id", "message", "edited_message", "channel_post", "edited_channel_post", "inline_query", "chosen_inline_result", "callback_query"]
+
     def __init__(self, update_id, message=None, edited_message=None, channel_post=None, edited_channel_post=None, inline_query=None, chosen_inline_result=None, callback_query=None):
         """
         This object represents an incoming update. At most one of the optional parameters can be present in any given update.
 
         https://core.telegram.org/bots/api#update
 
-
         Parameters:
 
         :param update_id: The update‘s unique identifier. Update identifiers start from a certain positive number and increase sequentially. This ID becomes especially handy if you’re using Webhooks, since it allows you to ignore repeated updates or to restore the correct update sequence, should they get out of order.
         :type  update_id: int
 
-
         Optional keyword parameters:
 
         :keyword message: Optional. New incoming message of any kind — text, photo, sticker, etc.
@@ -44,7 +49,6 @@ class Update(Receivable):
         :keyword edited_channel_post: Optional. New version of a channel post that is known to the bot and was edited
         :type    edited_channel_post: Message
 
-
         :keyword inline_query: Optional. New incoming inline query
         :type    inline_query: pytgbot.api_types.receivable.inline.InlineQuery
 
@@ -55,8 +59,6 @@ class Update(Receivable):
         :type    callback_query: CallbackQuery
         """
         super(Update, self).__init__()
-        from ..receivable.inline import InlineQuery
-        from ..receivable.inline import ChosenInlineResult
 
         assert(update_id is not None)
         assert(isinstance(update_id, int))
@@ -91,30 +93,18 @@ class Update(Receivable):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Update, self).to_array()
-        array['update_id'] = int(self.update_id)  # type int
-        if self.message is not None:
-            array['message'] = self.message.to_array()  # type Message
-        if self.edited_message is not None:
-            array['edited_message'] = self.edited_message.to_array()  # type Message
-        if self.channel_post is not None:
-            array['channel_post'] = self.channel_post.to_array()  # type Message
-        if self.edited_channel_post is not None:
-            array['edited_channel_post'] = self.edited_channel_post.to_array()  # type Message
-        if self.inline_query is not None:
-            array['inline_query'] = self.inline_query.to_array()  # type InlineQuery
-        if self.chosen_inline_result is not None:
-            array['chosen_inline_result'] = self.chosen_inline_result.to_array()  # type ChosenInlineResult
-        if self.callback_query is not None:
-            array['callback_query'] = self.callback_query.to_array()  # type CallbackQuery
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
-    def from_array(array):
+    def from_array(array, fields=None):
         """
         Deserializes a new Update from a given dictionary.
 
+        :keyword fields: Only decode those attributes, e.g. `["message.chat.id", "message.text"]`. All others are `None`.
+                         See :func:`pytgbot.api_types.engine.projector`. Default: decode everything.
+        :type    fields: list of str
+
         :return: new Update instance.
         :rtype: Update
         """
@@ -122,18 +112,10 @@ class Update(Receivable):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from ..receivable.inline import InlineQuery
-        from ..receivable.inline import ChosenInlineResult
-
-        data = {}
-        data['update_id'] = int(array.get('update_id'))
-        data['message'] = Message.from_array(array.get('message')) if array.get('message') is not None else None
-        data['edited_message'] = Message.from_array(array.get('edited_message')) if array.get('edited_message') is not None else None
-        data['inline_query'] = InlineQuery.from_array(array.get('inline_query')) if array.get('inline_query') is not None else None
-        data['chosen_inline_result'] = ChosenInlineResult.from_array(array.get('chosen_inline_result')) if array.get('chosen_inline_result') is not None else None
-        data['callback_query'] = CallbackQuery.from_array(array.get('callback_query')) if array.get('callback_query') is not None else None
-        return Update(**data)
+        if fields is not None:
+            return projector(Update, fields)(array)
+        # end if
+        return decode(Update, array)
     # end def from_array
 
     def __str__(self):
@@ -158,13 +140,14 @@ class Message(UpdateType):
 
     https://core.telegram.org/bots/api#message
     """
+    __slots__ = ["message_id", "date", "chat", "from_peer", "forward_from", "forward_from_chat", "forward_from_message_id", "forward_date", "reply_to_message", "edit_date", "text", "entities", "audio", "document", "game", "photo", "sticker", "video", "voice", "caption", "contact", "location", "venue", "new_chat_member", "left_chat_member", "new_chat_title", "new_chat_photo", "delete_chat_photo", "group_chat_created", "supergroup_chat_created", "channel_chat_created", "migrate_to_chat_id", "migrate_from_chat_id", "pinned_message"]
+
     def __init__(self, message_id, date, chat, from_peer=None, forward_from=None, forward_from_chat=None, forward_from_message_id=None, forward_date=None, reply_to_message=None, edit_date=None, text=None, entities=None, audio=None, document=None, game=None, photo=None, sticker=None, video=None, voice=None, caption=None, contact=None, location=None, venue=None, new_chat_member=None, left_chat_member=None, new_chat_title=None, new_chat_photo=None, delete_chat_photo=None, group_chat_created=None, supergroup_chat_created=None, channel_chat_created=None, migrate_to_chat_id=None, migrate_from_chat_id=None, pinned_message=None):
         """
         This object represents a message.
 
         https://core.telegram.org/bots/api#message
 
-
         Parameters:
 
         :param message_id: Unique message identifier inside this chat
@@ -176,7 +159,6 @@ class Message(UpdateType):
         :param chat: Conversation the message belongs to
         :type  chat: pytgbot.api_types.receivable.peer.Chat
 
-
         Optional keyword parameters:
 
         :keyword from_peer: Optional. Sender, can be empty for messages sent to channels
@@ -274,9 +256,6 @@ class Message(UpdateType):
         """
         super(Message, self).__init__()
 
-        from ..receivable.peer import User, Chat
-        from ..receivable.media import Audio, Contact, Document, Game, Location, Sticker, Venue, Video, Voice
-
         assert(message_id is not None)
         assert(isinstance(message_id, int))
         self.message_id = message_id
@@ -310,7 +289,7 @@ class Message(UpdateType):
         assert(edit_date is None or isinstance(edit_date, int))
         self.edit_date = edit_date
 
-        assert(text is None or isinstance(text, str))
+        assert(text is None or isinstance(text, unicode_type))
         self.text = text
 
         assert(entities is None or isinstance(entities, (list, tuple)))  # list of MessageEntity
@@ -337,7 +316,7 @@ class Message(UpdateType):
         assert(voice is None or isinstance(voice, Voice))
         self.voice = voice
 
-        assert(caption is None or isinstance(caption, str))
+        assert(caption is None or isinstance(caption, unicode_type))
         self.caption = caption
 
         assert(contact is None or isinstance(contact, Contact))
@@ -355,7 +334,7 @@ class Message(UpdateType):
         assert(left_chat_member is None or isinstance(left_chat_member, User))
         self.left_chat_member = left_chat_member
 
-        assert(new_chat_title is None or isinstance(new_chat_title, str))
+        assert(new_chat_title is None or isinstance(new_chat_title, unicode_type))
         self.new_chat_title = new_chat_title
 
         assert(new_chat_photo is None or isinstance(new_chat_photo, (list, tuple)))  # list of PhotoSize
@@ -390,80 +369,18 @@ class Message(UpdateType):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(Message, self).to_array()
-        array['message_id'] = int(self.message_id)  # type int
-        array['date'] = int(self.date)  # type int
-        array['chat'] = self.chat.to_array()  # type Chat
-        if self.from_peer is not None:
-            array['from'] = self.from_peer.to_array()  # type User
-        if self.forward_from is not None:
-            array['forward_from'] = self.forward_from.to_array()  # type User
-        if self.forward_from_chat is not None:
-            array['forward_from_chat'] = self.forward_from_chat.to_array()  # type Chat
-        if self.forward_from_message_id is not None:
-            array['forward_from_message_id'] = int(self.forward_from_message_id)  # type int
-        if self.forward_date is not None:
-            array['forward_date'] = int(self.forward_date)  # type int
-        if self.reply_to_message is not None:
-            array['reply_to_message'] = self.reply_to_message.to_array()  # type Message
-        if self.edit_date is not None:
-            array['edit_date'] = int(self.edit_date)  # type int
-        if self.text is not None:
-            array['text'] = str(self.text)  # type str
-        if self.entities is not None:
-            array['entities'] = self._as_array(self.entities)  # type list of MessageEntity
-        if self.audio is not None:
-            array['audio'] = self.audio.to_array()  # type Audio
-        if self.document is not None:
-            array['document'] = self.document.to_array()  # type Document
-        if self.game is not None:
-            array['game'] = self.game.to_array()  # type Game
-        if self.photo is not None:
-            array['photo'] = self._as_array(self.photo)  # type list of PhotoSize
-        if self.sticker is not None:
-            array['sticker'] = self.sticker.to_array()  # type Sticker
-        if self.video is not None:
-            array['video'] = self.video.to_array()  # type Video
-        if self.voice is not None:
-            array['voice'] = self.voice.to_array()  # type Voice
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.contact is not None:
-            array['contact'] = self.contact.to_array()  # type Contact
-        if self.location is not None:
-            array['location'] = self.location.to_array()  # type Location
-        if self.venue is not None:
-            array['venue'] = self.venue.to_array()  # type Venue
-        if self.new_chat_member is not None:
-            array['new_chat_member'] = self.new_chat_member.to_array()  # type User
-        if self.left_chat_member is not None:
-            array['left_chat_member'] = self.left_chat_member.to_array()  # type User
-        if self.new_chat_title is not None:
-            array['new_chat_title'] = str(self.new_chat_title)  # type str
-        if self.new_chat_photo is not None:
-            array['new_chat_photo'] = self._as_array(self.new_chat_photo)  # type list of PhotoSize
-        if self.delete_chat_photo is not None:
-            array['delete_chat_photo'] = bool(self.delete_chat_photo)  # type bool
-        if self.group_chat_created is not None:
-            array['group_chat_created'] = bool(self.group_chat_created)  # type bool
-        if self.supergroup_chat_created is not None:
-            array['supergroup_chat_created'] = bool(self.supergroup_chat_created)  # type bool
-        if self.channel_chat_created is not None:
-            array['channel_chat_created'] = bool(self.channel_chat_created)  # type bool
-        if self.migrate_to_chat_id is not None:
-            array['migrate_to_chat_id'] = int(self.migrate_to_chat_id)  # type int
-        if self.migrate_from_chat_id is not None:
-            array['migrate_from_chat_id'] = int(self.migrate_from_chat_id)  # type int
-        if self.pinned_message is not None:
-            array['pinned_message'] = self.pinned_message.to_array()  # type Message
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
-    def from_array(array):
+    def from_array(array, fields=None):
         """
         Deserializes a new Message from a given dictionary.
 
+        :keyword fields: Only decode those attributes, e.g. `["chat.id", "text"]`. All others are `None`.
+                         See :func:`pytgbot.api_types.engine.projector`. Default: decode everything.
+        :type    fields: list of str
+
         :return: new Message instance.
         :rtype: Message
         """
@@ -471,47 +388,10 @@ class Message(UpdateType):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from ..receivable.peer import User, Chat
-        from ..receivable.media import Audio, Sticker, Video, Voice, Contact, Location, Venue, Document, MessageEntity
-        from ..receivable.media import PhotoSize, Game
-
-        data = {}
-        data['message_id'] = int(array.get('message_id'))
-        data['date'] = int(array.get('date'))
-        data['chat'] = Chat.from_array(array.get('chat'))
-        data['from_peer'] = User.from_array(array.get('from')) if array.get('from') is not None else None
-        data['forward_from'] = User.from_array(array.get('forward_from')) if array.get('forward_from') is not None else None
-        data['forward_from_chat'] = Chat.from_array(array.get('forward_from_chat')) if array.get('forward_from_chat') is not None else None
-        data['forward_from_message_id'] = int(array.get('forward_from_message_id')) if array.get('forward_from_message_id') is not None else None
-        data['forward_date'] = int(array.get('forward_date')) if array.get('forward_date') is not None else None
-        data['reply_to_message'] = Message.from_array(array.get('reply_to_message')) if array.get('reply_to_message') is not None else None
-        data['edit_date'] = int(array.get('edit_date')) if array.get('edit_date') is not None else None
-        data['text'] = str(array.get('text')) if array.get('text') is not None else None
-        data['entities'] = MessageEntity.from_array_list(array.get('entities'), list_level=1) if array.get('entities') is not None else None
-        data['audio'] = Audio.from_array(array.get('audio')) if array.get('audio') is not None else None
-        data['document'] = Document.from_array(array.get('document')) if array.get('document') is not None else None
-        data['game'] = Game.from_array(array.get('game')) if array.get('game') is not None else None
-        data['photo'] = PhotoSize.from_array_list(array.get('photo'), list_level=1) if array.get('photo') is not None else None
-        data['sticker'] = Sticker.from_array(array.get('sticker')) if array.get('sticker') is not None else None
-        data['video'] = Video.from_array(array.get('video')) if array.get('video') is not None else None
-        data['voice'] = Voice.from_array(array.get('voice')) if array.get('voice') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['contact'] = Contact.from_array(array.get('contact')) if array.get('contact') is not None else None
-        data['location'] = Location.from_array(array.get('location')) if array.get('location') is not None else None
-        data['venue'] = Venue.from_array(array.get('venue')) if array.get('venue') is not None else None
-        data['new_chat_member'] = User.from_array(array.get('new_chat_member')) if array.get('new_chat_member') is not None else None
-        data['left_chat_member'] = User.from_array(array.get('left_chat_member')) if array.get('left_chat_member') is not None else None
-        data['new_chat_title'] = str(array.get('new_chat_title')) if array.get('new_chat_title') is not None else None
-        data['new_chat_photo'] = PhotoSize.from_array_list(array.get('new_chat_photo'), list_level=1) if array.get('new_chat_photo') is not None else None
-        data['delete_chat_photo'] = bool(array.get('delete_chat_photo')) if array.get('delete_chat_photo') is not None else None
-        data['group_chat_created'] = bool(array.get('group_chat_created')) if array.get('group_chat_created') is not None else None
-        data['supergroup_chat_created'] = bool(array.get('supergroup_chat_created')) if array.get('supergroup_chat_created') is not None else None
-        data['channel_chat_created'] = bool(array.get('channel_chat_created')) if array.get('channel_chat_created') is not None else None
-        data['migrate_to_chat_id'] = int(array.get('migrate_to_chat_id')) if array.get('migrate_to_chat_id') is not None else None
-        data['migrate_from_chat_id'] = int(array.get('migrate_from_chat_id')) if array.get('migrate_from_chat_id') is not None else None
-        data['pinned_message'] = Message.from_array(array.get('pinned_message')) if array.get('pinned_message') is not None else None
-        return Message(**data)
+        if fields is not None:
+            return projector(Message, fields)(array)
+        # end if
+        return decode(Message, array)
     # end def from_array
 
     def __str__(self):
@@ -538,6 +418,8 @@ class CallbackQuery(UpdateType):
 
     https://core.telegram.org/bots/api#callbackquery
     """
+    __slots__ = ["id", "from_peer", "chat_instance", "message", "inline_message_id", "data", "game_short_name"]
+
     def __init__(self, id, from_peer, chat_instance, message=None, inline_message_id=None, data=None, game_short_name=None):
         """
         This object represents an incoming callback query from a callback button in an inline keyboard. If the button that originated the query was attached to a message sent by the bot, the field message will be present. If the button was attached to a message sent via the bot (in inline mode), the field inline_message_id will be present. Exactly one of the fields data or game_short_name will be present.
@@ -546,7 +428,6 @@ class CallbackQuery(UpdateType):
     
         https://core.telegram.org/bots/api#callbackquery
 
-
         Parameters:
 
         :param id: Unique identifier for this query
@@ -558,7 +439,6 @@ class CallbackQuery(UpdateType):
         :param chat_instance: Global identifier, uniquely corresponding to the chat to which the message with the callback button was sent. Useful for high scores in games.
         :type  chat_instance: str
 
-
         Optional keyword parameters:
 
         :keyword message: Optional. Message with the callback button that originated the query. Note that message content and message date will not be available if the message is too old
@@ -575,10 +455,8 @@ class CallbackQuery(UpdateType):
         """
         super(CallbackQuery, self).__init__()
 
-        from ..receivable.peer import User
-
         assert(id is not None)
-        assert(isinstance(id, str))
+        assert(isinstance(id, unicode_type))
         self.id = id
 
         assert(from_peer is not None)
@@ -586,19 +464,19 @@ class CallbackQuery(UpdateType):
         self.from_peer = from_peer
 
         assert(chat_instance is not None)
-        assert(isinstance(chat_instance, str))
+        assert(isinstance(chat_instance, unicode_type))
         self.chat_instance = chat_instance
 
         assert(message is None or isinstance(message, Message))
         self.message = message
 
-        assert(inline_message_id is None or isinstance(inline_message_id, str))
+        assert(inline_message_id is None or isinstance(inline_message_id, unicode_type))
         self.inline_message_id = inline_message_id
         
-        assert(data is None or isinstance(data, str))
+        assert(data is None or isinstance(data, unicode_type))
         self.data = data
         
-        assert(game_short_name is None or isinstance(game_short_name, str))
+        assert(game_short_name is None or isinstance(game_short_name, unicode_type))
         self.game_short_name = game_short_name
     # end def __init__
 
@@ -609,19 +487,7 @@ class CallbackQuery(UpdateType):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(CallbackQuery, self).to_array()
-        array['id'] = str(self.id)  # type str
-        array['from'] = self.from_peer.to_array()  # type User
-        array['chat_instance'] = str(self.chat_instance)  # type str
-        if self.message is not None:
-            array['message'] = self.message.to_array()  # type Message
-        if self.inline_message_id is not None:
-            array['inline_message_id'] = str(self.inline_message_id)  # type str
-        if self.data is not None:
-            array['data'] = str(self.data)  # type str
-        if self.game_short_name is not None:
-            array['game_short_name'] = str(self.game_short_name)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -636,18 +502,7 @@ class CallbackQuery(UpdateType):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from ..receivable.peer import User
-
-        data = {}
-        data['id'] = str(array.get('id'))
-        data['from_peer'] = User.from_array(array.get('from'))
-        data['chat_instance'] = str(array.get('chat_instance'))
-        data['message'] = Message.from_array(array.get('message')) if array.get('message') is not None else None
-        data['inline_message_id'] = str(array.get('inline_message_id')) if array.get('inline_message_id') is not None else None
-        data['data'] = str(array.get('data')) if array.get('data') is not None else None
-        data['game_short_name'] = str(array.get('game_short_name')) if array.get('game_short_name') is not None else None
-        return CallbackQuery(**data)
+        return decode(CallbackQuery, array)
     # end def from_array
 
     def __str__(self):
@@ -670,6 +525,8 @@ class CallbackGame(UpdateType):
     """
     A placeholder, currently holds no information. Use BotFather to set up your game.
     """
+    __slots__ = []
+
     def to_array(self):
         return {}
     # end def
@@ -678,6 +535,10 @@ class CallbackGame(UpdateType):
     def from_array(array):
         return CallbackGame()
     # end def
+
+    def __hash__(self):
+        return hash(CallbackGame)  # no fields, all are equal.
+    # end def __hash__
 # end class
 
 
@@ -687,6 +548,8 @@ class ResponseParameters(Receivable):
 
     https://core.telegram.org/bots/api#responseparameters
     """
+    __slots__ = ["migrate_to_chat_id", "retry_after"]
+
     def __init__(self, migrate_to_chat_id=None, retry_after=None):
         """
         Contains information about why a request was unsuccessfull.
@@ -716,12 +579,7 @@ class ResponseParameters(Receivable):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(ResponseParameters, self).to_array()
-        if self.migrate_to_chat_id is not None:
-            array['migrate_to_chat_id'] = int(self.migrate_to_chat_id)  # type int
-        if self.retry_after is not None:
-            array['retry_after'] = int(self.retry_after)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -736,11 +594,7 @@ class ResponseParameters(Receivable):
             return None
         # end if
         assert(isinstance(array, dict))
-        
-        data = {}
-        data['migrate_to_chat_id'] = int(array.get('migrate_to_chat_id')) if array.get('migrate_to_chat_id') is not None else None
-        data['retry_after'] = int(array.get('retry_after')) if array.get('retry_after') is not None else None
-        return ResponseParameters(**data)
+        return decode(ResponseParameters, array)
     # end def from_array
 
     def __str__(self):
@@ -758,3 +612,5 @@ class ResponseParameters(Receivable):
     # end def __contains__
 # end class ResponseParameters
 
+
+from .inline import InlineQuery, ChosenInlineResult  # bottom of file, as inline.py needs UpdateType from here.
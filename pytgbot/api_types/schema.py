@@ -0,0 +1,477 @@
+# -*- coding: utf-8 -*-
+"""
+The fields of the api types, as data.
+
+Generated by `code_generation` from the api documentation, like the classes themselves (see `schema.template`).
+Used by :mod:`pytgbot.api_types.engine`.
+
+`SCHEMA` maps the import path of each class to its fields, in api order.
+Each field is a tuple of `(attribute, json key, type, list level, optional, constant)`:
+
+- `type` is the name of a builtin (`"int"`, `"str"`, `"bool"`, `"float"`) or the import path of an api type.
+- `list level` is how often it's wrapped in a list, e.g. `2` for `list of list of KeyboardButton`.
+- `constant` is `None`, or the value the field always has, e.g. the `type` of inline query results.
+"""
+__author__ = 'luckydonald'
+
+SCHEMA = {
+    "pytgbot.api_types.receivable.WebhookInfo": (
+        ('url', 'url', 'str', 0, False, None),
+        ('has_custom_certificate', 'has_custom_certificate', 'bool', 0, False, None),
+        ('pending_update_count', 'pending_update_count', 'int', 0, False, None),
+        ('last_error_date', 'last_error_date', 'int', 0, True, None),
+        ('last_error_message', 'last_error_message', 'str', 0, True, None),
+        ('max_connections', 'max_connections', 'int', 0, True, None),
+        ('allowed_updates', 'allowed_updates', 'str', 1, True, None),
+    ),
+    "pytgbot.api_types.receivable.peer.User": (
+        ('id', 'id', 'int', 0, False, None),
+        ('first_name', 'first_name', 'str', 0, False, None),
+        ('last_name', 'last_name', 'str', 0, True, None),
+        ('username', 'username', 'str', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.peer.Chat": (
+        ('id', 'id', 'int', 0, False, None),
+        ('type', 'type', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('username', 'username', 'str', 0, True, None),
+        ('first_name', 'first_name', 'str', 0, True, None),
+        ('last_name', 'last_name', 'str', 0, True, None),
+        ('all_members_are_administrators', 'all_members_are_administrators', 'bool', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.peer.ChatMember": (
+        ('user', 'user', 'pytgbot.api_types.receivable.peer.User', 0, False, None),
+        ('status', 'status', 'str', 0, False, None),
+    ),
+    "pytgbot.api_types.receivable.media.MessageEntity": (
+        ('type', 'type', 'str', 0, False, None),
+        ('offset', 'offset', 'int', 0, False, None),
+        ('length', 'length', 'int', 0, False, None),
+        ('url', 'url', 'str', 0, True, None),
+        ('user', 'user', 'pytgbot.api_types.receivable.peer.User', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.PhotoSize": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('width', 'width', 'int', 0, False, None),
+        ('height', 'height', 'int', 0, False, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Audio": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('duration', 'duration', 'int', 0, False, None),
+        ('performer', 'performer', 'str', 0, True, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('mime_type', 'mime_type', 'str', 0, True, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Document": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('thumb', 'thumb', 'pytgbot.api_types.receivable.media.PhotoSize', 0, True, None),
+        ('file_name', 'file_name', 'str', 0, True, None),
+        ('mime_type', 'mime_type', 'str', 0, True, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Sticker": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('width', 'width', 'int', 0, False, None),
+        ('height', 'height', 'int', 0, False, None),
+        ('thumb', 'thumb', 'pytgbot.api_types.receivable.media.PhotoSize', 0, True, None),
+        ('emoji', 'emoji', 'str', 0, True, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Video": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('width', 'width', 'int', 0, False, None),
+        ('height', 'height', 'int', 0, False, None),
+        ('duration', 'duration', 'int', 0, False, None),
+        ('thumb', 'thumb', 'pytgbot.api_types.receivable.media.PhotoSize', 0, True, None),
+        ('mime_type', 'mime_type', 'str', 0, True, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Voice": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('duration', 'duration', 'int', 0, False, None),
+        ('mime_type', 'mime_type', 'str', 0, True, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Contact": (
+        ('phone_number', 'phone_number', 'str', 0, False, None),
+        ('first_name', 'first_name', 'str', 0, False, None),
+        ('last_name', 'last_name', 'str', 0, True, None),
+        ('user_id', 'user_id', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Location": (
+        ('longitude', 'longitude', 'float', 0, False, None),
+        ('latitude', 'latitude', 'float', 0, False, None),
+    ),
+    "pytgbot.api_types.receivable.media.Venue": (
+        ('location', 'location', 'pytgbot.api_types.receivable.media.Location', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('address', 'address', 'str', 0, False, None),
+        ('foursquare_id', 'foursquare_id', 'str', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.UserProfilePhotos": (
+        ('total_count', 'total_count', 'int', 0, False, None),
+        ('photos', 'photos', 'pytgbot.api_types.receivable.media.PhotoSize', 2, False, None),
+    ),
+    "pytgbot.api_types.receivable.media.File": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+        ('file_path', 'file_path', 'str', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Game": (
+        ('title', 'title', 'str', 0, False, None),
+        ('description', 'description', 'str', 0, False, None),
+        ('photo', 'photo', 'pytgbot.api_types.receivable.media.PhotoSize', 1, False, None),
+        ('text', 'text', 'str', 0, True, None),
+        ('text_entities', 'text_entities', 'pytgbot.api_types.receivable.media.MessageEntity', 1, True, None),
+        ('animation', 'animation', 'pytgbot.api_types.receivable.media.Animation', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.media.Animation": (
+        ('file_id', 'file_id', 'str', 0, False, None),
+        ('thumb', 'thumb', 'pytgbot.api_types.receivable.media.PhotoSize', 0, True, None),
+        ('file_name', 'file_name', 'str', 0, True, None),
+        ('mime_type', 'mime_type', 'str', 0, True, None),
+        ('file_size', 'file_size', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.updates.Update": (
+        ('update_id', 'update_id', 'int', 0, False, None),
+        ('message', 'message', 'pytgbot.api_types.receivable.updates.Message', 0, True, None),
+        ('edited_message', 'edited_message', 'pytgbot.api_types.receivable.updates.Message', 0, True, None),
+        ('channel_post', 'channel_post', 'pytgbot.api_types.receivable.updates.Message', 0, True, None),
+        ('edited_channel_post', 'edited_channel_post', 'pytgbot.api_types.receivable.updates.Message', 0, True, None),
+        ('inline_query', 'inline_query', 'pytgbot.api_types.receivable.inline.InlineQuery', 0, True, None),
+        ('chosen_inline_result', 'chosen_inline_result', 'pytgbot.api_types.receivable.inline.ChosenInlineResult', 0, True, None),
+        ('callback_query', 'callback_query', 'pytgbot.api_types.receivable.updates.CallbackQuery', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.updates.Message": (
+        ('message_id', 'message_id', 'int', 0, False, None),
+        ('date', 'date', 'int', 0, False, None),
+        ('chat', 'chat', 'pytgbot.api_types.receivable.peer.Chat', 0, False, None),
+        ('from_peer', 'from', 'pytgbot.api_types.receivable.peer.User', 0, True, None),
+        ('forward_from', 'forward_from', 'pytgbot.api_types.receivable.peer.User', 0, True, None),
+        ('forward_from_chat', 'forward_from_chat', 'pytgbot.api_types.receivable.peer.Chat', 0, True, None),
+        ('forward_from_message_id', 'forward_from_message_id', 'int', 0, True, None),
+        ('forward_date', 'forward_date', 'int', 0, True, None),
+        ('reply_to_message', 'reply_to_message', 'pytgbot.api_types.receivable.updates.Message', 0, True, None),
+        ('edit_date', 'edit_date', 'int', 0, True, None),
+        ('text', 'text', 'str', 0, True, None),
+        ('entities', 'entities', 'pytgbot.api_types.receivable.media.MessageEntity', 1, True, None),
+        ('audio', 'audio', 'pytgbot.api_types.receivable.media.Audio', 0, True, None),
+        ('document', 'document', 'pytgbot.api_types.receivable.media.Document', 0, True, None),
+        ('game', 'game', 'pytgbot.api_types.receivable.media.Game', 0, True, None),
+        ('photo', 'photo', 'pytgbot.api_types.receivable.media.PhotoSize', 1, True, None),
+        ('sticker', 'sticker', 'pytgbot.api_types.receivable.media.Sticker', 0, True, None),
+        ('video', 'video', 'pytgbot.api_types.receivable.media.Video', 0, True, None),
+        ('voice', 'voice', 'pytgbot.api_types.receivable.media.Voice', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('contact', 'contact', 'pytgbot.api_types.receivable.media.Contact', 0, True, None),
+        ('location', 'location', 'pytgbot.api_types.receivable.media.Location', 0, True, None),
+        ('venue', 'venue', 'pytgbot.api_types.receivable.media.Venue', 0, True, None),
+        ('new_chat_member', 'new_chat_member', 'pytgbot.api_types.receivable.peer.User', 0, True, None),
+        ('left_chat_member', 'left_chat_member', 'pytgbot.api_types.receivable.peer.User', 0, True, None),
+        ('new_chat_title', 'new_chat_title', 'str', 0, True, None),
+        ('new_chat_photo', 'new_chat_photo', 'pytgbot.api_types.receivable.media.PhotoSize', 1, True, None),
+        ('delete_chat_photo', 'delete_chat_photo', 'bool', 0, True, None),
+        ('group_chat_created', 'group_chat_created', 'bool', 0, True, None),
+        ('supergroup_chat_created', 'supergroup_chat_created', 'bool', 0, True, None),
+        ('channel_chat_created', 'channel_chat_created', 'bool', 0, True, None),
+        ('migrate_to_chat_id', 'migrate_to_chat_id', 'int', 0, True, None),
+        ('migrate_from_chat_id', 'migrate_from_chat_id', 'int', 0, True, None),
+        ('pinned_message', 'pinned_message', 'pytgbot.api_types.receivable.updates.Message', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.updates.CallbackQuery": (
+        ('id', 'id', 'str', 0, False, None),
+        ('from_peer', 'from', 'pytgbot.api_types.receivable.peer.User', 0, False, None),
+        ('chat_instance', 'chat_instance', 'str', 0, False, None),
+        ('message', 'message', 'pytgbot.api_types.receivable.updates.Message', 0, True, None),
+        ('inline_message_id', 'inline_message_id', 'str', 0, True, None),
+        ('data', 'data', 'str', 0, True, None),
+        ('game_short_name', 'game_short_name', 'str', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.updates.ResponseParameters": (
+        ('migrate_to_chat_id', 'migrate_to_chat_id', 'int', 0, True, None),
+        ('retry_after', 'retry_after', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.inline.InlineQuery": (
+        ('id', 'id', 'str', 0, False, None),
+        ('from_peer', 'from', 'pytgbot.api_types.receivable.peer.User', 0, False, None),
+        ('query', 'query', 'str', 0, False, None),
+        ('offset', 'offset', 'str', 0, False, None),
+        ('location', 'location', 'pytgbot.api_types.receivable.media.Location', 0, True, None),
+    ),
+    "pytgbot.api_types.receivable.inline.ChosenInlineResult": (
+        ('result_id', 'result_id', 'str', 0, False, None),
+        ('from_peer', 'from', 'pytgbot.api_types.receivable.peer.User', 0, False, None),
+        ('query', 'query', 'str', 0, False, None),
+        ('location', 'location', 'pytgbot.api_types.receivable.media.Location', 0, True, None),
+        ('inline_message_id', 'inline_message_id', 'str', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.reply_markup.ReplyKeyboardMarkup": (
+        ('keyboard', 'keyboard', 'pytgbot.api_types.sendable.reply_markup.KeyboardButton', 2, False, None),
+        ('resize_keyboard', 'resize_keyboard', 'bool', 0, True, None),
+        ('one_time_keyboard', 'one_time_keyboard', 'bool', 0, True, None),
+        ('selective', 'selective', 'bool', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.reply_markup.KeyboardButton": (
+        ('text', 'text', 'str', 0, False, None),
+        ('request_contact', 'request_contact', 'bool', 0, True, None),
+        ('request_location', 'request_location', 'bool', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.reply_markup.ReplyKeyboardRemove": (
+        ('remove_keyboard', 'remove_keyboard', 'bool', 0, False, True),
+        ('selective', 'selective', 'bool', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup": (
+        ('inline_keyboard', 'inline_keyboard', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardButton', 2, False, None),
+    ),
+    "pytgbot.api_types.sendable.reply_markup.InlineKeyboardButton": (
+        ('text', 'text', 'str', 0, False, None),
+        ('url', 'url', 'str', 0, True, None),
+        ('callback_data', 'callback_data', 'str', 0, True, None),
+        ('switch_inline_query', 'switch_inline_query', 'str', 0, True, None),
+        ('switch_inline_query_current_chat', 'switch_inline_query_current_chat', 'str', 0, True, None),
+        ('callback_game', 'callback_game', 'pytgbot.api_types.receivable.updates.CallbackGame', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.reply_markup.ForceReply": (
+        ('force_reply', 'force_reply', 'bool', 0, False, True),
+        ('selective', 'selective', 'bool', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultArticle": (
+        ('type', 'type', 'str', 0, False, 'article'),
+        ('id', 'id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, False, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('url', 'url', 'str', 0, True, None),
+        ('hide_url', 'hide_url', 'bool', 0, True, None),
+        ('description', 'description', 'str', 0, True, None),
+        ('thumb_url', 'thumb_url', 'str', 0, True, None),
+        ('thumb_width', 'thumb_width', 'int', 0, True, None),
+        ('thumb_height', 'thumb_height', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultPhoto": (
+        ('type', 'type', 'str', 0, False, 'photo'),
+        ('id', 'id', 'str', 0, False, None),
+        ('photo_url', 'photo_url', 'str', 0, False, None),
+        ('thumb_url', 'thumb_url', 'str', 0, False, None),
+        ('photo_width', 'photo_width', 'int', 0, True, None),
+        ('photo_height', 'photo_height', 'int', 0, True, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('description', 'description', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultGif": (
+        ('type', 'type', 'str', 0, False, 'gif'),
+        ('id', 'id', 'str', 0, False, None),
+        ('gif_url', 'gif_url', 'str', 0, False, None),
+        ('thumb_url', 'thumb_url', 'str', 0, False, None),
+        ('gif_width', 'gif_width', 'int', 0, True, None),
+        ('gif_height', 'gif_height', 'int', 0, True, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultMpeg4Gif": (
+        ('type', 'type', 'str', 0, False, 'mpeg4_gif'),
+        ('id', 'id', 'str', 0, False, None),
+        ('mpeg4_url', 'mpeg4_url', 'str', 0, False, None),
+        ('thumb_url', 'thumb_url', 'str', 0, False, None),
+        ('mpeg4_width', 'mpeg4_width', 'int', 0, True, None),
+        ('mpeg4_height', 'mpeg4_height', 'int', 0, True, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultVideo": (
+        ('type', 'type', 'str', 0, False, 'video'),
+        ('id', 'id', 'str', 0, False, None),
+        ('video_url', 'video_url', 'str', 0, False, None),
+        ('mime_type', 'mime_type', 'str', 0, False, None),
+        ('thumb_url', 'thumb_url', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('video_width', 'video_width', 'int', 0, True, None),
+        ('video_height', 'video_height', 'int', 0, True, None),
+        ('video_duration', 'video_duration', 'int', 0, True, None),
+        ('description', 'description', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultAudio": (
+        ('type', 'type', 'str', 0, False, 'audio'),
+        ('id', 'id', 'str', 0, False, None),
+        ('audio_url', 'audio_url', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('performer', 'performer', 'str', 0, True, None),
+        ('audio_duration', 'audio_duration', 'int', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultVoice": (
+        ('type', 'type', 'str', 0, False, 'voice'),
+        ('id', 'id', 'str', 0, False, None),
+        ('voice_url', 'voice_url', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('voice_duration', 'voice_duration', 'int', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultDocument": (
+        ('type', 'type', 'str', 0, False, 'document'),
+        ('id', 'id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('document_url', 'document_url', 'str', 0, False, None),
+        ('mime_type', 'mime_type', 'str', 0, False, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('description', 'description', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+        ('thumb_url', 'thumb_url', 'str', 0, True, None),
+        ('thumb_width', 'thumb_width', 'int', 0, True, None),
+        ('thumb_height', 'thumb_height', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultLocation": (
+        ('type', 'type', 'str', 0, False, 'location'),
+        ('id', 'id', 'str', 0, False, None),
+        ('latitude', 'latitude', 'float', 0, False, None),
+        ('longitude', 'longitude', 'float', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+        ('thumb_url', 'thumb_url', 'str', 0, True, None),
+        ('thumb_width', 'thumb_width', 'int', 0, True, None),
+        ('thumb_height', 'thumb_height', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultVenue": (
+        ('type', 'type', 'str', 0, False, 'venue'),
+        ('id', 'id', 'str', 0, False, None),
+        ('latitude', 'latitude', 'float', 0, False, None),
+        ('longitude', 'longitude', 'float', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('address', 'address', 'str', 0, False, None),
+        ('foursquare_id', 'foursquare_id', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+        ('thumb_url', 'thumb_url', 'str', 0, True, None),
+        ('thumb_width', 'thumb_width', 'int', 0, True, None),
+        ('thumb_height', 'thumb_height', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultContact": (
+        ('type', 'type', 'str', 0, False, 'contact'),
+        ('id', 'id', 'str', 0, False, None),
+        ('phone_number', 'phone_number', 'str', 0, False, None),
+        ('first_name', 'first_name', 'str', 0, False, None),
+        ('last_name', 'last_name', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+        ('thumb_url', 'thumb_url', 'str', 0, True, None),
+        ('thumb_width', 'thumb_width', 'int', 0, True, None),
+        ('thumb_height', 'thumb_height', 'int', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultGame": (
+        ('type', 'type', 'str', 0, False, 'game'),
+        ('id', 'id', 'str', 0, False, None),
+        ('game_short_name', 'game_short_name', 'str', 0, False, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedPhoto": (
+        ('type', 'type', 'str', 0, False, 'photo'),
+        ('id', 'id', 'str', 0, False, None),
+        ('photo_file_id', 'photo_file_id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('description', 'description', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedGif": (
+        ('type', 'type', 'str', 0, False, 'gif'),
+        ('id', 'id', 'str', 0, False, None),
+        ('gif_file_id', 'gif_file_id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedMpeg4Gif": (
+        ('type', 'type', 'str', 0, False, 'mpeg4_gif'),
+        ('id', 'id', 'str', 0, False, None),
+        ('mpeg4_file_id', 'mpeg4_file_id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedSticker": (
+        ('type', 'type', 'str', 0, False, 'sticker'),
+        ('id', 'id', 'str', 0, False, None),
+        ('sticker_file_id', 'sticker_file_id', 'str', 0, False, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedDocument": (
+        ('type', 'type', 'str', 0, False, 'document'),
+        ('id', 'id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('document_file_id', 'document_file_id', 'str', 0, False, None),
+        ('description', 'description', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedVideo": (
+        ('type', 'type', 'str', 0, False, 'video'),
+        ('id', 'id', 'str', 0, False, None),
+        ('video_file_id', 'video_file_id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('description', 'description', 'str', 0, True, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedVoice": (
+        ('type', 'type', 'str', 0, False, 'voice'),
+        ('id', 'id', 'str', 0, False, None),
+        ('voice_file_id', 'voice_file_id', 'str', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InlineQueryResultCachedAudio": (
+        ('type', 'type', 'str', 0, False, 'audio'),
+        ('id', 'id', 'str', 0, False, None),
+        ('audio_file_id', 'audio_file_id', 'str', 0, False, None),
+        ('caption', 'caption', 'str', 0, True, None),
+        ('reply_markup', 'reply_markup', 'pytgbot.api_types.sendable.reply_markup.InlineKeyboardMarkup', 0, True, None),
+        ('input_message_content', 'input_message_content', 'pytgbot.api_types.sendable.inline.InputMessageContent', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InputTextMessageContent": (
+        ('message_text', 'message_text', 'str', 0, False, None),
+        ('parse_mode', 'parse_mode', 'str', 0, True, None),
+        ('disable_web_page_preview', 'disable_web_page_preview', 'bool', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InputLocationMessageContent": (
+        ('latitude', 'latitude', 'float', 0, False, None),
+        ('longitude', 'longitude', 'float', 0, False, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InputVenueMessageContent": (
+        ('latitude', 'latitude', 'float', 0, False, None),
+        ('longitude', 'longitude', 'float', 0, False, None),
+        ('title', 'title', 'str', 0, False, None),
+        ('address', 'address', 'str', 0, False, None),
+        ('foursquare_id', 'foursquare_id', 'str', 0, True, None),
+    ),
+    "pytgbot.api_types.sendable.inline.InputContactMessageContent": (
+        ('phone_number', 'phone_number', 'str', 0, False, None),
+        ('first_name', 'first_name', 'str', 0, False, None),
+        ('last_name', 'last_name', 'str', 0, True, None),
+    ),
+}
@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 
 
 class Sendable(TgBotApiObject):
+    __slots__ = []
+
     def __init__(self):
         super(Sendable, self).__init__()
     # end def __init__
@@ -2,6 +2,8 @@
 from luckydonaldUtils.encoding import unicode_type, to_unicode as u
 from luckydonaldUtils.logger import logging
 
+from pytgbot.api_types.engine import decode, encode
+from pytgbot.api_types.limits import INLINE_QUERY_RESULT_ID
 from pytgbot.api_types.sendable import Sendable
 from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
 
@@ -9,6 +11,8 @@ __author__ = 'luckydonald'
 logger = logging.getLogger(__name__)
 
 class InlineQueryResult(Sendable):
+    __slots__ = ["id", "type"]
+
     def __init__(self, id, type):
         assert(id is not None)
         if not isinstance(id, unicode_type):
@@ -20,6 +24,7 @@ class InlineQueryResult(Sendable):
         super(InlineQueryResult, self).__init__()
 
     def to_array(self):
+        INLINE_QUERY_RESULT_ID.check(self.id, "InlineQueryResult.id")
         return {
             "type": self.type,
             "id": self.id,
@@ -29,11 +34,11 @@ class InlineQueryResult(Sendable):
 
 
 class InlineQueryCachedResult(InlineQueryResult):
-    pass
+    __slots__ = []
 
 
 class InputMessageContent(Sendable):
-    pass
+    __slots__ = []
 
 
 class InlineQueryResultArticle(InlineQueryResult):
@@ -42,6 +47,8 @@ class InlineQueryResultArticle(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultarticle
     """
+    __slots__ = ["title", "input_message_content", "reply_markup", "url", "hide_url", "description", "thumb_url", "thumb_width", "thumb_height"]
+
     def __init__(self, id, title, input_message_content, reply_markup=None, url=None, hide_url=None, description=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a link to an article or web page.
@@ -129,25 +136,7 @@ class InlineQueryResultArticle(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultArticle, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['title'] = str(self.title)  # type str
-        array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.url is not None:
-            array['url'] = str(self.url)  # type str
-        if self.hide_url is not None:
-            array['hide_url'] = bool(self.hide_url)  # type bool
-        if self.description is not None:
-            array['description'] = str(self.description)  # type str
-        if self.thumb_url is not None:
-            array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -162,22 +151,7 @@ class InlineQueryResultArticle(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['title'] = str(array.get('title'))
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content'))
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['url'] = str(array.get('url')) if array.get('url') is not None else None
-        data['hide_url'] = bool(array.get('hide_url')) if array.get('hide_url') is not None else None
-        data['description'] = str(array.get('description')) if array.get('description') is not None else None
-        data['thumb_url'] = str(array.get('thumb_url')) if array.get('thumb_url') is not None else None
-        data['thumb_width'] = int(array.get('thumb_width')) if array.get('thumb_width') is not None else None
-        data['thumb_height'] = int(array.get('thumb_height')) if array.get('thumb_height') is not None else None
-        return InlineQueryResultArticle(**data)
+        return decode(InlineQueryResultArticle, array)
     # end def from_array
 
     def __str__(self):
@@ -202,6 +176,8 @@ class InlineQueryResultPhoto(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultphoto
     """
+    __slots__ = ["photo_url", "thumb_url", "photo_width", "photo_height", "title", "description", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, photo_url, thumb_url, photo_width=None, photo_height=None, title=None, description=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a photo. By default, this photo will be sent by the user with optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the photo.
@@ -289,25 +265,7 @@ class InlineQueryResultPhoto(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultPhoto, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['photo_url'] = str(self.photo_url)  # type str
-        array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.photo_width is not None:
-            array['photo_width'] = int(self.photo_width)  # type int
-        if self.photo_height is not None:
-            array['photo_height'] = int(self.photo_height)  # type int
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.description is not None:
-            array['description'] = str(self.description)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -322,22 +280,7 @@ class InlineQueryResultPhoto(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['photo_url'] = str(array.get('photo_url'))
-        data['thumb_url'] = str(array.get('thumb_url'))
-        data['photo_width'] = int(array.get('photo_width')) if array.get('photo_width') is not None else None
-        data['photo_height'] = int(array.get('photo_height')) if array.get('photo_height') is not None else None
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['description'] = str(array.get('description')) if array.get('description') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultPhoto(**data)
+        return decode(InlineQueryResultPhoto, array)
     # end def from_array
 
     def __str__(self):
@@ -362,6 +305,8 @@ class InlineQueryResultGif(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultgif
     """
+    __slots__ = ["gif_url", "thumb_url", "gif_width", "gif_height", "title", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, gif_url, thumb_url, gif_width=None, gif_height=None, title=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an animated GIF file. By default, this animated GIF file will be sent by the user with optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the animation.
@@ -443,23 +388,7 @@ class InlineQueryResultGif(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultGif, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['gif_url'] = str(self.gif_url)  # type str
-        array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.gif_width is not None:
-            array['gif_width'] = int(self.gif_width)  # type int
-        if self.gif_height is not None:
-            array['gif_height'] = int(self.gif_height)  # type int
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -474,21 +403,7 @@ class InlineQueryResultGif(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['gif_url'] = str(array.get('gif_url'))
-        data['thumb_url'] = str(array.get('thumb_url'))
-        data['gif_width'] = int(array.get('gif_width')) if array.get('gif_width') is not None else None
-        data['gif_height'] = int(array.get('gif_height')) if array.get('gif_height') is not None else None
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultGif(**data)
+        return decode(InlineQueryResultGif, array)
     # end def from_array
 
     def __str__(self):
@@ -513,6 +428,8 @@ class InlineQueryResultMpeg4Gif(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultmpeg4gif
     """
+    __slots__ = ["mpeg4_url", "thumb_url", "mpeg4_width", "mpeg4_height", "title", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, mpeg4_url, thumb_url, mpeg4_width=None, mpeg4_height=None, title=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a video animation (H.264/MPEG-4 AVC video without sound). By default, this animated MPEG-4 file will be sent by the user with optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the animation.
@@ -594,23 +511,7 @@ class InlineQueryResultMpeg4Gif(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultMpeg4Gif, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['mpeg4_url'] = str(self.mpeg4_url)  # type str
-        array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.mpeg4_width is not None:
-            array['mpeg4_width'] = int(self.mpeg4_width)  # type int
-        if self.mpeg4_height is not None:
-            array['mpeg4_height'] = int(self.mpeg4_height)  # type int
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -625,21 +526,7 @@ class InlineQueryResultMpeg4Gif(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['mpeg4_url'] = str(array.get('mpeg4_url'))
-        data['thumb_url'] = str(array.get('thumb_url'))
-        data['mpeg4_width'] = int(array.get('mpeg4_width')) if array.get('mpeg4_width') is not None else None
-        data['mpeg4_height'] = int(array.get('mpeg4_height')) if array.get('mpeg4_height') is not None else None
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultMpeg4Gif(**data)
+        return decode(InlineQueryResultMpeg4Gif, array)
     # end def from_array
 
     def __str__(self):
@@ -664,6 +551,8 @@ class InlineQueryResultVideo(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultvideo
     """
+    __slots__ = ["video_url", "mime_type", "thumb_url", "title", "caption", "video_width", "video_height", "video_duration", "description", "reply_markup", "input_message_content"]
+
     def __init__(self, id, video_url, mime_type, thumb_url, title, caption=None, video_width=None, video_height=None, video_duration=None, description=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a page containing an embedded video player or a video file. By default, this video file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the video.
@@ -765,27 +654,7 @@ class InlineQueryResultVideo(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultVideo, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['video_url'] = str(self.video_url)  # type str
-        array['mime_type'] = str(self.mime_type)  # type str
-        array['thumb_url'] = str(self.thumb_url)  # type str
-        array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.video_width is not None:
-            array['video_width'] = int(self.video_width)  # type int
-        if self.video_height is not None:
-            array['video_height'] = int(self.video_height)  # type int
-        if self.video_duration is not None:
-            array['video_duration'] = int(self.video_duration)  # type int
-        if self.description is not None:
-            array['description'] = str(self.description)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -800,24 +669,7 @@ class InlineQueryResultVideo(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['video_url'] = str(array.get('video_url'))
-        data['mime_type'] = str(array.get('mime_type'))
-        data['thumb_url'] = str(array.get('thumb_url'))
-        data['title'] = str(array.get('title'))
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['video_width'] = int(array.get('video_width')) if array.get('video_width') is not None else None
-        data['video_height'] = int(array.get('video_height')) if array.get('video_height') is not None else None
-        data['video_duration'] = int(array.get('video_duration')) if array.get('video_duration') is not None else None
-        data['description'] = str(array.get('description')) if array.get('description') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultVideo(**data)
+        return decode(InlineQueryResultVideo, array)
     # end def from_array
 
     def __str__(self):
@@ -843,6 +695,8 @@ class InlineQueryResultAudio(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultaudio
     """
+    __slots__ = ["audio_url", "title", "caption", "performer", "audio_duration", "reply_markup", "input_message_content"]
+
     def __init__(self, id, audio_url, title, caption=None, performer=None, audio_duration=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an mp3 audio file. By default, this audio file will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the audio.
@@ -919,21 +773,7 @@ class InlineQueryResultAudio(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultAudio, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['audio_url'] = str(self.audio_url)  # type str
-        array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.performer is not None:
-            array['performer'] = str(self.performer)  # type str
-        if self.audio_duration is not None:
-            array['audio_duration'] = int(self.audio_duration)  # type int
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -948,20 +788,7 @@ class InlineQueryResultAudio(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['audio_url'] = str(array.get('audio_url'))
-        data['title'] = str(array.get('title'))
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['performer'] = str(array.get('performer')) if array.get('performer') is not None else None
-        data['audio_duration'] = int(array.get('audio_duration')) if array.get('audio_duration') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultAudio(**data)
+        return decode(InlineQueryResultAudio, array)
     # end def from_array
 
     def __str__(self):
@@ -987,6 +814,8 @@ class InlineQueryResultVoice(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultvoice
     """
+    __slots__ = ["voice_url", "title", "caption", "voice_duration", "reply_markup", "input_message_content"]
+
     def __init__(self, id, voice_url, title, caption=None, voice_duration=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a voice recording in an .ogg container encoded with OPUS. By default, this voice recording will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the the voice message.
@@ -1057,19 +886,7 @@ class InlineQueryResultVoice(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultVoice, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['voice_url'] = str(self.voice_url)  # type str
-        array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.voice_duration is not None:
-            array['voice_duration'] = int(self.voice_duration)  # type int
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1084,19 +901,7 @@ class InlineQueryResultVoice(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['voice_url'] = str(array.get('voice_url'))
-        data['title'] = str(array.get('title'))
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['voice_duration'] = int(array.get('voice_duration')) if array.get('voice_duration') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultVoice(**data)
+        return decode(InlineQueryResultVoice, array)
     # end def from_array
 
     def __str__(self):
@@ -1122,6 +927,8 @@ class InlineQueryResultDocument(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultdocument
     """
+    __slots__ = ["title", "document_url", "mime_type", "caption", "description", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
+
     def __init__(self, id, title, document_url, mime_type, caption=None, description=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a link to a file. By default, this file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the file. Currently, only .PDF and .ZIP files can be sent using this method.
@@ -1217,26 +1024,7 @@ class InlineQueryResultDocument(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultDocument, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['title'] = str(self.title)  # type str
-        array['document_url'] = str(self.document_url)  # type str
-        array['mime_type'] = str(self.mime_type)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.description is not None:
-            array['description'] = str(self.description)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        if self.thumb_url is not None:
-            array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1251,23 +1039,7 @@ class InlineQueryResultDocument(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['title'] = str(array.get('title'))
-        data['document_url'] = str(array.get('document_url'))
-        data['mime_type'] = str(array.get('mime_type'))
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['description'] = str(array.get('description')) if array.get('description') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        data['thumb_url'] = str(array.get('thumb_url')) if array.get('thumb_url') is not None else None
-        data['thumb_width'] = int(array.get('thumb_width')) if array.get('thumb_width') is not None else None
-        data['thumb_height'] = int(array.get('thumb_height')) if array.get('thumb_height') is not None else None
-        return InlineQueryResultDocument(**data)
+        return decode(InlineQueryResultDocument, array)
     # end def from_array
 
     def __str__(self):
@@ -1293,6 +1065,8 @@ class InlineQueryResultLocation(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultlocation
     """
+    __slots__ = ["latitude", "longitude", "title", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
+
     def __init__(self, id, latitude, longitude, title, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a location on a map. By default, the location will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the location.
@@ -1376,22 +1150,7 @@ class InlineQueryResultLocation(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultLocation, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        array['title'] = str(self.title)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        if self.thumb_url is not None:
-            array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1406,21 +1165,7 @@ class InlineQueryResultLocation(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['latitude'] = float(array.get('latitude'))
-        data['longitude'] = float(array.get('longitude'))
-        data['title'] = str(array.get('title'))
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        data['thumb_url'] = str(array.get('thumb_url')) if array.get('thumb_url') is not None else None
-        data['thumb_width'] = int(array.get('thumb_width')) if array.get('thumb_width') is not None else None
-        data['thumb_height'] = int(array.get('thumb_height')) if array.get('thumb_height') is not None else None
-        return InlineQueryResultLocation(**data)
+        return decode(InlineQueryResultLocation, array)
     # end def from_array
 
     def __str__(self):
@@ -1446,6 +1191,8 @@ class InlineQueryResultVenue(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultvenue
     """
+    __slots__ = ["latitude", "longitude", "title", "address", "foursquare_id", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
+
     def __init__(self, id, latitude, longitude, title, address, foursquare_id=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a venue. By default, the venue will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the venue.
@@ -1542,25 +1289,7 @@ class InlineQueryResultVenue(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultVenue, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        array['title'] = str(self.title)  # type str
-        array['address'] = str(self.address)  # type str
-        if self.foursquare_id is not None:
-            array['foursquare_id'] = str(self.foursquare_id)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        if self.thumb_url is not None:
-            array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1575,23 +1304,7 @@ class InlineQueryResultVenue(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['latitude'] = float(array.get('latitude'))
-        data['longitude'] = float(array.get('longitude'))
-        data['title'] = str(array.get('title'))
-        data['address'] = str(array.get('address'))
-        data['foursquare_id'] = str(array.get('foursquare_id')) if array.get('foursquare_id') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        data['thumb_url'] = str(array.get('thumb_url')) if array.get('thumb_url') is not None else None
-        data['thumb_width'] = int(array.get('thumb_width')) if array.get('thumb_width') is not None else None
-        data['thumb_height'] = int(array.get('thumb_height')) if array.get('thumb_height') is not None else None
-        return InlineQueryResultVenue(**data)
+        return decode(InlineQueryResultVenue, array)
     # end def from_array
 
     def __str__(self):
@@ -1617,6 +1330,8 @@ class InlineQueryResultContact(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcontact
     """
+    __slots__ = ["phone_number", "first_name", "last_name", "reply_markup", "input_message_content", "thumb_url", "thumb_width", "thumb_height"]
+
     def __init__(self, id, phone_number, first_name, last_name=None, reply_markup=None, input_message_content=None, thumb_url=None, thumb_width=None, thumb_height=None):
         """
         Represents a contact with a phone number. By default, this contact will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the contact.
@@ -1699,23 +1414,7 @@ class InlineQueryResultContact(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultContact, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['phone_number'] = str(self.phone_number)  # type str
-        array['first_name'] = str(self.first_name)  # type str
-        if self.last_name is not None:
-            array['last_name'] = str(self.last_name)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        if self.thumb_url is not None:
-            array['thumb_url'] = str(self.thumb_url)  # type str
-        if self.thumb_width is not None:
-            array['thumb_width'] = int(self.thumb_width)  # type int
-        if self.thumb_height is not None:
-            array['thumb_height'] = int(self.thumb_height)  # type int
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1730,21 +1429,7 @@ class InlineQueryResultContact(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # type is given by class type
-        data['id'] = str(array.get('id'))
-        data['phone_number'] = str(array.get('phone_number'))
-        data['first_name'] = str(array.get('first_name'))
-        data['last_name'] = str(array.get('last_name')) if array.get('last_name') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        data['thumb_url'] = str(array.get('thumb_url')) if array.get('thumb_url') is not None else None
-        data['thumb_width'] = int(array.get('thumb_width')) if array.get('thumb_width') is not None else None
-        data['thumb_height'] = int(array.get('thumb_height')) if array.get('thumb_height') is not None else None
-        return InlineQueryResultContact(**data)
+        return decode(InlineQueryResultContact, array)
     # end def from_array
 
     def __str__(self):
@@ -1771,6 +1456,8 @@ class InlineQueryResultGame(InlineQueryResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultgame
     """
+    __slots__ = ["game_short_name", "reply_markup"]
+
     def __init__(self, type, id, game_short_name, reply_markup=None):
         """
         Represents a Game.
@@ -1817,12 +1504,7 @@ class InlineQueryResultGame(InlineQueryResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultGame, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['game_short_name'] = str(self.game_short_name)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1837,15 +1519,7 @@ class InlineQueryResultGame(InlineQueryResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # type is given by class type
-        data['id'] = str(array.get('id'))
-        data['game_short_name'] = str(array.get('game_short_name'))
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        return InlineQueryResultGame(**data)
+        return decode(InlineQueryResultGame, array)
     # end def from_array
 
     def __str__(self):
@@ -1871,6 +1545,8 @@ class InlineQueryResultCachedPhoto(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcachedphoto
     """
+    __slots__ = ["photo_file_id", "title", "description", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, photo_file_id, title=None, description=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a photo stored on the Telegram servers. By default, this photo will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the photo.
@@ -1939,19 +1615,7 @@ class InlineQueryResultCachedPhoto(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedPhoto, self).to_array()
-        array['photo_file_id'] = str(self.photo_file_id)  # type str
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.description is not None:
-            array['description'] = str(self.description)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -1966,19 +1630,7 @@ class InlineQueryResultCachedPhoto(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['photo_file_id'] = str(array.get('photo_file_id'))
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['description'] = str(array.get('description')) if array.get('description') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedPhoto(**data)
+        return decode(InlineQueryResultCachedPhoto, array)
     # end def from_array
 
     def __str__(self):
@@ -2003,6 +1655,8 @@ class InlineQueryResultCachedGif(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcachedgif
     """
+    __slots__ = ["gif_file_id", "title", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, gif_file_id, title=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an animated GIF file stored on the Telegram servers. By default, this animated GIF file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with specified content instead of the animation.
@@ -2065,18 +1719,7 @@ class InlineQueryResultCachedGif(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedGif, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['gif_file_id'] = str(self.gif_file_id)  # type str
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2091,18 +1734,7 @@ class InlineQueryResultCachedGif(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # type is given by class type
-        data['id'] = str(array.get('id'))
-        data['gif_file_id'] = str(array.get('gif_file_id'))
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedGif(**data)
+        return decode(InlineQueryResultCachedGif, array)
     # end def from_array
 
     def __str__(self):
@@ -2127,6 +1759,8 @@ class InlineQueryResultCachedMpeg4Gif(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcachedmpeg4gif
     """
+    __slots__ = ["mpeg4_file_id", "title", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, mpeg4_file_id, title=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a video animation (H.264/MPEG-4 AVC video without sound) stored on the Telegram servers. By default, this animated MPEG-4 file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the animation.
@@ -2189,18 +1823,7 @@ class InlineQueryResultCachedMpeg4Gif(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedMpeg4Gif, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['mpeg4_file_id'] = str(self.mpeg4_file_id)  # type str
-        if self.title is not None:
-            array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2215,18 +1838,7 @@ class InlineQueryResultCachedMpeg4Gif(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['mpeg4_file_id'] = str(array.get('mpeg4_file_id'))
-        data['title'] = str(array.get('title')) if array.get('title') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedMpeg4Gif(**data)
+        return decode(InlineQueryResultCachedMpeg4Gif, array)
     # end def from_array
 
     def __str__(self):
@@ -2253,6 +1865,8 @@ class InlineQueryResultCachedSticker(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcachedsticker
     """
+    __slots__ = ["sticker_file_id", "reply_markup", "input_message_content"]
+
     def __init__(self, id, sticker_file_id, reply_markup=None, input_message_content=None):
         """
         Represents a link to a sticker stored on the Telegram servers. By default, this sticker will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the sticker.
@@ -2305,14 +1919,7 @@ class InlineQueryResultCachedSticker(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedSticker, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['sticker_file_id'] = str(self.sticker_file_id)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2327,16 +1934,7 @@ class InlineQueryResultCachedSticker(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['sticker_file_id'] = str(array.get('sticker_file_id'))
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedSticker(**data)
+        return decode(InlineQueryResultCachedSticker, array)
     # end def from_array
 
     def __str__(self):
@@ -2363,6 +1961,8 @@ class InlineQueryResultCachedDocument(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcacheddocument
     """
+    __slots__ = ["title", "document_file_id", "description", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, title, document_file_id, description=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a file stored on the Telegram servers. By default, this file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the file. Currently, only pdf-files and zip archives can be sent using this method.
@@ -2433,19 +2033,7 @@ class InlineQueryResultCachedDocument(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedDocument, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['title'] = str(self.title)  # type str
-        array['document_file_id'] = str(self.document_file_id)  # type str
-        if self.description is not None:
-            array['description'] = str(self.description)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2460,18 +2048,7 @@ class InlineQueryResultCachedDocument(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        data['id'] = str(array.get('id'))
-        data['title'] = str(array.get('title'))
-        data['document_file_id'] = str(array.get('document_file_id'))
-        data['description'] = str(array.get('description')) if array.get('description') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedDocument(**data)
+        return decode(InlineQueryResultCachedDocument, array)
     # end def from_array
 
     def __str__(self):
@@ -2496,6 +2073,8 @@ class InlineQueryResultCachedVideo(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcachedvideo
     """
+    __slots__ = ["video_file_id", "title", "description", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, video_file_id, title, description=None, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a video file stored on the Telegram servers. By default, this video file will be sent by the user with an optional caption. Alternatively, you can use input_message_content to send a message with the specified content instead of the video.
@@ -2565,19 +2144,7 @@ class InlineQueryResultCachedVideo(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedVideo, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['video_file_id'] = str(self.video_file_id)  # type str
-        array['title'] = str(self.title)  # type str
-        if self.description is not None:
-            array['description'] = str(self.description)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2592,19 +2159,7 @@ class InlineQueryResultCachedVideo(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['video_file_id'] = str(array.get('video_file_id'))
-        data['title'] = str(array.get('title'))
-        data['description'] = str(array.get('description')) if array.get('description') is not None else None
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedVideo(**data)
+        return decode(InlineQueryResultCachedVideo, array)
     # end def from_array
 
     def __str__(self):
@@ -2630,6 +2185,8 @@ class InlineQueryResultCachedVoice(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcachedvoice
     """
+    __slots__ = ["voice_file_id", "title", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, voice_file_id, title, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to a voice message stored on the Telegram servers. By default, this voice message will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the voice message.
@@ -2694,17 +2251,7 @@ class InlineQueryResultCachedVoice(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedVoice, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['voice_file_id'] = str(self.voice_file_id)  # type str
-        array['title'] = str(self.title)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2719,18 +2266,7 @@ class InlineQueryResultCachedVoice(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['voice_file_id'] = str(array.get('voice_file_id'))
-        data['title'] = str(array.get('title'))
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedVoice(**data)
+        return decode(InlineQueryResultCachedVoice, array)
     # end def from_array
 
     def __str__(self):
@@ -2756,6 +2292,8 @@ class InlineQueryResultCachedAudio(InlineQueryCachedResult):
 
     https://core.telegram.org/bots/api#inlinequeryresultcachedaudio
     """
+    __slots__ = ["audio_file_id", "caption", "reply_markup", "input_message_content"]
+
     def __init__(self, id, audio_file_id, caption=None, reply_markup=None, input_message_content=None):
         """
         Represents a link to an mp3 audio file stored on the Telegram servers. By default, this audio file will be sent by the user. Alternatively, you can use input_message_content to send a message with the specified content instead of the audio.
@@ -2813,16 +2351,7 @@ class InlineQueryResultCachedAudio(InlineQueryCachedResult):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineQueryResultCachedAudio, self).to_array()
-        # 'type' and 'id' given by superclass
-        array['audio_file_id'] = str(self.audio_file_id)  # type str
-        if self.caption is not None:
-            array['caption'] = str(self.caption)  # type str
-        if self.reply_markup is not None:
-            array['reply_markup'] = self.reply_markup.to_array()  # type InlineKeyboardMarkup
-        if self.input_message_content is not None:
-            array['input_message_content'] = self.input_message_content.to_array()  # type InputMessageContent
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2837,17 +2366,7 @@ class InlineQueryResultCachedAudio(InlineQueryCachedResult):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        from pytgbot.api_types.sendable.reply_markup import InlineKeyboardMarkup
-
-        data = {}
-        # 'type' is given by class type
-        data['id'] = str(array.get('id'))
-        data['audio_file_id'] = str(array.get('audio_file_id'))
-        data['caption'] = str(array.get('caption')) if array.get('caption') is not None else None
-        data['reply_markup'] = InlineKeyboardMarkup.from_array(array.get('reply_markup')) if array.get('reply_markup') is not None else None
-        data['input_message_content'] = InputMessageContent.from_array(array.get('input_message_content')) if array.get('input_message_content') is not None else None
-        return InlineQueryResultCachedAudio(**data)
+        return decode(InlineQueryResultCachedAudio, array)
     # end def from_array
 
     def __str__(self):
@@ -2872,6 +2391,8 @@ class InputTextMessageContent(InputMessageContent):
 
     https://core.telegram.org/bots/api#inputtextmessagecontent
     """
+    __slots__ = ["message_text", "parse_mode", "disable_web_page_preview"]
+
     def __init__(self, message_text, parse_mode=None, disable_web_page_preview=False):
         """
         Represents the content of a text message to be sent as the result of an inline query.
@@ -2912,13 +2433,7 @@ class InputTextMessageContent(InputMessageContent):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InputTextMessageContent, self).to_array()
-        array['message_text'] = str(self.message_text)  # type str
-        if self.parse_mode is not None:
-            array['parse_mode'] = str(self.parse_mode)  # type str
-        if self.disable_web_page_preview is not None:
-            array['disable_web_page_preview'] = bool(self.disable_web_page_preview)  # type bool
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -2933,12 +2448,7 @@ class InputTextMessageContent(InputMessageContent):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['message_text'] = str(array.get('message_text'))
-        data['parse_mode'] = str(array.get('parse_mode')) if array.get('parse_mode') is not None else None
-        data['disable_web_page_preview'] = bool(array.get('disable_web_page_preview')) if array.get('disable_web_page_preview') is not None else None
-        return InputTextMessageContent(**data)
+        return decode(InputTextMessageContent, array)
     # end def from_array
 
     def __str__(self):
@@ -2964,6 +2474,8 @@ class InputLocationMessageContent(InputMessageContent):
 
     https://core.telegram.org/bots/api#inputlocationmessagecontent
     """
+    __slots__ = ["latitude", "longitude"]
+
     def __init__(self, latitude, longitude):
         """
         Represents the content of a location message to be sent as the result of an inline query.
@@ -2997,10 +2509,7 @@ class InputLocationMessageContent(InputMessageContent):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InputLocationMessageContent, self).to_array()
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -3015,11 +2524,7 @@ class InputLocationMessageContent(InputMessageContent):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['latitude'] = float(array.get('latitude'))
-        data['longitude'] = float(array.get('longitude'))
-        return InputLocationMessageContent(**data)
+        return decode(InputLocationMessageContent, array)
     # end def from_array
 
     def __str__(self):
@@ -3045,6 +2550,8 @@ class InputVenueMessageContent(InputMessageContent):
 
     https://core.telegram.org/bots/api#inputvenuemessagecontent
     """
+    __slots__ = ["latitude", "longitude", "title", "address", "foursquare_id"]
+
     def __init__(self, latitude, longitude, title, address, foursquare_id=None):
         """
         Represents the content of a venue message to be sent as the result of an inline query.
@@ -3101,14 +2608,7 @@ class InputVenueMessageContent(InputMessageContent):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InputVenueMessageContent, self).to_array()
-        array['latitude'] = float(self.latitude)  # type float
-        array['longitude'] = float(self.longitude)  # type float
-        array['title'] = str(self.title)  # type str
-        array['address'] = str(self.address)  # type str
-        if self.foursquare_id is not None:
-            array['foursquare_id'] = str(self.foursquare_id)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -3123,14 +2623,7 @@ class InputVenueMessageContent(InputMessageContent):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['latitude'] = float(array.get('latitude'))
-        data['longitude'] = float(array.get('longitude'))
-        data['title'] = str(array.get('title'))
-        data['address'] = str(array.get('address'))
-        data['foursquare_id'] = str(array.get('foursquare_id')) if array.get('foursquare_id') is not None else None
-        return InputVenueMessageContent(**data)
+        return decode(InputVenueMessageContent, array)
     # end def from_array
 
     def __str__(self):
@@ -3156,6 +2649,8 @@ class InputContactMessageContent(InputMessageContent):
 
     https://core.telegram.org/bots/api#inputcontactmessagecontent
     """
+    __slots__ = ["phone_number", "first_name", "last_name"]
+
     def __init__(self, phone_number, first_name, last_name=None):
         """
         Represents the content of a contact message to be sent as the result of an inline query.
@@ -3198,12 +2693,7 @@ class InputContactMessageContent(InputMessageContent):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InputContactMessageContent, self).to_array()
-        array['phone_number'] = str(self.phone_number)  # type str
-        array['first_name'] = str(self.first_name)  # type str
-        if self.last_name is not None:
-            array['last_name'] = str(self.last_name)  # type str
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -3218,12 +2708,7 @@ class InputContactMessageContent(InputMessageContent):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['phone_number'] = str(array.get('phone_number'))
-        data['first_name'] = str(array.get('first_name'))
-        data['last_name'] = str(array.get('last_name')) if array.get('last_name') is not None else None
-        return InputContactMessageContent(**data)
+        return decode(InputContactMessageContent, array)
     # end def from_array
 
     def __str__(self):
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from luckydonaldUtils.encoding import unicode_type
 
 from pytgbot.api_types import as_array
+from pytgbot.api_types.engine import decode, encode
 from . import Sendable
 import logging
 
@@ -11,6 +11,8 @@ logger = logging.getLogger(__name__)
 
 
 class Button(Sendable):
+    __slots__ = []
+
     def __init__(self):
         super(Button, self).__init__()
     # end def __init__
@@ -18,6 +20,8 @@ class Button(Sendable):
 
 
 class ReplyMarkup(Sendable):
+    __slots__ = []
+
     def __init__(self):
         super(ReplyMarkup, self).__init__()
     # end def __init__
@@ -30,6 +34,8 @@ class ReplyKeyboardMarkup(ReplyMarkup):
 
     https://core.telegram.org/bots/api#replykeyboardmarkup
     """
+    __slots__ = ["keyboard", "resize_keyboard", "one_time_keyboard", "selective"]
+
     def __init__(self, keyboard, resize_keyboard=False, one_time_keyboard=False, selective=False):
         """
         This object represents a custom keyboard with reply options (see Introduction to bots for details and examples).
@@ -89,15 +95,7 @@ class ReplyKeyboardMarkup(ReplyMarkup):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(ReplyKeyboardMarkup, self).to_array()
-        array['keyboard'] = self._as_array(self.keyboard)  # type list of list of KeyboardButton
-        if self.resize_keyboard is not None:
-            array['resize_keyboard'] = bool(self.resize_keyboard)  # type bool
-        if self.one_time_keyboard is not None:
-            array['one_time_keyboard'] = bool(self.one_time_keyboard)  # type bool
-        if self.selective is not None:
-            array['selective'] = bool(self.selective)  # type bool
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -112,13 +110,7 @@ class ReplyKeyboardMarkup(ReplyMarkup):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['keyboard'] = KeyboardButton.from_array_list(array.get('keyboard'), list_level=2)
-        data['resize_keyboard'] = bool(array.get('resize_keyboard')) if array.get('resize_keyboard') is not None else None
-        data['one_time_keyboard'] = bool(array.get('one_time_keyboard')) if array.get('one_time_keyboard') is not None else None
-        data['selective'] = bool(array.get('selective')) if array.get('selective') is not None else None
-        return ReplyKeyboardMarkup(**data)
+        return decode(ReplyKeyboardMarkup, array)
     # end def from_array
 
     def __str__(self):
@@ -147,6 +139,8 @@ class KeyboardButton(Button):
 
     https://core.telegram.org/bots/api#keyboardbutton
     """
+    __slots__ = ["text", "request_contact", "request_location"]
+
     def __init__(self, text, request_contact=None, request_location=None):
         """
         This object represents one button of the reply keyboard. For simple text buttons String can be used instead of
@@ -194,13 +188,7 @@ class KeyboardButton(Button):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(KeyboardButton, self).to_array()
-        array['text'] = str(self.text)  # type str
-        if self.request_contact is not None:
-            array['request_contact'] = bool(self.request_contact)  # type bool
-        if self.request_location is not None:
-            array['request_location'] = bool(self.request_location)  # type bool
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -215,12 +203,7 @@ class KeyboardButton(Button):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['text'] = str(array.get('text'))
-        data['request_contact'] = bool(array.get('request_contact')) if array.get('request_contact') is not None else None
-        data['request_location'] = bool(array.get('request_location')) if array.get('request_location') is not None else None
-        return KeyboardButton(**data)
+        return decode(KeyboardButton, array)
     # end def from_array
 
     def __str__(self):
@@ -236,6 +219,14 @@ class KeyboardButton(Button):
         """
         return key in ["text", "request_contact", "request_location"]
     # end def __contains__
+
+    def __hash__(self):
+        """
+        Implements `hash(keyboardbutton_instance)`, from the fields, like `==` compares them.
+        Don't change the fields while it's used in a set or as dict key. Frozen copies hash the same, cached.
+        """
+        return hash((KeyboardButton, self.text, self.request_contact, self.request_location))
+    # end def __hash__
 # end class KeyboardButton
 
 
@@ -249,6 +240,8 @@ class ReplyKeyboardRemove(ReplyMarkup):
 
     https://core.telegram.org/bots/api#replykeyboardremove
     """
+    __slots__ = ["remove_keyboard", "selective"]
+
     def __init__(self, selective=False):
         """
         Upon receiving a message with this object,
@@ -290,11 +283,7 @@ class ReplyKeyboardRemove(ReplyMarkup):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(ReplyKeyboardRemove, self).to_array()
-        array['remove_keyboard'] = bool(self.remove_keyboard)  # type bool
-        if self.selective is not None:
-            array['selective'] = bool(self.selective)  # type bool
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -309,11 +298,8 @@ class ReplyKeyboardRemove(ReplyMarkup):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        assert (bool(array.get('remove_keyboard')) == True)
-        data['selective'] = bool(array.get('selective')) if array.get('selective') is not None else None
-        return ReplyKeyboardRemove(**data)
+        assert(bool(array.get('remove_keyboard')) == True)
+        return decode(ReplyKeyboardRemove, array)
     # end def from_array
 
     def __str__(self):
@@ -340,6 +326,8 @@ class InlineKeyboardMarkup(ReplyMarkup):
 
     https://core.telegram.org/bots/api#inlinekeyboardmarkup
     """
+    __slots__ = ["inline_keyboard"]
+
     def __init__(self, inline_keyboard):
         """
         This object represents an inline keyboard that appears right next to the message it belongs to.
@@ -368,9 +356,7 @@ class InlineKeyboardMarkup(ReplyMarkup):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineKeyboardMarkup, self).to_array()
-        array['inline_keyboard'] = self._as_array(self.inline_keyboard)  # type list of list of InlineKeyboardButton
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -385,10 +371,7 @@ class InlineKeyboardMarkup(ReplyMarkup):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
-        data['inline_keyboard'] = InlineKeyboardButton.from_array_list(array.get('inline_keyboard'), list_level=2)
-        return InlineKeyboardMarkup(**data)
+        return decode(InlineKeyboardMarkup, array)
     # end def from_array
 
     def __str__(self):
@@ -416,6 +399,8 @@ class InlineKeyboardButton(Button):
 
     https://core.telegram.org/bots/api#inlinekeyboardbutton
     """
+    __slots__ = ["text", "url", "callback_data", "switch_inline_query", "switch_inline_query_current_chat", "callback_game"]
+
     def __init__(self, text, url=None, callback_data=None, switch_inline_query=None, switch_inline_query_current_chat=None, callback_game=None):
         """
         This object represents one button of an inline keyboard. You must use exactly one of the optional fields.
@@ -489,19 +474,7 @@ class InlineKeyboardButton(Button):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(InlineKeyboardButton, self).to_array()
-        array['text'] = str(self.text)  # type str
-        if self.url is not None:
-            array['url'] = str(self.url)  # type str
-        if self.callback_data is not None:
-            array['callback_data'] = str(self.callback_data)  # type str
-        if self.switch_inline_query is not None:
-            array['switch_inline_query'] = str(self.switch_inline_query)  # type str
-        if self.switch_inline_query_current_chat is not None:
-            array['switch_inline_query_current_chat'] = str(self.switch_inline_query_current_chat)  # type str
-        if self.callback_game is not None:
-            array['callback_game'] = self.callback_game.to_array()  # type CallbackGame
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -516,17 +489,7 @@ class InlineKeyboardButton(Button):
             return None
         # end if
         assert(isinstance(array, dict))
-        
-        from pytgbot.api_types.receivable.updates import CallbackGame
-
-        data = {}
-        data['text'] = str(array.get('text'))
-        data['url'] = str(array.get('url')) if array.get('url') is not None else None
-        data['callback_data'] = str(array.get('callback_data')) if array.get('callback_data') is not None else None
-        data['switch_inline_query'] = str(array.get('switch_inline_query')) if array.get('switch_inline_query') is not None else None
-        data['switch_inline_query_current_chat'] = str(array.get('switch_inline_query_current_chat')) if array.get('switch_inline_query_current_chat') is not None else None
-        data['callback_game'] = CallbackGame.from_array(array.get('callback_game')) if array.get('callback_game') is not None else None
-        return InlineKeyboardButton(**data)
+        return decode(InlineKeyboardButton, array)
     # end def from_array
 
     def __str__(self):
@@ -542,6 +505,14 @@ class InlineKeyboardButton(Button):
         """
         return key in ["text", "url", "callback_data", "switch_inline_query", "switch_inline_query_current_chat", "callback_game"]
     # end def __contains__
+
+    def __hash__(self):
+        """
+        Implements `hash(inlinekeyboardbutton_instance)`, from the fields, like `==` compares them.
+        Don't change the fields while it's used in a set or as dict key. Frozen copies hash the same, cached.
+        """
+        return hash((InlineKeyboardButton, self.text, self.url, self.callback_data, self.switch_inline_query, self.switch_inline_query_current_chat, self.callback_game))
+    # end def __hash__
 # end class InlineKeyboardButton
 
 
@@ -565,6 +536,8 @@ class ForceReply(ReplyMarkup):
 
     https://core.telegram.org/bots/api#forcereply
     """
+    __slots__ = ["force_reply", "selective"]
+
     def __init__(self, selective=False):
         """
         Upon receiving a message with this object, Telegram clients will display a reply interface to the user (act as
@@ -611,11 +584,7 @@ class ForceReply(ReplyMarkup):
         :return: dictionary repesentation of this object.
         :rtype: dict
         """
-        array = super(ForceReply, self).to_array()
-        array['force_reply'] = bool(self.force_reply)  # type bool
-        if self.selective is not None:
-            array['selective'] = bool(self.selective)  # type bool
-        return array
+        return encode(self)
     # end def to_array
 
     @staticmethod
@@ -630,11 +599,8 @@ class ForceReply(ReplyMarkup):
             return None
         # end if
         assert(isinstance(array, dict))
-
-        data = {}
         assert(bool(array.get('force_reply')) == True)
-        data['selective'] = bool(array.get('selective')) if array.get('selective') is not None else None
-        return ForceReply(**data)
+        return decode(ForceReply, array)
     # end def from_array
 
     def __str__(self):
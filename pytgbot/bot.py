@@ -1,16 +1,17 @@
 # -*- coding: utf-8 -*-
-import json
+import re
 import requests
 from time import sleep
 from datetime import timedelta
-from DictObject import DictObject
 
 from luckydonaldUtils.encoding import to_native as n
 from luckydonaldUtils.logger import logging
 
-from .exceptions import TgApiServerException, TgApiParseException, TgApiTypeError, TgApiException
+from .exceptions import TgApiServerException, TgApiParseException, TgApiTypeError, TgApiException, TgApiLimitException
 from .api_types.sendable.inline import InlineQueryResult
 from .api_types import from_array_list
+from .dict_view import DictView
+from .api_types.limits import MESSAGE_TEXT, INLINE_QUERY_RESULTS, INLINE_QUERY_NEXT_OFFSET, SWITCH_PM_PARAMETER
 
 
 __author__ = 'luckydonald'
@@ -18,11 +19,13 @@ __all__ = ["Bot"]
 
 logger = logging.getLogger(__name__)
 
+_SWITCH_PM_PARAMETER_CHARACTERS = re.compile(r"^[A-Za-z0-9_-]+$")
+
 
 class Bot(object):
     _base_url = "https://api.telegram.org/bot{api_key}/{command}"  # do not change.
 
-    def __init__(self, api_key, return_python_objects=True):
+    def __init__(self, api_key, return_python_objects=True, chat_migrations=None):
         """
         A Bot instance. From here you can call all the functions.
         The api key can be optained from @BotFather, see https://core.telegram.org/bots#6-botfather
@@ -32,6 +35,10 @@ class Bot(object):
 
         :keyword return_python_objects: If it should convert the json to `pytgbot.api_types.**` objects.
         :type    return_python_objects: bool
+
+        :keyword chat_migrations: To send calls to groups upgraded to supergroups to the new chat id,
+                                  see :mod:`pytgbot.chat_migrations`. `None` sends them as given.
+        :type    chat_migrations: pytgbot.chat_migrations.ChatMigrations
         """
         from datetime import datetime
 
@@ -39,6 +46,8 @@ class Bot(object):
             raise ValueError("No api_key given.")
         self.api_key = api_key
         self.return_python_objects = return_python_objects
+        self.chat_migrations = chat_migrations
+        self.request_hooks = []  # called as `hook(command, query)` before every request, see `ChatActionKeeper`.
         self._last_update = datetime.now()
     # end def __init__
 
@@ -86,7 +95,7 @@ class Bot(object):
         :type    delta: datetime.
 
         :keyword error_as_empty: If errors which subclasses `requests.RequestException` will be logged but not raised.
-                 Instead the returned DictObject will contain an "exception" field containing the exception occured,
+                 Instead the returned DictView will contain an "exception" field containing the exception occured,
                  the "result" field will be an empty list `[]`. Defaults to `False`.
         :type error_as_empty: bool
 
@@ -141,7 +150,7 @@ class Bot(object):
                 logger.warn("Network related error happened in get_updates(), but will be ignored: " + str(e),
                             exc_info=True)
                 self._last_update = datetime.now()
-                return DictObject(result=[], exception=e)
+                return DictView(result=[], exception=e)
             else:
                 raise
             # end if
@@ -343,6 +352,7 @@ class Bot(object):
         assert(reply_markup is None or isinstance(reply_markup, (
             InlineKeyboardMarkup, ReplyKeyboardMarkup, ReplyKeyboardRemove, ForceReply
         )))
+        MESSAGE_TEXT.check(text, "send_message.text", parse_mode)
         result = self.do("sendMessage", chat_id=chat_id, text=text, parse_mode=parse_mode,
             disable_web_page_preview=disable_web_page_preview, disable_notification=disable_notification,
             reply_to_message_id=reply_to_message_id, reply_markup=reply_markup)
@@ -1981,6 +1991,7 @@ class Bot(object):
         :rtype: bool
         """
         from luckydonaldUtils.encoding import unicode_type
+        from .api_types.engine import dumps_list
         assert(inline_query_id is not None)
         if isinstance(inline_query_id, int):
             inline_query_id = str(inline_query_id)
@@ -1991,11 +2002,19 @@ class Bot(object):
         if isinstance(results, InlineQueryResult):
             results = [results]
         assert(isinstance(results, (list, tuple)))  # list of InlineQueryResult
-        result_objects = []
+        INLINE_QUERY_RESULTS.check(results, "answer_inline_query.results")
+        ids = set()
         for result in results:
             assert isinstance(result, InlineQueryResult)  # checks all elements of results
-            result_objects.append(result.to_array())
+            if result.id in ids:
+                raise TgApiLimitException(
+                    "answer_inline_query.results has the id {id!r} twice, but they must be unique.".format(id=result.id),
+                    field="InlineQueryResult.id", value=result.id,
+                )
+            # end if
+            ids.add(result.id)
         # end for results
+        results = dumps_list(results)  # json written from the fields, or cached for frozen results (see freeze())
 
         assert(cache_time is None or isinstance(cache_time, int))
 
@@ -2004,14 +2023,25 @@ class Bot(object):
         if next_offset is not None:
             assert(isinstance(next_offset, (str, unicode_type, int)))
             next_offset = n(str(next_offset))
+            INLINE_QUERY_NEXT_OFFSET.check(next_offset, "answer_inline_query.next_offset")
         # end if
 
         assert(switch_pm_text is None or isinstance(switch_pm_text, unicode_type))  # py2: unicode, py3: str
 
         assert(switch_pm_parameter is None or isinstance(switch_pm_parameter, str))
+        if switch_pm_parameter is not None:
+            SWITCH_PM_PARAMETER.check(switch_pm_parameter, "answer_inline_query.switch_pm_parameter")
+            if not _SWITCH_PM_PARAMETER_CHARACTERS.match(switch_pm_parameter):
+                raise TgApiLimitException(
+                    "answer_inline_query.switch_pm_parameter may only contain A-Z, a-z, 0-9, _ and -: {value!r}".format(
+                        value=switch_pm_parameter
+                    ), field="answer_inline_query.switch_pm_parameter", value=switch_pm_parameter,
+                )
+            # end if
+        # end if
 
         result = self.do(
-            "answerInlineQuery", inline_query_id=inline_query_id, results=json.dumps(result_objects),
+            "answerInlineQuery", inline_query_id=inline_query_id, results=results,
             cache_time=cache_time, is_personal=is_personal, next_offset=next_offset, switch_pm_text=switch_pm_text,
             switch_pm_parameter=switch_pm_parameter
         )
@@ -2230,6 +2260,40 @@ class Bot(object):
         return self.send_message(*args, **kwargs)
     # end def send_msg
 
+    def send_long_message(self, chat_id, text, parse_mode=None, disable_web_page_preview=False,
+                          disable_notification=False, reply_to_message_id=None, reply_markup=None):
+        """
+        Sends a text of any length, as many messages as needed.
+        See :func:`pytgbot.long_text.split_text` for where it is split. The formatting stays intact.
+
+        The messages are sent one after another, each after telegram accepted the one before, so they arrive in order.
+        The first one replies to `reply_to_message_id`, the last one gets the `reply_markup`.
+        If sending one fails, the exception is raised, and the ones before stay sent.
+
+        Parameters: Like :meth:`send_message`.
+
+        :return: The sent messages, one per chunk of the text
+        :rtype:  list of pytgbot.api_types.receivable.updates.Message
+        """
+        from .long_text import split_text
+
+        assert(text is not None)
+        chunks = split_text(text, parse_mode)
+        if not chunks:
+            MESSAGE_TEXT.check(text.strip(), "send_long_message.text")  # raises, as telegram would.
+        # end if
+        results = []
+        for i, chunk in enumerate(chunks):
+            results.append(self.send_message(
+                chat_id, chunk, parse_mode=parse_mode, disable_web_page_preview=disable_web_page_preview,
+                disable_notification=disable_notification,
+                reply_to_message_id=reply_to_message_id if i == 0 else None,
+                reply_markup=reply_markup if i == len(chunks) - 1 else None,
+            ))
+        # end for
+        return results
+    # end def send_long_message
+
     def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
         """
         Send a request to the api.
@@ -2261,17 +2325,68 @@ class Bot(object):
         :param query: will get json encoded.
 
         :return: The json response from the server, or, if `self.return_python_objects` is `True`, a parsed return type.
-        :rtype: DictObject.DictObject | pytgbot.api_types.receivable.Receivable
+        :rtype: pytgbot.dict_view.DictView | pytgbot.api_types.receivable.Receivable
         """
         import requests
 
+        for hook in self.request_hooks:
+            hook(command, query)
+        # end for
+        migrations = self.chat_migrations
+        if migrations is not None:
+            query = migrations.rewrite(query)
+        # end if
         url, params = self._prepare_request(command, query)
         r = requests.post(url, params=params, files=files, stream=use_long_polling,
                           verify=True,  # No self signed certificates. Telegram should be trustworthy anyway...
                           timeout=request_timeout)
-        return self._postprocess_request(r)
+        retry_query = self._migrated_query(r, command, query, files)
+        if retry_query is not None:
+            url, params = self._prepare_request(command, retry_query)
+            r = requests.post(url, params=params, files=files, stream=use_long_polling,
+                              verify=True, timeout=request_timeout)
+        # end if
+        result = self._postprocess_request(r)
+        if migrations is not None and command == "getUpdates":
+            for update in (result if self.return_python_objects else result.get("result") or []):
+                migrations.observe(update)  # messages with migrate_to_chat_id or migrate_from_chat_id
+            # end for
+        # end if
+        return result
     # end def do
 
+    def _migrated_query(self, r, command, query, files):
+        """
+        Learns the migration if the call failed because its chat became a supergroup, see :mod:`pytgbot.chat_migrations`.
+
+        :param r: The response to the call.
+        :type  r: requests.Response
+
+        :param command: The command of the call.
+        :type  command: str
+
+        :param query: The parameters of the call.
+        :type  query: dict
+
+        :param files: The files of the call. They are rewound, to be sent again.
+
+        :return: The parameters to send the call again with, once. `None` if it shouldn't be.
+        :rtype: dict | None
+        """
+        migrations = self.chat_migrations
+        if migrations is None or r.status_code != 400:
+            return None
+        # end if
+        retry_query = migrations.learn(r.json(), query)
+        if retry_query is None or not _rewind(files):
+            return None
+        # end if
+        logger.debug("Chat {old} migrated, sending {command} to {new} again.".format(
+            old=query["chat_id"], command=command, new=retry_query["chat_id"]
+        ))
+        return retry_query
+    # end def _migrated_query
+
     def _prepare_request(self, command, query):
         """
         Prepares the command url, and converts the query json.
@@ -2284,15 +2399,13 @@ class Bot(object):
         :return: params and a url, for use with requests etc.
         """
         from pytgbot.api_types.sendable import Sendable
-        from pytgbot.api_types import as_array
-        import json
 
         params = {}
         for key in query.keys():
             element = query[key]
             if element is not None:
                 if isinstance(element, Sendable):
-                    params[key] = json.dumps(as_array(element))
+                    params[key] = element.to_json()  # cached for frozen ones, see Sendable.freeze()
                 else:
                     params[key] = element
         url = self._base_url.format(api_key=n(self.api_key), command=n(command))
@@ -2306,16 +2419,15 @@ class Bot(object):
         :param r: the request response
         :type  r: requests.Response
         :return: The json response from the server, or, if `self.return_python_objects` is `True`, a parsed return type.
-        :rtype: DictObject.DictObject | pytgbot.api_types.receivable.Receivable
+        :rtype: pytgbot.dict_view.DictView | pytgbot.api_types.receivable.Receivable
         """
-        from DictObject import DictObject
         import requests
 
         assert isinstance(r, requests.Response)
 
         try:
-            logger.debug(r.json())
-            res = DictObject.objectify(r.json())
+            res = r.json()
+            logger.debug(res)
         except Exception:
             logger.exception("Parsing answer failed.\nRequest: {r!s}\nContent: {r.content}".format(r=r))
             raise
@@ -2323,20 +2435,20 @@ class Bot(object):
         res["response"] = r  # TODO: does this failes on json lists? Does TG does that?
         # TG should always return an dict, with at least a status or something.
         if self.return_python_objects:
-            if res.ok != True:
+            if res.get("ok") != True:
                 raise TgApiServerException(
-                    error_code=res.error_code if "error_code" in res else None,
-                    response=res.response if "response" in res else None,
-                    description=res.description if "description" in res else None,
+                    error_code=res.get("error_code"),
+                    response=res.get("response"),
+                    description=res.get("description"),
                     request=r.request
                 )
             # end if not ok
             if "result" not in res:
                 raise TgApiParseException('Key "result" is missing.')
             # end if no result
-            return res.result
+            return res["result"]  # the plain json, the from_array() of the return type parses it.
         # end if return_python_objects
-        return res
+        return DictView(res)  # attribute access, nested dicts are only wrapped once read.
     # end def _postprocess_request
 
     def _do_fileupload(self, file_param_name, value, **kwargs):
@@ -2352,7 +2464,7 @@ class Bot(object):
         :param kwargs: will get json encoded.
 
         :return: The json response from the server, or, if `self.return_python_objects` is `True`, a parsed return type.
-        :rtype: DictObject.DictObject | pytgbot.api_types.receivable.Receivable
+        :rtype: pytgbot.dict_view.DictView | pytgbot.api_types.receivable.Receivable
 
         :raises TgApiTypeError, TgApiParseException, TgApiServerException: Everything from :meth:`Bot.do`, and :class:`TgApiTypeError`
         """
@@ -2389,3 +2501,19 @@ class Bot(object):
         return file.get_download_url(self.api_key)
     # end def get_download_url
 # end class Bot
+
+
+def _rewind(files):
+    """ Seeks the files of an upload back to the start, to send them again. `False` if one can't be. """
+    for value in (files or {}).values():
+        stream = value[1] if isinstance(value, tuple) else value
+        if isinstance(stream, (bytes, bytearray)):
+            continue  # can be sent again as is
+        # end if
+        if not hasattr(stream, "seek"):
+            return False
+        # end if
+        stream.seek(0)
+    # end for
+    return True
+# end def _rewind
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Following groups which were upgraded to supergroups.
+
+A supergroup gets a new chat id, and every call to the old one fails with its `migrate_to_chat_id`.
+Given a :class:`ChatMigrations`, the :class:`pytgbot.bot.Bot` remembers those::
+
+    bot = Bot(API_KEY, chat_migrations=ChatMigrations("chat_migrations.json"))
+
+- Calls to an old chat id go to the new one instead, for `chat_id` and `from_chat_id`.
+- A call failing because its `chat_id` migrated is sent again once, to the new chat id.
+- The `migrate_to_chat_id` and `migrate_from_chat_id` of the messages received with `getUpdates` are learned too.
+  Give updates received by a webhook to :meth:`ChatMigrations.observe`.
+
+The file is written on every new migration, so they survive restarts.
+"""
+import json
+import os
+import threading
+from numbers import Integral
+
+from luckydonaldUtils.encoding import unicode_type
+from luckydonaldUtils.logger import logging
+
+try:
+    from collections.abc import Mapping  # python 3.3+
+except ImportError:
+    from collections import Mapping  # python 2
+# end try
+
+__author__ = 'luckydonald'
+__all__ = ["ChatMigrations"]
+logger = logging.getLogger(__name__)
+
+
+_CHAT_FIELDS = ("chat_id", "from_chat_id")
+_MESSAGE_FIELDS = ("message", "edited_message", "channel_post", "edited_channel_post")
+
+
+class ChatMigrations(object):
+    """
+    A map of old chat ids to the ones of the supergroups they became. See the module documentation.
+    """
+    def __init__(self, path=None):
+        """
+        :keyword path: The json file to keep the map in, created if needed. `None` keeps it in memory only.
+        :type    path: str
+        """
+        super(ChatMigrations, self).__init__()
+        self.path = path
+        self._chats = {}  # old chat id: new chat id
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                self._chats = dict((int(old), new) for old, new in json.load(f).items())
+            # end with
+        # end if
+    # end def __init__
+
+    def add(self, old_chat_id, new_chat_id):
+        """
+        Remembers a migration.
+
+        :param old_chat_id: The id of the group.
+        :type  old_chat_id: int
+
+        :param new_chat_id: The id of the supergroup it became.
+        :type  new_chat_id: int
+
+        :return: If it was new.
+        :rtype: bool
+        """
+        old, new = _chat_key(old_chat_id), _chat_key(new_chat_id)
+        assert(old is not None and new is not None)
+        with self._lock:
+            if old == new or self._chats.get(old) == new:
+                return False
+            # end if
+            self._chats[old] = new
+            logger.info("Chat {old} migrated to {new}.".format(old=old, new=new))
+            self._save()
+        # end with
+        return True
+    # end def add
+
+    def resolve(self, chat_id):
+        """
+        :param chat_id: A chat id, or `@username`.
+        :type  chat_id: int | str
+
+        :return: The chat id to use, the one of the supergroup if it migrated, else `chat_id` itself.
+        :rtype: int | str
+        """
+        key = _chat_key(chat_id)
+        if key not in self._chats:
+            return chat_id
+        # end if
+        for _ in range(10):  # never more than one in practice, but don't loop forever on a broken file.
+            if key not in self._chats:
+                break
+            # end if
+            key = self._chats[key]
+        # end for
+        return key
+    # end def resolve
+
+    def rewrite(self, query):
+        """
+        :param query: The parameters of an api call.
+        :type  query: dict
+
+        :return: The parameters with the chat ids resolved. A copy, if any changed.
+        :rtype: dict
+        """
+        changed = None
+        for field in _CHAT_FIELDS:
+            chat_id = query.get(field)
+            if chat_id is None:
+                continue
+            # end if
+            new = self.resolve(chat_id)
+            if new is not chat_id:
+                if changed is None:
+                    changed = dict(query)
+                # end if
+                changed[field] = new
+            # end if
+        # end for
+        return query if changed is None else changed
+    # end def rewrite
+
+    def learn(self, response, query):
+        """
+        Remembers the migration an error response tells about.
+
+        :param response: The json telegram answered the call with.
+        :type  response: dict
+
+        :param query: The parameters of the call.
+        :type  query: dict
+
+        :return: The parameters to send the call again with, `None` if it didn't fail because of a migration.
+        :rtype: dict | None
+        """
+        new = (response.get("parameters") or {}).get("migrate_to_chat_id")
+        old = query.get("chat_id")
+        if new is None or _chat_key(old) is None:
+            return None
+        # end if
+        self.add(old, new)
+        return self.rewrite(query)
+    # end def learn
+
+    def observe(self, update):
+        """
+        Remembers the migration a message tells about.
+
+        :param update: An update, or a message. Parsed, or as json (`dict` or :class:`pytgbot.dict_view.DictView`).
+        :type  update: pytgbot.api_types.receivable.updates.Update | pytgbot.api_types.receivable.updates.Message | dict
+        """
+        chat = _field(update, "chat")
+        if chat is None:
+            for name in _MESSAGE_FIELDS:
+                message = _field(update, name)
+                if message is not None:
+                    self.observe(message)
+                # end if
+            # end for
+            return
+        # end if
+        chat_id = _field(chat, "id")
+        migrate_to_chat_id = _field(update, "migrate_to_chat_id")
+        if migrate_to_chat_id is not None:  # sent to the old group
+            self.add(chat_id, migrate_to_chat_id)
+        # end if
+        migrate_from_chat_id = _field(update, "migrate_from_chat_id")
+        if migrate_from_chat_id is not None:  # sent to the new supergroup
+            self.add(migrate_from_chat_id, chat_id)
+        # end if
+    # end def observe
+
+    def __len__(self):
+        return len(self._chats)
+    # end def __len__
+
+    def __contains__(self, chat_id):
+        return _chat_key(chat_id) in self._chats
+    # end def __contains__
+
+    def _save(self):
+        """ Writes the file, to a temporary file first, so a crash can't leave a broken one. Needs the lock. """
+        if self.path is None:
+            return
+        # end if
+        temp_file = self.path + ".tmp"
+        with open(temp_file, "w") as f:
+            json.dump(dict((str(old), new) for old, new in self._chats.items()), f)
+        # end with
+        try:
+            os.replace(temp_file, self.path)  # python 3.3+
+        except AttributeError:
+            if os.path.exists(self.path):  # windows can't rename onto an existing file
+                os.remove(self.path)
+            # end if
+            os.rename(temp_file, self.path)
+        # end try
+    # end def _save
+# end class ChatMigrations
+
+
+def _chat_key(chat_id):
+    """ The chat id as int, `None` for `@username`s. """
+    if isinstance(chat_id, bool):
+        return None
+    # end if
+    if isinstance(chat_id, Integral):
+        return int(chat_id)
+    # end if
+    if isinstance(chat_id, (str, unicode_type)) and chat_id.lstrip("-").isdigit():
+        return int(chat_id)
+    # end if
+    return None
+# end def _chat_key
+
+
+def _field(value, name):
+    """ A field of json, or the attribute of a parsed object. """
+    if isinstance(value, Mapping):
+        return value.get(name)
+    # end if
+    return getattr(value, name, None)
+# end def _field
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Attribute access to the json telegram sends, converted lazily.
+
+With `return_python_objects=False` the :class:`pytgbot.bot.Bot` returns the received json as a :class:`DictView`.
+It is a `dict`, so `json.dumps(...)` and `isinstance(..., dict)` keep working, with the keys readable as attributes.
+Unlike `DictObject.objectify`, which copied the whole json up front, nested dicts are only turned into a
+:class:`DictView` when they are accessed. That is a shallow copy of that one dict, as a `dict` subclass can't share
+the storage of another dict, but the dicts which are never read are never copied::
+
+    for update in bot.get_updates().result:
+        if "inline_query" in update:
+            answer(update.inline_query.id, update.inline_query.query)
+        # end if
+    # end for
+
+The nested dicts are replaced by their :class:`DictView` in the dict or list holding them, so changes stick.
+"""
+from luckydonaldUtils.logger import logging
+
+__author__ = 'luckydonald'
+__all__ = ["DictView", "view"]
+logger = logging.getLogger(__name__)
+
+
+def view(value):
+    """
+    Turns dicts into a :class:`DictView`, and the dicts in lists, in place.
+    Everything else is returned as is.
+
+    :param value: A value of the received json.
+    :return: The value, or the view of it.
+    """
+    if type(value) is dict:
+        return DictView(value)
+    # end if
+    if type(value) is list:
+        for i, element in enumerate(value):
+            if type(element) is dict or type(element) is list:
+                value[i] = view(element)
+            # end if
+        # end for
+    # end if
+    return value
+# end def view
+
+
+class DictView(dict):
+    """
+    A dict, with the keys readable as attributes: `view.inline_query.query` is `view["inline_query"]["query"]`.
+    Nested dicts are returned as :class:`DictView` too, a shallow copy made on the first access.
+
+    Attributes starting with an underscore are kept on the object itself, not in the dict.
+    """
+    def __getattribute__(self, name):
+        # Overwritten instead of __getattr__, as that one only runs after a failed lookup, which is slow.
+        # The methods still win over keys of the same name, like `items`.
+        if name[:1] == "_" or name in _DICT_VIEW_NAMES:
+            return object.__getattribute__(self, name)
+        # end if
+        try:
+            value = _get(self, name)
+        except KeyError:
+            raise AttributeError("{cls!r} object has no attribute {name!r}".format(
+                cls=self.__class__.__name__, name=name
+            ))
+        # end try
+        if type(value) is dict:
+            value = DictView(value)
+            _set(self, name, value)
+        elif type(value) is list:
+            view(value)
+        # end if
+        return value
+    # end def __getattribute__
+
+    def __setattr__(self, name, value):
+        if name[:1] == "_":
+            object.__setattr__(self, name, value)
+            return
+        # end if
+        _set(self, name, value)
+    # end def __setattr__
+
+    def __delattr__(self, name):
+        if name[:1] == "_":
+            object.__delattr__(self, name)
+            return
+        # end if
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+        # end try
+    # end def __delattr__
+
+    def __getitem__(self, key):
+        value = _get(self, key)
+        if type(value) is dict:
+            value = DictView(value)
+            _set(self, key, value)
+        elif type(value) is list:
+            view(value)
+        # end if
+        return value
+    # end def __getitem__
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        # end if
+        return self[key]
+    # end def get
+
+    def __dir__(self):
+        return sorted(set(dir(self.__class__)) | set(key for key in self if isinstance(key, str)))
+    # end def __dir__
+
+    def __repr__(self):
+        return "{cls}({raw})".format(cls=self.__class__.__name__, raw=dict.__repr__(self))
+    # end def __repr__
+# end class DictView
+
+
+_DICT_VIEW_NAMES = frozenset(dir(DictView))  # attributes which aren't keys
+_get = dict.__getitem__
+_set = dict.__setitem__
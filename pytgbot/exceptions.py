@@ -42,4 +42,40 @@ class TgApiParseException(TgApiException):
 
 class TgApiTypeError(TgApiException, TypeError):
     """ Raised where a TypeError is needed"""
-    pass
\ No newline at end of file
+    pass
+
+
+class TgApiLimitException(TgApiException, ValueError):
+    """
+    Raised before sending, if a value is outside of the limits of the telegram api.
+    E.g. a message text longer than 4096 characters, or a `callback_data` longer than 64 bytes.
+    Telegram would reject the request anyway, this saves the round trip.
+    """
+    def __init__(self, description, field=None, value=None, size=None, limit=None):
+        """
+        :param description: What is wrong, human-readable.
+        :type  description: str
+
+        :keyword field: Which value, e.g. `"InlineKeyboardButton.callback_data"`.
+        :type    field: str
+
+        :keyword value: The value itself.
+
+        :keyword size: The size of the value, in the unit of the limit.
+        :type    size: int
+
+        :keyword limit: The limit it is outside of.
+        :type    limit: pytgbot.api_types.limits.Limit
+        """
+        super(TgApiLimitException, self).__init__(description)
+        self.description = description
+        self.field = field
+        self.value = value
+        self.size = size
+        self.limit = limit
+    # end def __init__
+
+    def __str__(self, *args, **kwargs):
+        return self.description
+    # end def __str__
+# end class TgApiLimitException
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Reading the details of error responses, shared by the helpers retrying or pausing after one.
+"""
+__author__ = 'luckydonald'
+__all__ = ["response_parameters", "retry_after_seconds"]
+
+
+def response_parameters(response):
+    """
+    :param response: The response of a failed call, e.g. `TgApiServerException.response`.
+    :type  response: requests.Response
+
+    :return: The `parameters` (`retry_after`, `migrate_to_chat_id`) of the error response, `{}` if there are none.
+    :rtype: dict
+    """
+    try:
+        return response.json().get("parameters") or {}
+    except Exception:
+        return {}
+    # end try
+# end def response_parameters
+
+
+def retry_after_seconds(description):
+    """
+    :param description: The description of the error, e.g. `"Too Many Requests: retry after 35"`.
+    :type  description: str
+
+    :return: The seconds to wait, for responses without `parameters`. 1 if the description has none.
+    :rtype: int
+    """
+    number = "".join(c for c in (description or "").rpartition(" ")[2] if c.isdigit())
+    return int(number) if number else 1
+# end def retry_after_seconds
@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+"""
+Sending the same message to many chats, as fast as telegram allows.
+
+    broadcast = Broadcast(bot, chat_ids, "send_message", {"text": "New version is out!"}, checkpoint_file="news.json")
+    progress = broadcast.run()  # logs the throughput and ETA while running
+    print(progress.counts)  # {"sent": 99120, "blocked": 812, "not_found": 61, ...}
+
+The sends are paced to `rate` messages per second over all chats, and a `429 Too Many Requests` pauses all of them
+for the `retry_after` telegram asks for. The result of every chat is classified (see :func:`classify`) and given to
+`on_result`, e.g. to remove blocked users from the database.
+
+With a `checkpoint_file` the progress is saved every `checkpoint_interval` seconds, and when `run()` ends, also by
+an exception. Starting the same broadcast again (same chat ids in the same order) continues after the last checkpoint.
+If the process dies without saving it, the chats done since the last checkpoint get the message twice, up to
+`rate * checkpoint_interval` of them (150 with the defaults). `checkpoint_interval=0` saves after every chat.
+"""
+import json
+import os
+import threading
+from collections import namedtuple
+from itertools import islice
+from time import sleep, time
+
+import requests
+from luckydonaldUtils.logger import logging
+
+from ..dict_view import DictView
+from ..exceptions import TgApiServerException
+from ._api_errors import response_parameters, retry_after_seconds
+
+try:
+    from time import monotonic as _now  # python 3
+except ImportError:
+    _now = time  # python 2
+# end try
+
+__author__ = 'luckydonald'
+__all__ = [
+    "Broadcast", "BroadcastProgress", "classify", "OUTCOMES",
+    "OUTCOME_SENT", "OUTCOME_BLOCKED", "OUTCOME_MIGRATED", "OUTCOME_NOT_FOUND", "OUTCOME_FLOOD", "OUTCOME_FAILED",
+]
+logger = logging.getLogger(__name__)
+
+
+OUTCOME_SENT = "sent"
+OUTCOME_BLOCKED = "blocked"  # 403: blocked by the user, kicked from the chat, user deactivated.
+OUTCOME_MIGRATED = "migrated"  # the group is a supergroup now, the new chat id is given to `on_result` if known.
+OUTCOME_NOT_FOUND = "not_found"  # the chat doesn't exist (anymore), or the bot never talked to the user.
+OUTCOME_FLOOD = "flood"  # still `429 Too Many Requests` after all retries.
+OUTCOME_FAILED = "failed"  # anything else, e.g. network errors after all retries.
+OUTCOMES = (OUTCOME_SENT, OUTCOME_BLOCKED, OUTCOME_MIGRATED, OUTCOME_NOT_FOUND, OUTCOME_FLOOD, OUTCOME_FAILED)
+
+
+def classify(error_code, description):
+    """
+    What a failed request means for the chat it was sent to.
+
+    :param error_code: The `error_code` of the api response, e.g. `403`.
+    :type  error_code: int
+
+    :param description: The `description` of the api response, e.g. `"Forbidden: bot was blocked by the user"`.
+    :type  description: str
+
+    :return: One of the `OUTCOME_*` constants, never :data:`OUTCOME_SENT`.
+    :rtype: str
+    """
+    description = (description or "").lower()
+    if error_code == 429:
+        return OUTCOME_FLOOD
+    # end if
+    if "migrate" in description or "upgraded to a supergroup" in description:
+        return OUTCOME_MIGRATED
+    # end if
+    if error_code == 403:
+        return OUTCOME_BLOCKED
+    # end if
+    if error_code == 400 and "not found" in description:
+        return OUTCOME_NOT_FOUND
+    # end if
+    return OUTCOME_FAILED
+# end def classify
+
+
+class BroadcastProgress(namedtuple("BroadcastProgress", ["done", "total", "counts", "elapsed", "resumed"])):
+    """
+    How far a :class:`Broadcast` is.
+
+    - `done`: chats finished, including the ones of previous runs, if resumed.
+    - `total`: number of chats, `None` if the chat ids have no `len()`.
+    - `counts`: chats per outcome, `{outcome: count}`.
+    - `elapsed`: seconds since this run started.
+    - `resumed`: chats finished by previous runs.
+    """
+    __slots__ = ()
+
+    @property
+    def rate(self):
+        """
+        Chats per second in this run.
+
+        :rtype: float
+        """
+        return (self.done - self.resumed) / self.elapsed if self.elapsed > 0 else 0.0
+    # end def rate
+
+    @property
+    def eta(self):
+        """
+        Estimated seconds until all chats are done, `None` if unknown.
+
+        :rtype: float | None
+        """
+        if self.total is None or not self.rate:
+            return None
+        # end if
+        return max(self.total - self.done, 0) / self.rate
+    # end def eta
+
+    def __str__(self):
+        """
+        Implements `str(progress_instance)`, e.g. `"5120/100000 chats, 29.8 per second, ETA 53:06 (sent 5003, blocked 117)"`.
+        """
+        eta = self.eta
+        return "{done}/{total} chats, {rate:.1f} per second, ETA {eta} ({counts})".format(
+            done=self.done, total="?" if self.total is None else self.total, rate=self.rate,
+            eta="?" if eta is None else "{m}:{s:02d}".format(m=int(eta) // 60, s=int(eta) % 60),
+            counts=", ".join(
+                "{outcome} {count}".format(outcome=outcome, count=self.counts[outcome])
+                for outcome in OUTCOMES if self.counts.get(outcome)
+            ),
+        )
+    # end def __str__
+# end class BroadcastProgress
+
+
+class Broadcast(object):
+    """
+    Sends one message to many chats, with a :class:`pytgbot.bot.Bot` method like `send_message` or `forward_message`.
+    See the module documentation.
+    """
+    def __init__(
+        self, bot, chat_ids, method, message, checkpoint_file=None, rate=30.0, workers=8, max_retries=3,
+        on_result=None, report_interval=10.0, checkpoint_interval=5.0
+    ):
+        """
+        :param bot: The bot to send with.
+        :type  bot: pytgbot.bot.Bot
+
+        :param chat_ids: The chats, in an order which is the same when resuming.
+        :type  chat_ids: iterable of int | iterable of str
+
+        :param method: Name of the bot method, e.g. `"send_message"` or `"forward_message"`.
+        :type  method: str
+
+        :param message: The arguments of that method, except `chat_id`. E.g. `{"text": "Hi", "parse_mode": "html"}`.
+        :type  message: dict
+
+        :keyword checkpoint_file: Json file to save the progress to, and to resume from if it exists.
+        :type    checkpoint_file: str
+
+        :keyword rate: Maximum messages per second, over all chats. Telegram allows about 30.
+        :type    rate: float
+
+        :keyword workers: Requests at the same time, so the round trip time doesn't limit the rate.
+        :type    workers: int
+
+        :keyword max_retries: How often a chat is retried after flood waits or network errors.
+        :type    max_retries: int
+
+        :keyword on_result: Called with `(chat_id, outcome, detail)` for every chat, from the worker threads.
+                            `detail` is the result of the method for :data:`OUTCOME_SENT`,
+                            the new chat id (or `None`) for :data:`OUTCOME_MIGRATED`,
+                            else the exception or the error description.
+        :type    on_result: callable
+
+        :keyword report_interval: Seconds between the progress log messages.
+        :type    report_interval: float
+
+        :keyword checkpoint_interval: Seconds between saving the checkpoint, 0 saves after every chat.
+        :type    checkpoint_interval: float
+        """
+        super(Broadcast, self).__init__()
+        assert(callable(getattr(bot, method, None)))
+        assert(isinstance(message, dict) and "chat_id" not in message)
+        assert(rate > 0)
+        assert(workers >= 1)
+        assert(max_retries >= 0)
+        self.bot = bot
+        self.chat_ids = chat_ids
+        self.method = method
+        self.message = message
+        self.checkpoint_file = checkpoint_file
+        self.rate = rate
+        self.workers = workers
+        self.max_retries = max_retries
+        self.on_result = on_result
+        self.report_interval = report_interval
+        self.checkpoint_interval = checkpoint_interval
+
+        self.counts = dict((outcome, 0) for outcome in OUTCOMES)
+        self.migrated = {}  # old chat id: new chat id
+        try:
+            self.total = len(chat_ids)
+        except TypeError:
+            self.total = None  # e.g. a generator
+        # end try
+
+        self._lock = threading.Lock()
+        self._next_slot = 0.0  # time the next request may be sent
+        self._position = 0  # chats before it are done.
+        self._resumed = 0  # chats done by previous runs
+        self._pending = set()  # indexes of the chats in progress
+        self._done_ahead = set()  # indexes of the chats after `_position` which are done
+        self._next_index = 0  # index of the next chat to take
+        self._chats = None  # the iterator, shared by the workers
+        self._error = None  # raised by a worker, stops the others
+        self._started = None
+        self._last_report = self._last_checkpoint = 0.0
+    # end def __init__
+
+    def run(self):
+        """
+        Sends to all the chats, returning when done.
+        Unexpected exceptions (not api errors) stop the broadcast and are raised here, after saving the checkpoint.
+
+        :return: The final progress.
+        :rtype: BroadcastProgress
+        """
+        self._load_checkpoint()
+        self._started = self._last_report = self._last_checkpoint = _now()
+        self._next_index = self._position
+        self._chats = islice(iter(self.chat_ids), self._position, None)
+        threads = [
+            threading.Thread(target=self._work, name="broadcast-{i}".format(i=i)) for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        # end for
+        try:
+            for thread in threads:
+                thread.join()
+            # end for
+        except BaseException as e:  # e.g. a KeyboardInterrupt, the workers stop after their current chat.
+            with self._lock:
+                self._error = self._error or e
+            # end with
+            raise
+        finally:
+            with self._lock:
+                self._save_checkpoint()
+                progress = self.progress()
+            # end with
+        # end try
+        if self._error is not None:
+            raise self._error
+        # end if
+        logger.info("Broadcast done: {progress}".format(progress=progress))
+        return progress
+    # end def run
+
+    def progress(self):
+        """
+        The current progress, can be called from other threads while running.
+
+        :rtype: BroadcastProgress
+        """
+        return BroadcastProgress(
+            done=sum(self.counts.values()), total=self.total, counts=dict(self.counts),
+            elapsed=_now() - self._started if self._started is not None else 0.0, resumed=self._resumed,
+        )
+    # end def progress
+
+    def _work(self):
+        while True:
+            with self._lock:
+                if self._error is not None:
+                    return
+                # end if
+                index = self._next_index
+                try:
+                    chat_id = next(self._chats)
+                except StopIteration:
+                    return
+                # end try
+                self._next_index += 1
+                if index in self._done_ahead:
+                    continue  # done before resuming
+                # end if
+                self._pending.add(index)
+            # end with
+            try:
+                outcome, detail = self._send(chat_id)
+            except BaseException as e:  # e.g. wrong arguments for the method, or a KeyboardInterrupt
+                with self._lock:
+                    self._error = e
+                # end with
+                return
+            # end try
+            if self.on_result is not None:
+                try:
+                    self.on_result(chat_id, outcome, detail)
+                except Exception:
+                    logger.exception("on_result failed for chat {chat_id}.".format(chat_id=chat_id))
+                # end try
+            # end if
+            with self._lock:
+                self.counts[outcome] += 1
+                if outcome == OUTCOME_MIGRATED and detail is not None:
+                    self.migrated[chat_id] = detail
+                # end if
+                self._pending.discard(index)
+                self._done_ahead.add(index)
+                self._position = min(self._pending) if self._pending else self._next_index
+                self._done_ahead = set(i for i in self._done_ahead if i >= self._position)
+                now = _now()
+                if now - self._last_checkpoint >= self.checkpoint_interval or self._error is not None:
+                    self._save_checkpoint()  # stopping: the chats finishing after run() saved are counted too.
+                    self._last_checkpoint = now
+                # end if
+                if now - self._last_report >= self.report_interval:
+                    logger.info("Broadcast: {progress}".format(progress=self.progress()))
+                    self._last_report = now
+                # end if
+            # end with
+        # end while
+    # end def _work
+
+    def _send(self, chat_id):
+        """
+        Sends to one chat, retrying after flood waits and network errors.
+
+        :return: The outcome, and the detail for `on_result`.
+        :rtype: tuple
+        """
+        detail = None
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_slot()
+            try:
+                result = getattr(self.bot, self.method)(chat_id=chat_id, **self.message)
+            except TgApiServerException as e:
+                error_code, description, detail = e.error_code, e.description, e
+                parameters = response_parameters(e.response)
+            except requests.RequestException as e:
+                logger.debug("Network error sending to chat {chat_id}: {e}".format(chat_id=chat_id, e=e))
+                detail = e
+                if attempt < self.max_retries:
+                    sleep(2 ** attempt)
+                # end if
+                continue
+            else:
+                if not isinstance(result, DictView) or result.get("ok"):
+                    return OUTCOME_SENT, result
+                # end if
+                # return_python_objects=False doesn't raise
+                error_code, description = result.get("error_code"), result.get("description")
+                parameters, detail = result.get("parameters") or {}, description
+            # end try
+            outcome = classify(error_code, description)
+            if outcome == OUTCOME_MIGRATED:
+                return outcome, parameters.get("migrate_to_chat_id")
+            elif outcome != OUTCOME_FLOOD:
+                return outcome, detail
+            # end if
+            retry_after = parameters.get("retry_after") or retry_after_seconds(description)
+            logger.warning("Flood limit hit, pausing all sends for {seconds} seconds.".format(seconds=retry_after))
+            with self._lock:
+                self._next_slot = max(self._next_slot, _now() + retry_after)
+            # end with
+        # end for
+        return (OUTCOME_FAILED if isinstance(detail, requests.RequestException) else OUTCOME_FLOOD), detail
+    # end def _send
+
+    def _wait_for_slot(self):
+        """ Waits until the next request may be sent, so there are at most `rate` per second. """
+        with self._lock:
+            now = _now()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + 1.0 / self.rate
+        # end with
+        if slot > now:
+            sleep(slot - now)
+        # end if
+    # end def _wait_for_slot
+
+    def _load_checkpoint(self):
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return
+        # end if
+        with open(self.checkpoint_file) as f:
+            checkpoint = json.load(f)
+        # end with
+        if checkpoint["method"] != self.method:
+            logger.warning("The checkpoint {file!r} is of a {method} broadcast.".format(
+                file=self.checkpoint_file, method=checkpoint["method"]
+            ))
+        # end if
+        self._position = checkpoint["position"]
+        self._done_ahead = set(checkpoint["done_ahead"])
+        self.counts.update(checkpoint["counts"])
+        self.migrated.update((_chat_key(old), new) for old, new in checkpoint["migrated"].items())
+        self._resumed = sum(self.counts.values())
+        logger.info("Resuming the broadcast at chat {position}.".format(position=self._position))
+    # end def _load_checkpoint
+
+    def _save_checkpoint(self):
+        """ Writes the checkpoint file, to a temporary file first, so a crash can't leave a broken one. """
+        if not self.checkpoint_file:
+            return
+        # end if
+        checkpoint = {
+            "method": self.method, "position": self._position, "done_ahead": sorted(self._done_ahead),
+            "counts": self.counts,
+            "migrated": dict((str(old), new) for old, new in self.migrated.items()),
+        }
+        temp_file = self.checkpoint_file + ".tmp"
+        with open(temp_file, "w") as f:
+            json.dump(checkpoint, f)
+        # end with
+        try:
+            os.replace(temp_file, self.checkpoint_file)  # python 3.3+
+        except AttributeError:
+            if os.path.exists(self.checkpoint_file):  # windows can't rename onto an existing file
+                os.remove(self.checkpoint_file)
+            # end if
+            os.rename(temp_file, self.checkpoint_file)
+        # end try
+    # end def _save_checkpoint
+# end class Broadcast
+
+
+def _chat_key(chat_id):
+    """ A chat id read from the checkpoint, where json made it a string: numeric ones are ints again. """
+    return int(chat_id) if chat_id.lstrip("-").isdigit() else chat_id  # "@channelusername" stays as it is.
+# end def _chat_key
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+Keeping "typing..." (or any other chat action) visible while a handler works on a reply.
+
+A chat action is shown for about 5 seconds, so it has to be sent again for longer work.
+One :class:`ChatActionKeeper` does that for all the chats, with one thread::
+
+    keeper = ChatActionKeeper(bot)
+
+    # in the handlers:
+    with keeper.action(chat_id, "upload_photo") as action:
+        photo = render_chart()  # takes 20 seconds
+        action.stop()  # before the reply, so the action can't be sent after it.
+        bot.send_photo(chat_id, photo)
+    # end with
+
+The action is sent at once, and then every `interval` seconds until the `with` block is left,
+or `stop()` of the returned :class:`ChatAction` is called.
+Handlers showing the same action in the same chat share the requests.
+If they show different ones, the newest one is shown.
+
+Sending a message to the chat with the keeper's bot (any `send_*` or `forward_message` call) stops all the actions
+of that chat before the request goes out, so forgetting `stop()` is not a problem either.
+"""
+import heapq
+import threading
+from itertools import count
+from time import time
+
+from luckydonaldUtils.logger import logging
+
+from ..exceptions import TgApiServerException, TgApiException
+from ._api_errors import response_parameters, retry_after_seconds
+
+try:
+    from time import monotonic as _now  # python 3
+except ImportError:
+    _now = time  # python 2
+# end try
+
+__author__ = 'luckydonald'
+__all__ = ["ChatActionKeeper", "ChatAction"]
+logger = logging.getLogger(__name__)
+
+
+class ChatAction(object):
+    """
+    One handler showing an action in a chat, see :meth:`ChatActionKeeper.action`.
+    Can be used as context manager, or with :meth:`start` and :meth:`stop`.
+    """
+    __slots__ = ["keeper", "chat_id", "action", "active"]
+
+    def __init__(self, keeper, chat_id, action):
+        """
+        :param keeper: The keeper sending the action.
+        :type  keeper: ChatActionKeeper
+
+        :param chat_id: The chat to show the action in.
+        :type  chat_id: int | str
+
+        :param action: The action, e.g. `"typing"`, see :meth:`pytgbot.bot.Bot.send_chat_action`.
+        :type  action: str
+        """
+        super(ChatAction, self).__init__()
+        self.keeper = keeper
+        self.chat_id = chat_id
+        self.action = action
+        self.active = False
+    # end def __init__
+
+    def start(self):
+        """ Starts showing the action, if not already. """
+        self.keeper._register(self)
+        return self
+    # end def start
+
+    def stop(self):
+        """
+        Stops refreshing the action. It vanishes with the next message to the chat, or after 5 seconds.
+        If it is being sent right now, this waits for that request, so it can't arrive after the reply.
+        """
+        self.keeper._unregister(self)
+    # end def stop
+
+    def __enter__(self):
+        return self.start()
+    # end def __enter__
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+    # end def __exit__
+
+    def __repr__(self):
+        return "ChatAction(chat_id={self.chat_id!r}, action={self.action!r}, active={self.active!r})".format(
+            self=self
+        )
+    # end def __repr__
+# end class ChatAction
+
+
+class ChatActionKeeper(object):
+    """
+    Sends the chat actions of all active :class:`ChatAction` s again and again, from one background thread.
+    See the module documentation.
+    """
+    def __init__(self, bot, interval=4.0, rate=20.0, stop_on_send=True):
+        """
+        :param bot: The bot to send the actions with.
+        :type  bot: pytgbot.bot.Bot
+
+        :keyword interval: Seconds between sending the action to the same chat.
+                           A bit less than the 5 seconds telegram shows it, as the request takes time too.
+        :type    interval: float
+
+        :keyword rate: Maximum chat actions per second, over all chats. When more chats are active, some
+                       actions are refreshed late, instead of using up the requests the replies need.
+        :type    rate: float
+
+        :keyword stop_on_send: If messages sent to a chat with `bot` stop the actions of the chat first,
+                               see :attr:`pytgbot.bot.Bot.request_hooks`.
+        :type    stop_on_send: bool
+        """
+        super(ChatActionKeeper, self).__init__()
+        assert(interval > 0)
+        assert(rate > 0)
+        self.bot = bot
+        self.interval = interval
+        self.rate = rate
+
+        self._chats = {}  # chat_id: list of active ChatAction, the last one is shown.
+        self._due = {}  # chat_id: when to send the action next
+        self._queue = []  # heap of (due, number, chat_id). Entries not matching `_due` are outdated.
+        self._numbers = count()  # so chat ids never get compared in the heap
+        self._next_slot = 0.0  # when the next request may be sent, for the rate
+        self._sending = None  # the chat an action is being sent to
+        self._condition = threading.Condition(threading.Lock())
+        self._closed = False
+        if stop_on_send:
+            bot.request_hooks.append(self._before_request)
+        # end if
+        self._thread = threading.Thread(target=self._work, name="chat-action-keeper")
+        self._thread.daemon = True
+        self._thread.start()
+    # end def __init__
+
+    def action(self, chat_id, action="typing"):
+        """
+        The action for a chat, shown while in the `with` block, or between :meth:`ChatAction.start` and
+        :meth:`ChatAction.stop`.
+
+        :param chat_id: The chat to show the action in.
+        :type  chat_id: int | str
+
+        :keyword action: The action, e.g. `"typing"` or `"upload_photo"`, see :meth:`pytgbot.bot.Bot.send_chat_action`.
+        :type    action: str
+
+        :rtype: ChatAction
+        """
+        return ChatAction(self, chat_id, action)
+    # end def action
+
+    def stop(self, chat_id):
+        """
+        Stops all the actions in a chat, e.g. when sending the reply from somewhere else.
+        Waits for the action being sent to the chat, if there is one.
+
+        :param chat_id: The chat.
+        :type  chat_id: int | str
+        """
+        with self._condition:
+            for chat_action in self._chats.pop(chat_id, ()):
+                chat_action.active = False
+            # end for
+            self._due.pop(chat_id, None)
+            self._wait_sent(chat_id)
+        # end with
+    # end def stop
+
+    def active_chats(self):
+        """
+        :return: The chats with an action shown.
+        :rtype: list
+        """
+        with self._condition:
+            return list(self._chats)
+        # end with
+    # end def active_chats
+
+    def close(self):
+        """ Stops all actions, and the background thread. """
+        with self._condition:
+            for chat_actions in self._chats.values():
+                for chat_action in chat_actions:
+                    chat_action.active = False
+                # end for
+            # end for
+            self._chats.clear()
+            self._due.clear()
+            self._closed = True
+            self._condition.notify_all()
+        # end with
+        self._thread.join()
+        if self._before_request in self.bot.request_hooks:
+            self.bot.request_hooks.remove(self._before_request)
+        # end if
+    # end def close
+
+    def _before_request(self, command, query):
+        """ Stops the actions of a chat before a message is sent to it, so they can't show up after the reply. """
+        if command == "sendChatAction" or not (command.startswith("send") or command == "forwardMessage"):
+            return
+        # end if
+        chat_id = query.get("chat_id")
+        if chat_id in self._chats:  # without the lock, stop() takes it.
+            self.stop(chat_id)
+        # end if
+    # end def _before_request
+
+    def _register(self, chat_action):
+        with self._condition:
+            if chat_action.active:
+                return
+            # end if
+            chat_actions = self._chats.setdefault(chat_action.chat_id, [])
+            if not chat_actions or chat_actions[-1].action != chat_action.action or \
+                    chat_action.chat_id not in self._due:
+                self._schedule(chat_action.chat_id, _now())  # shown at once. Else it is already, or failed for good.
+            # end if
+            chat_actions.append(chat_action)
+            chat_action.active = True
+        # end with
+    # end def _register
+
+    def _unregister(self, chat_action):
+        with self._condition:
+            if not chat_action.active:
+                return
+            # end if
+            chat_action.active = False
+            chat_actions = self._chats[chat_action.chat_id]
+            shown = chat_actions[-1].action
+            chat_actions.remove(chat_action)
+            if not chat_actions:
+                del self._chats[chat_action.chat_id]
+                self._due.pop(chat_action.chat_id, None)
+                self._wait_sent(chat_action.chat_id)
+            elif chat_actions[-1].action != shown:
+                self._schedule(chat_action.chat_id, _now())  # the one of an older handler is shown again.
+            # end if
+        # end with
+    # end def _unregister
+
+    def _wait_sent(self, chat_id):
+        """ Waits until no action is being sent to the chat. Needs the lock. """
+        while self._sending == chat_id:
+            self._condition.wait()
+        # end while
+    # end def _wait_sent
+
+    def _schedule(self, chat_id, due):
+        """ Sets when to send the action of the chat next. Needs the lock. """
+        self._due[chat_id] = due
+        heapq.heappush(self._queue, (due, next(self._numbers), chat_id))
+        self._condition.notify_all()
+    # end def _schedule
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    # end if
+                    if not self._queue:
+                        self._condition.wait()
+                        continue
+                    # end if
+                    due, _, chat_id = self._queue[0]
+                    if self._due.get(chat_id) != due:
+                        heapq.heappop(self._queue)  # outdated, stopped or rescheduled.
+                        continue
+                    # end if
+                    now = _now()
+                    when = max(due, self._next_slot)
+                    if when <= now:
+                        break
+                    # end if
+                    self._condition.wait(when - now)
+                # end while
+                # still active, as stopping removes `_due` with the lock held. Stopping now waits for `_sending`.
+                heapq.heappop(self._queue)
+                action = self._chats[chat_id][-1].action
+                self._next_slot = now + 1.0 / self.rate
+                self._schedule(chat_id, now + self.interval)
+                self._sending = chat_id
+            # end with
+            try:
+                self.bot.send_chat_action(chat_id, action)
+            except TgApiServerException as e:
+                self._failed(chat_id, e)
+            except (Exception, TgApiException):
+                logger.exception("Sending the chat action to {chat_id} failed.".format(chat_id=chat_id))
+            finally:
+                with self._condition:
+                    self._sending = None
+                    self._condition.notify_all()
+                # end with
+            # end try
+        # end while
+    # end def _work
+
+    def _failed(self, chat_id, e):
+        """ Retries after `429 Too Many Requests` and server errors, other errors (e.g. blocked) stop the chat. """
+        if e.error_code == 429:
+            retry_after = response_parameters(e.response).get("retry_after") or retry_after_seconds(e.description)
+            logger.warning("Flood limit hit, pausing the chat actions for {seconds} seconds.".format(
+                seconds=retry_after
+            ))
+            with self._condition:
+                self._next_slot = max(self._next_slot, _now() + retry_after)  # for all chats
+                if chat_id in self._due:
+                    self._schedule(chat_id, _now())  # as soon as allowed, it vanished meanwhile.
+                # end if
+            # end with
+            return
+        # end if
+        if (e.error_code or 0) >= 500:
+            logger.debug("Sending the chat action to {chat_id} failed, retrying: {e}".format(chat_id=chat_id, e=e))
+            return  # already scheduled for the next interval
+        # end if
+        # e.g. the bot was blocked. Stays registered, but isn't sent anymore until registered again.
+        logger.warning("Sending the chat action to {chat_id} failed, not retrying: {e}".format(chat_id=chat_id, e=e))
+        with self._condition:
+            self._due.pop(chat_id, None)
+        # end with
+    # end def _failed
+# end class ChatActionKeeper
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""
+Coalescing frequent edits of the same message, like progress bars.
+
+    coalescer = EditCoalescer(bot, window=1.0)
+    for percent in range(101):
+        coalescer.edit_message_text("Downloading: {}%".format(percent), chat_id=chat_id, message_id=message_id)
+        download_a_bit()
+    # end for
+    coalescer.flush()  # waits until the "100%" is sent
+
+Per message (`chat_id` and `message_id`, or `inline_message_id`) at most one edit is sent per `window` seconds.
+Edits made while waiting replace each other, so only the latest one is sent. Edits which wouldn't change what was
+sent last are skipped, instead of failing with "message is not modified".
+
+The edits are sent by a background thread, the `edit_*` methods return at once.
+"""
+import threading
+from time import time
+
+from luckydonaldUtils.logger import logging
+
+from ..exceptions import TgApiServerException, TgApiException
+
+try:
+    from time import monotonic as _now  # python 3
+except ImportError:
+    _now = time  # python 2
+# end try
+
+__author__ = 'luckydonald'
+__all__ = ["EditCoalescer"]
+logger = logging.getLogger(__name__)
+
+
+_TEXT_FIELDS = ("text", "parse_mode", "disable_web_page_preview")
+_MISSING = object()
+
+
+class _MessageState(object):
+    """
+    The edits of one message.
+    """
+    __slots__ = ["delivered", "pending", "last_sent", "due"]
+
+    def __init__(self):
+        self.delivered = {}  # fields as last sent to telegram. `reply_markup` is its json, to compare it.
+        self.pending = None  # fields of the edits not sent yet, `reply_markup` as (json, object).
+        self.last_sent = None  # time of the last edit sent
+        self.due = None  # when `pending` will be sent
+    # end def __init__
+# end class _MessageState
+
+
+class EditCoalescer(object):
+    """
+    Sends edits of messages through a :class:`pytgbot.bot.Bot`, at most one per message and `window` seconds.
+    See the module documentation.
+    """
+    def __init__(self, bot, window=1.0, on_error=None, max_messages=10000):
+        """
+        :param bot: The bot to edit with.
+        :type  bot: pytgbot.bot.Bot
+
+        :keyword window: Minimum seconds between two edits of the same message.
+        :type    window: float
+
+        :keyword on_error: Called with `(key, exception)` if an edit failed, from the background thread.
+                           `key` is `(chat_id, message_id)` or the `inline_message_id`. By default it is logged.
+        :type    on_error: callable
+
+        :keyword max_messages: How many messages to remember the last sent edit of, to skip unchanged ones.
+                               If there are more, the ones not edited the longest are forgotten.
+        :type    max_messages: int
+        """
+        super(EditCoalescer, self).__init__()
+        assert(window is not None and window >= 0)
+        self.bot = bot
+        self.window = window
+        self.on_error = on_error
+        self.max_messages = max_messages
+
+        self._states = {}  # key: _MessageState
+        self._sending = 0  # edits taken from `_states`, but not sent yet. For flush().
+        self._condition = threading.Condition(threading.Lock())
+        self._closed = False
+        self._thread = threading.Thread(target=self._work, name="edit-coalescer")
+        self._thread.daemon = True
+        self._thread.start()
+    # end def __init__
+
+    def edit_message_text(self, text, chat_id=None, message_id=None, inline_message_id=None, parse_mode=None,
+                          disable_web_page_preview=None, reply_markup=None):
+        """
+        Edits the text of a message, see :meth:`pytgbot.bot.Bot.edit_message_text`.
+        Like there, a message edited without `reply_markup` loses its inline keyboard.
+        """
+        self._edit(_key(chat_id, message_id, inline_message_id), {
+            "text": text, "parse_mode": parse_mode, "disable_web_page_preview": disable_web_page_preview,
+            "reply_markup": _markup(reply_markup),
+        })
+    # end def edit_message_text
+
+    def edit_message_reply_markup(self, chat_id=None, message_id=None, inline_message_id=None, reply_markup=None):
+        """
+        Edits the inline keyboard of a message, see :meth:`pytgbot.bot.Bot.edit_message_reply_markup`.
+        Combined with a waiting text edit, if there is one.
+        """
+        self._edit(_key(chat_id, message_id, inline_message_id), {"reply_markup": _markup(reply_markup)})
+    # end def edit_message_reply_markup
+
+    def flush(self, timeout=None):
+        """
+        Sends the waiting edits now, ignoring the window, and waits until they are sent.
+
+        :keyword timeout: Maximum seconds to wait, `None` is forever.
+        :type    timeout: float
+
+        :return: If everything was sent in time.
+        :rtype: bool
+        """
+        with self._condition:
+            for state in self._states.values():
+                if state.pending is not None:
+                    state.due = 0
+                # end if
+            # end for
+            self._condition.notify_all()
+            deadline = None if timeout is None else _now() + timeout
+            while self._sending or any(state.pending is not None for state in self._states.values()):
+                wait = None if deadline is None else deadline - _now()
+                if wait is not None and wait <= 0:
+                    return False
+                # end if
+                self._condition.wait(wait)
+            # end while
+        # end with
+        return True
+    # end def flush
+
+    def close(self, timeout=None):
+        """
+        Sends the waiting edits, and stops the background thread.
+
+        :keyword timeout: Maximum seconds to wait for the edits, `None` is forever.
+        :type    timeout: float
+        """
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        # end with
+        self._thread.join(timeout)
+    # end def close
+
+    def forget(self, chat_id=None, message_id=None, inline_message_id=None):
+        """
+        Drops what is known about a message, e.g. after it was deleted. Edits still waiting are dropped too.
+        """
+        with self._condition:
+            self._states.pop(_key(chat_id, message_id, inline_message_id), None)
+        # end with
+    # end def forget
+
+    def _edit(self, key, fields):
+        with self._condition:
+            state = self._states.get(key)
+            if state is None:
+                if len(self._states) >= self.max_messages:
+                    self._forget_idle()
+                # end if
+                state = self._states[key] = _MessageState()
+            # end if
+            if state.pending is None:
+                state.pending = fields
+                state.due = _now() if state.last_sent is None else state.last_sent + self.window
+                self._condition.notify_all()
+            else:
+                state.pending.update(fields)  # replaces the waiting edit
+            # end if
+        # end with
+    # end def _edit
+
+    def _forget_idle(self):
+        """ Forgets the older half of the messages without waiting edits. Needs the lock. """
+        idle = sorted(
+            ((state.last_sent, key) for key, state in self._states.items()
+             if state.pending is None and state.last_sent is not None),
+            key=lambda item: item[0],  # not comparing the keys, `(chat_id, message_id)` and `inline_message_id`.
+        )
+        for _, key in idle[:len(idle) // 2 + 1]:
+            del self._states[key]
+        # end for
+    # end def _forget_idle
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    # end if
+                    now = _now()
+                    due = [(state.due, key) for key, state in self._states.items() if state.pending is not None]
+                    if due:
+                        when, key = min(due, key=lambda item: item[0])
+                        if when <= now:
+                            break
+                        # end if
+                        self._condition.wait(when - now)
+                    else:
+                        self._condition.wait()
+                    # end if
+                # end while
+                state = self._states[key]
+                pending, state.pending = state.pending, None
+                state.last_sent = now  # edits made while sending wait for the window from now on.
+                self._sending += 1
+            # end with
+            try:
+                self._send(key, state, pending)
+            except (Exception, TgApiException):  # keeps the thread alive, else flush() waits forever.
+                logger.exception("Editing message {key} failed.".format(key=key))
+            finally:
+                with self._condition:
+                    self._sending -= 1
+                    self._condition.notify_all()
+                # end with
+            # end try
+        # end while
+    # end def _work
+
+    def _send(self, key, state, pending):
+        """
+        Sends the edit, unless it doesn't change anything. Runs without the lock, only this thread sends.
+        A skipped or failed edit still counts for the window, e.g. after too many requests.
+        """
+        changed = dict(
+            (field, value) for field, value in pending.items()
+            if state.delivered.get(field, _MISSING) != (value[0] if field == "reply_markup" else value)
+        )
+        if not changed:
+            logger.debug("Skipping the edit of {key}, nothing changed.".format(key=key))
+            return
+        # end if
+        ids = {"inline_message_id": key} if not isinstance(key, tuple) else {"chat_id": key[0], "message_id": key[1]}
+        markup = pending.get("reply_markup", (None, None))[1]
+        try:
+            if any(field in changed for field in _TEXT_FIELDS):
+                self.bot.edit_message_text(
+                    pending["text"], parse_mode=pending["parse_mode"],
+                    disable_web_page_preview=pending["disable_web_page_preview"], reply_markup=markup, **ids
+                )
+            else:
+                self.bot.edit_message_reply_markup(reply_markup=markup, **ids)
+            # end if
+        except TgApiServerException as e:
+            if "not modified" not in (e.description or ""):
+                self._error(key, e)
+                return
+            # end if
+        except (Exception, TgApiException) as e:  # TgApiException isn't an Exception, e.g. TgApiParseException
+            self._error(key, e)
+            return
+        # end try
+        with self._condition:
+            for field, value in pending.items():
+                state.delivered[field] = value[0] if field == "reply_markup" else value
+            # end for
+        # end with
+    # end def _send
+
+    def _error(self, key, exception):
+        if self.on_error is None:
+            logger.warning("Editing message {key} failed: {e}".format(key=key, e=exception))
+            return
+        # end if
+        try:
+            self.on_error(key, exception)
+        except (Exception, TgApiException):
+            logger.exception("on_error failed for message {key}.".format(key=key))
+        # end try
+    # end def _error
+# end class EditCoalescer
+
+
+def _key(chat_id, message_id, inline_message_id):
+    if inline_message_id is not None:
+        return inline_message_id
+    # end if
+    assert(chat_id is not None and message_id is not None)
+    return chat_id, message_id
+# end def _key
+
+
+def _markup(reply_markup):
+    """ The markup and its json, which is compared to skip edits not changing it. """
+    return (reply_markup.to_json() if reply_markup is not None else None), reply_markup
+# end def _markup
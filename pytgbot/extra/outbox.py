@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""
+A persistent outbox: api calls are stored in a sqlite database first, and sent from there.
+Replies enqueued before a restart (e.g. a deploy) are sent after it::
+
+    outbox = Outbox(bot, "outbox.sqlite")
+    outbox.enqueue("send_message", chat_id, "Your order shipped!")  # takes the arguments of Bot.send_message
+    ...
+    outbox.close()  # waits until everything enqueued is stored
+
+`enqueue` only checks and serializes the call, storing it is done by a background thread, which commits all calls
+enqueued in `commit_interval` seconds in one transaction. So `enqueue` is fast, but a crash can lose the calls of
+the last `commit_interval` seconds. Use :meth:`Outbox.flush` to wait until they are stored.
+
+Workers send the stored calls, at most `rate` per second, and retry after network errors, server errors and
+`429 Too Many Requests`. Calls to the same chat are sent one after another, in the order they were enqueued.
+A call is marked done after telegram acknowledged it. If the process stops between both, it is sent again after the
+restart, so a call is sent at least once.
+"""
+import json
+import sqlite3
+import threading
+from itertools import count
+from time import sleep, time
+
+import requests
+from luckydonaldUtils.logger import logging
+
+from ..bot import Bot
+from ..dict_view import DictView
+from ..exceptions import TgApiServerException, TgApiTypeError, TgApiException
+from ._api_errors import response_parameters, retry_after_seconds
+
+try:
+    from time import monotonic as _now  # python 3
+except ImportError:
+    _now = time  # python 2
+# end try
+try:
+    from queue import Queue  # python 3
+except ImportError:
+    from Queue import Queue  # python 2
+# end try
+
+__author__ = 'luckydonald'
+__all__ = ["Outbox", "STATE_PENDING", "STATE_DONE", "STATE_FAILED"]
+logger = logging.getLogger(__name__)
+
+
+STATE_PENDING = 0
+STATE_DONE = 1
+STATE_FAILED = 2  # not retried anymore, see the `error` column
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    command TEXT NOT NULL,
+    params TEXT NOT NULL,
+    chat TEXT,
+    created REAL NOT NULL,
+    state INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_try REAL NOT NULL DEFAULT 0,
+    finished REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_state ON outbox (state, id);
+CREATE INDEX IF NOT EXISTS outbox_chat ON outbox (state, chat, id);
+"""
+
+
+class _Recorder(Bot):
+    """
+    A bot which doesn't send, but returns the command and the serialized parameters.
+    The checks of the :class:`Bot` methods still run, so invalid calls fail when enqueued.
+    """
+    def __init__(self, bot):
+        super(_Recorder, self).__init__(bot.api_key, return_python_objects=False)
+    # end def __init__
+
+    def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
+        if files:
+            raise TgApiTypeError("Uploads can't be stored in the outbox, send a file_id or url instead.")
+        # end if
+        url, params = self._prepare_request(command, query)
+        return command, params
+    # end def do
+# end class _Recorder
+
+
+class Outbox(object):
+    """
+    Stores api calls in a sqlite database, and sends them from there. See the module documentation.
+    Only one :class:`Outbox` may use a database file at a time.
+    """
+    def __init__(
+        self, bot, path, rate=30.0, workers=4, max_retries=5, commit_interval=0.05, keep_done=3600.0, on_result=None
+    ):
+        """
+        :param bot: The bot to send with.
+        :type  bot: pytgbot.bot.Bot
+
+        :param path: The sqlite database file, created if needed.
+        :type  path: str
+
+        :keyword rate: Maximum calls per second.
+        :type    rate: float
+
+        :keyword workers: Calls sent at the same time (to different chats).
+        :type    workers: int
+
+        :keyword max_retries: How often a call is retried, before it is marked failed.
+        :type    max_retries: int
+
+        :keyword commit_interval: Seconds the enqueued calls are collected, before they are committed together.
+        :type    commit_interval: float
+
+        :keyword keep_done: Seconds to keep the calls which are done or failed in the database, for inspection.
+        :type    keep_done: float
+
+        :keyword on_result: Called with `(entry_id, ok, detail)` for every call finished, from the worker threads.
+                            `detail` is the result of the call, or the exception or error description.
+        :type    on_result: callable
+        """
+        super(Outbox, self).__init__()
+        assert(rate > 0)
+        assert(workers >= 1)
+        assert(max_retries >= 0)
+        assert(commit_interval > 0)
+        self.bot = bot
+        self.path = path
+        self.rate = rate
+        self.workers = workers
+        self.max_retries = max_retries
+        self.commit_interval = commit_interval
+        self.keep_done = keep_done
+        self.on_result = on_result
+
+        self._recorder = _Recorder(bot)
+        db = self._connect()
+        try:
+            last_id = db.execute("SELECT MAX(id) FROM outbox").fetchone()[0] or 0
+        finally:
+            db.close()
+        # end try
+        self._ids = count(last_id + 1)
+        self._buffer = []  # enqueued calls, not committed yet: (id, command, params, chat, created)
+        self._results = []  # finished sends, not committed yet: (id, ok, retry, error)
+        self._committed = last_id  # the last enqueued id which is stored
+        self._enqueued = last_id  # the last id given out
+        self._in_flight = {}  # id: chat of the calls handed to the workers. Only used by the database thread.
+        self._idle = False  # if there was nothing to send at the last check
+        self._next_due = None  # the earliest `next_try` of the calls waiting for a retry, seen at the last check
+        self._closing = False
+        self._next_slot = 0.0  # when the next call may be sent, for the rate
+        self._tasks = Queue()
+        self._condition = threading.Condition(threading.Lock())
+        self._threads = [threading.Thread(target=self._run, name="outbox-database")] + [
+            threading.Thread(target=self._work, name="outbox-{i}".format(i=i)) for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+        # end for
+    # end def __init__
+
+    def enqueue(self, method, *args, **kwargs):
+        """
+        Adds a call of a :class:`pytgbot.bot.Bot` method, to be sent.
+        It is checked and serialized now, so invalid arguments raise here.
+
+        :param method: Name of the method, e.g. `"send_message"`.
+        :type  method: str
+
+        :param args: The arguments of the method.
+        :param kwargs: The keyword arguments of the method.
+
+        :return: The id of the entry in the database.
+        :rtype: int
+        """
+        command, params = getattr(self._recorder, method)(*args, **kwargs)
+        chat = params.get("chat_id")
+        entry = (command, json.dumps(params), None if chat is None else str(chat), time())
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("The outbox is closed.")
+            # end if
+            entry_id = self._enqueued = next(self._ids)
+            self._buffer.append((entry_id,) + entry)
+            self._idle = False
+        # end with
+        return entry_id
+    # end def enqueue
+
+    def flush(self, timeout=None):
+        """
+        Waits until the calls enqueued so far are stored, so they survive a crash.
+
+        :keyword timeout: Maximum seconds to wait, `None` is forever.
+        :type    timeout: float
+
+        :return: If they were stored in time.
+        :rtype: bool
+        """
+        with self._condition:
+            target = self._enqueued
+            self._condition.notify_all()  # commits at once
+            return self._wait(lambda: self._committed >= target, timeout)
+        # end with
+    # end def flush
+
+    def join(self, timeout=None):
+        """
+        Waits until every call was sent, or failed.
+
+        :keyword timeout: Maximum seconds to wait, `None` is forever.
+        :type    timeout: float
+
+        :return: If everything was sent in time.
+        :rtype: bool
+        """
+        with self._condition:
+            return self._wait(lambda: self._idle and not self._buffer, timeout)
+        # end with
+    # end def join
+
+    def close(self, timeout=None):
+        """
+        Stores the enqueued calls, waits for the ones being sent, and stops the threads.
+        Calls not sent yet stay in the database, for the next start.
+
+        :keyword timeout: Maximum seconds to wait for the threads.
+        :type    timeout: float
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        # end with
+        for thread in self._threads:
+            thread.join(timeout)
+        # end for
+    # end def close
+
+    def _wait(self, predicate, timeout):
+        """ Waits with the lock held, until the predicate is true. """
+        deadline = None if timeout is None else _now() + timeout
+        while not predicate():
+            wait = None if deadline is None else deadline - _now()
+            if wait is not None and wait <= 0:
+                return False
+            # end if
+            self._condition.wait(wait)
+        # end while
+        return True
+    # end def _wait
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")  # readers don't block the writer, and commits are cheap.
+        db.execute("PRAGMA synchronous=NORMAL")  # survives process crashes, only power loss can lose commits.
+        db.executescript(_SCHEMA)
+        return db
+    # end def _connect
+
+    def _run(self):
+        """ The database thread: commits the enqueued calls and the results, and hands the calls to the workers. """
+        db = self._connect()
+        last_cleanup = 0.0
+        try:
+            while True:
+                with self._condition:
+                    if not self._closing and not self._buffer and not self._results:
+                        self._condition.wait(self.commit_interval)
+                    # end if
+                    while self._closing and self._in_flight and not self._results:
+                        # only waiting for the results of the calls being sent, the workers notify.
+                        due = None if self._next_due is None else max(self._next_due - time(), self.commit_interval)
+                        self._condition.wait(due)
+                    # end while
+                    buffer, self._buffer = self._buffer, []
+                    results, self._results = self._results, []
+                    closing = self._closing
+                # end with
+                now = time()
+                with db:  # one transaction
+                    db.executemany(
+                        "INSERT INTO outbox (id, command, params, chat, created) VALUES (?, ?, ?, ?, ?)", buffer
+                    )
+                    for entry_id, ok, retry, error in results:
+                        self._in_flight.pop(entry_id, None)
+                        if ok:
+                            db.execute("UPDATE outbox SET state=?, finished=? WHERE id=?", (STATE_DONE, now, entry_id))
+                        elif retry is not None:
+                            db.execute(
+                                "UPDATE outbox SET attempts=attempts+1, next_try=?, error=? WHERE id=?",
+                                (now + retry, error, entry_id)
+                            )
+                        else:
+                            db.execute(
+                                "UPDATE outbox SET state=?, attempts=attempts+1, finished=?, error=? WHERE id=?",
+                                (STATE_FAILED, now, error, entry_id)
+                            )
+                        # end if
+                    # end for
+                    if now - last_cleanup > 60:
+                        db.execute(
+                            "DELETE FROM outbox WHERE state!=? AND finished<?", (STATE_PENDING, now - self.keep_done)
+                        )
+                        last_cleanup = now
+                    # end if
+                # end with
+                if buffer:
+                    with self._condition:
+                        self._committed = max(self._committed, buffer[-1][0])
+                        self._condition.notify_all()
+                    # end with
+                # end if
+                if closing:
+                    if not self._in_flight:
+                        return
+                    # end if
+                    continue
+                # end if
+                self._dispatch(db, now)
+            # end while
+        finally:
+            for _ in range(self.workers):
+                self._tasks.put(None)  # stops the workers
+            # end for
+            db.close()
+        # end try
+    # end def _run
+
+    def _dispatch(self, db, now):
+        """ Hands the calls which are due to the workers, at most one per chat, in the order they were enqueued. """
+        # Only the oldest pending call of each chat can be sent, so a chat with many calls queued doesn't
+        # take up the whole batch. Calls without a chat (e.g. answerCallbackQuery) don't wait for each other.
+        rows = db.execute(
+            "SELECT id, command, params, chat, attempts FROM outbox WHERE id IN ("
+            "   SELECT MIN(id) FROM outbox WHERE state=? AND chat IS NOT NULL GROUP BY chat"
+            "   UNION ALL SELECT id FROM outbox WHERE state=? AND chat IS NULL"
+            ") AND next_try<=? ORDER BY id LIMIT ?",
+            (STATE_PENDING, STATE_PENDING, now, self.workers * 2 + len(self._in_flight))
+        ).fetchall()
+        busy = set(self._in_flight.values())
+        for entry_id, command, params, chat, attempts in rows:
+            if len(self._in_flight) >= self.workers * 2:
+                break
+            # end if
+            if entry_id in self._in_flight or (chat is not None and chat in busy):
+                continue  # being sent
+            # end if
+            self._in_flight[entry_id] = chat
+            self._tasks.put((entry_id, command, json.loads(params), attempts))
+        # end for
+        next_due = db.execute(
+            "SELECT MIN(next_try) FROM outbox WHERE state=? AND next_try>?", (STATE_PENDING, now)
+        ).fetchone()[0]
+        pending = rows or next_due is not None
+        with self._condition:
+            self._next_due = next_due
+            self._idle = not pending and not self._in_flight and not self._buffer
+            if self._idle:
+                self._condition.notify_all()
+            # end if
+        # end with
+    # end def _dispatch
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            # end if
+            entry_id, command, params, attempts = task
+            try:
+                ok, retry, detail = self._send(command, params, attempts)
+            except (Exception, TgApiException) as e:  # TgApiException isn't an Exception
+                logger.exception("Sending outbox entry {id} failed.".format(id=entry_id))
+                ok, retry, detail = False, None, e
+            # end try
+            with self._condition:
+                self._results.append((entry_id, ok, retry, None if ok else str(detail)))
+                self._condition.notify_all()
+            # end with
+            if self.on_result is not None and retry is None:
+                try:
+                    self.on_result(entry_id, ok, detail)
+                except Exception:
+                    logger.exception("on_result failed for outbox entry {id}.".format(id=entry_id))
+                # end try
+            # end if
+        # end while
+    # end def _work
+
+    def _send(self, command, params, attempts):
+        """
+        :return: if it was sent, seconds until the retry (`None` if not retried), and the result or error.
+        :rtype: tuple
+        """
+        with self._condition:
+            now = _now()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + 1.0 / self.rate
+        # end with
+        if slot > now:
+            sleep(slot - now)
+        # end if
+        retry_after = min(2 ** attempts, 300)
+        try:
+            result = self.bot.do(command, **params)
+        except TgApiServerException as e:
+            error_code, description, detail = e.error_code, e.description, e
+            parameters = response_parameters(e.response)
+        except requests.RequestException as e:
+            logger.debug("Network error sending {command}: {e}".format(command=command, e=e))
+            return False, (retry_after if attempts < self.max_retries else None), e
+        else:
+            if not isinstance(result, DictView) or result.get("ok"):
+                return True, None, result
+            # end if
+            # return_python_objects=False doesn't raise
+            error_code, description = result.get("error_code"), result.get("description")
+            parameters, detail = result.get("parameters") or {}, description
+        # end try
+        if (error_code == 429 or (error_code or 0) >= 500) and attempts < self.max_retries:
+            if error_code == 429:
+                retry_after = parameters.get("retry_after") or retry_after_seconds(description)
+                logger.warning("Flood limit hit, pausing all sends for {seconds} seconds.".format(seconds=retry_after))
+                with self._condition:
+                    self._next_slot = max(self._next_slot, _now() + retry_after)  # pauses all workers
+                # end with
+            # end if
+            return False, retry_after, detail
+        # end if
+        return False, None, detail
+    # end def _send
+# end class Outbox
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Columnar view of many raw updates, for analytics over archives.
+
+Instead of an :class:`pytgbot.api_types.receivable.updates.Update` per update, only a few numbers are read from each
+received dict and appended to one :class:`array.array` per field ("struct of arrays")::
+
+    columns = UpdateColumns(archived_updates)  # list of dicts, as received from telegram
+    columns.chat_id[0], columns.kind[0], len(columns)
+
+    # with numpy installed, as numpy arrays:
+    cols = columns.as_numpy()
+    messages = cols["kind"] == KIND_MESSAGE
+    chats, counts = numpy.unique(cols["chat_id"][messages], return_counts=True)
+    commands = numpy.count_nonzero(cols["flags"] & FLAG_COMMAND)
+"""
+from array import array
+
+from luckydonaldUtils.logger import logging
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # only needed for UpdateColumns.as_numpy()
+# end try
+
+__author__ = 'luckydonald'
+__all__ = [
+    "UpdateColumns", "COLUMNS", "UPDATE_KINDS",
+    "KIND_MESSAGE", "KIND_EDITED_MESSAGE", "KIND_CHANNEL_POST", "KIND_EDITED_CHANNEL_POST",
+    "KIND_INLINE_QUERY", "KIND_CHOSEN_INLINE_RESULT", "KIND_CALLBACK_QUERY", "KIND_UNKNOWN",
+    "FLAG_PHOTO", "FLAG_AUDIO", "FLAG_DOCUMENT", "FLAG_STICKER", "FLAG_VIDEO", "FLAG_VOICE", "FLAG_CONTACT",
+    "FLAG_LOCATION", "FLAG_VENUE", "FLAG_GAME", "FLAG_MEDIA", "FLAG_COMMAND", "FLAG_REPLY", "FLAG_FORWARD",
+]
+logger = logging.getLogger(__name__)
+
+
+# values of the `kind` column, the index in UPDATE_KINDS.
+UPDATE_KINDS = (
+    "message", "edited_message", "channel_post", "edited_channel_post",
+    "inline_query", "chosen_inline_result", "callback_query",
+)
+KIND_MESSAGE = 0
+KIND_EDITED_MESSAGE = 1
+KIND_CHANNEL_POST = 2
+KIND_EDITED_CHANNEL_POST = 3
+KIND_INLINE_QUERY = 4
+KIND_CHOSEN_INLINE_RESULT = 5
+KIND_CALLBACK_QUERY = 6
+KIND_UNKNOWN = -1  # a kind of update newer than this code
+
+# bits of the `flags` column.
+FLAG_PHOTO = 1 << 0
+FLAG_AUDIO = 1 << 1
+FLAG_DOCUMENT = 1 << 2
+FLAG_STICKER = 1 << 3
+FLAG_VIDEO = 1 << 4
+FLAG_VOICE = 1 << 5
+FLAG_CONTACT = 1 << 6
+FLAG_LOCATION = 1 << 7
+FLAG_VENUE = 1 << 8
+FLAG_GAME = 1 << 9
+FLAG_MEDIA = (1 << 10) - 1  # any of the above
+FLAG_COMMAND = 1 << 10  # the text starts with a bot command
+FLAG_REPLY = 1 << 11  # has a reply_to_message
+FLAG_FORWARD = 1 << 12  # is forwarded
+
+_KINDS = dict((kind, i) for i, kind in enumerate(UPDATE_KINDS))
+_MESSAGE_KINDS = frozenset((KIND_MESSAGE, KIND_EDITED_MESSAGE, KIND_CHANNEL_POST, KIND_EDITED_CHANNEL_POST))
+_MESSAGE_FLAGS = {  # key in the message: flag
+    "photo": FLAG_PHOTO, "audio": FLAG_AUDIO, "document": FLAG_DOCUMENT, "sticker": FLAG_STICKER,
+    "video": FLAG_VIDEO, "voice": FLAG_VOICE, "contact": FLAG_CONTACT, "location": FLAG_LOCATION,
+    "venue": FLAG_VENUE, "game": FLAG_GAME, "reply_to_message": FLAG_REPLY, "forward_date": FLAG_FORWARD,
+}
+
+try:
+    array("q")
+    _INT64 = "q"  # python 3.3+
+except ValueError:
+    _INT64 = "l"  # python 2, 64 bit on 64 bit linux and mac.
+# end try
+
+# column: array typecode. Missing values are 0, e.g. the chat_id of inline queries.
+COLUMNS = (
+    ("update_id", _INT64),
+    ("date", _INT64),
+    ("chat_id", _INT64),
+    ("from_id", _INT64),
+    ("kind", "b"),
+    ("text_length", "l"),
+    ("flags", "l"),
+)
+
+
+class UpdateColumns(object):
+    """
+    The updates as columns: one :class:`array.array` per field, with one entry per update.
+
+    - `update_id`
+    - `date`: unix time of the message. For callback queries the one of its message, 0 for inline queries.
+    - `chat_id`: 0 if the update has no chat.
+    - `from_id`: id of the sending user, 0 if there is none (channel posts).
+    - `kind`: what the update is, see `KIND_*` and :data:`UPDATE_KINDS`.
+    - `text_length`: length of the message text or caption, the inline query or the callback data.
+      In UTF-16 code units, like telegram counts it (most emoji are 2), see :mod:`pytgbot.api_types.limits`.
+    - `flags`: bits of the `FLAG_*` constants, e.g. if the message has a photo.
+    """
+    def __init__(self, updates=None):
+        """
+        :keyword updates: The raw updates to add, see :meth:`extend`.
+        :type    updates: list of dict
+        """
+        super(UpdateColumns, self).__init__()
+        for name, typecode in COLUMNS:
+            setattr(self, name, array(typecode))
+        # end for
+        if updates is not None:
+            self.extend(updates)
+        # end if
+    # end def __init__
+
+    def extend(self, updates):
+        """
+        Adds the updates, as received from telegram (`dict`, e.g. after `json.loads`).
+
+        :param updates: The raw updates.
+        :type  updates: iterable of dict
+        """
+        # the appends bound once, this loop runs millions of times.
+        update_ids = self.update_id.append
+        dates = self.date.append
+        chat_ids = self.chat_id.append
+        from_ids = self.from_id.append
+        kinds = self.kind.append
+        text_lengths = self.text_length.append
+        flags_ = self.flags.append
+        message_kinds = _MESSAGE_KINDS
+        message_flags = _MESSAGE_FLAGS
+        for update in updates:
+            kind = KIND_UNKNOWN
+            content = None
+            for key in update:
+                if key != "update_id":
+                    kind = _KINDS.get(key, KIND_UNKNOWN)
+                    content = update[key]
+                    break
+                # end if
+            # end for
+            date = chat_id = from_id = text_length = flags = 0
+            if kind in message_kinds:
+                date = content["date"]
+                chat_id = content["chat"]["id"]
+                peer = content.get("from")
+                if peer:
+                    from_id = peer["id"]
+                # end if
+                text = content.get("text") or content.get("caption")
+                if text:
+                    text_length = _units(text)
+                    if text[0] == "/":
+                        for entity in content.get("entities", ()):
+                            if entity["offset"] == 0 and entity["type"] == "bot_command":
+                                flags = FLAG_COMMAND
+                            # end if
+                        # end for
+                    # end if
+                # end if
+                for key in content:
+                    flags |= message_flags.get(key, 0)
+                # end for
+            elif kind != KIND_UNKNOWN:
+                from_id = content["from"]["id"]
+                if kind == KIND_CALLBACK_QUERY:
+                    message = content.get("message")
+                    if message:
+                        date = message["date"]
+                        chat_id = message["chat"]["id"]
+                    # end if
+                    text_length = _units(content.get("data") or u"")
+                else:
+                    text_length = _units(content["query"])
+                # end if
+            # end if
+            update_ids(update["update_id"])
+            dates(date)
+            chat_ids(chat_id)
+            from_ids(from_id)
+            kinds(kind)
+            text_lengths(text_length)
+            flags_(flags)
+        # end for
+    # end def extend
+
+    def __len__(self):
+        """
+        Implements `len(updatecolumns_instance)`, the number of updates.
+        """
+        return len(self.update_id)
+    # end def __len__
+
+    def columns(self):
+        """
+        :return: all columns, by name.
+        :rtype: dict of array.array
+        """
+        return dict((name, getattr(self, name)) for name, _ in COLUMNS)
+    # end def columns
+
+    def as_numpy(self):
+        """
+        The columns as numpy arrays. They are copies: a numpy array sharing the memory of an :class:`array.array`
+        would make every later :meth:`extend` raise `BufferError` while it is alive.
+        So call it again after :meth:`extend`, to get the new updates too.
+
+        :return: all columns, by name.
+        :rtype: dict of numpy.ndarray
+        """
+        if numpy is None:
+            raise ImportError("numpy is needed for as_numpy(). Use columns() for the array.array columns.")
+        # end if
+        result = {}
+        for name, typecode in COLUMNS:
+            column = getattr(self, name)
+            result[name] = numpy.array(column, dtype=numpy.dtype(typecode))  # one memcpy, via the buffer protocol
+        # end for
+        return result
+    # end def as_numpy
+# end class UpdateColumns
+
+
+def _units(text):
+    """ Length in UTF-16 code units, like telegram counts it. """
+    return len(text.encode("utf-16-le")) // 2
+# end def _units
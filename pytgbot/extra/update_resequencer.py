@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import deque
+from time import time
+
+from luckydonaldUtils.logger import logging
+
+try:
+    from time import monotonic as _now  # python 3
+except ImportError:
+    _now = time  # python 2
+# end try
+
+__author__ = 'luckydonald'
+__all__ = ["UpdateResequencer", "get_chat_id"]
+logger = logging.getLogger(__name__)
+
+
+_CHAT_UPDATE_TYPES = ("message", "edited_message", "channel_post", "edited_channel_post")
+
+
+def _get(obj, key):
+    """ works on both :class:`pytgbot.api_types.receivable.updates.Update` and the raw `dict` (or `DictView`). """
+    if obj is None:
+        return None
+    # end if
+    if isinstance(obj, dict):
+        return obj.get(key)
+    # end if
+    return getattr(obj, key, None)
+# end def _get
+
+
+def get_chat_id(update):
+    """
+    The id of the chat an update belongs to.
+
+    :param update: The update.
+    :type  update: pytgbot.api_types.receivable.updates.Update | dict
+
+    :return: The chat id, or `None` if the update isn't bound to a chat (e.g. inline queries).
+    :rtype: int | None
+    """
+    for key in _CHAT_UPDATE_TYPES:
+        message = _get(update, key)
+        if message is not None:
+            return _get(_get(message, "chat"), "id")
+        # end if
+    # end for
+    callback_query = _get(update, "callback_query")
+    if callback_query is not None:
+        return _get(_get(_get(callback_query, "message"), "chat"), "id")
+    # end if
+    return None
+# end def get_chat_id
+
+
+class UpdateResequencer(object):
+    """
+    Brings updates received by a webhook back into `update_id` order.
+
+    With `max_connections` > 1 (see :meth:`pytgbot.bot.Bot.set_webhook`) telegram delivers updates concurrently,
+    so they can arrive out of order. Put every received update in with :meth:`put`,
+    and take them out in order with :meth:`get`.
+
+    Updates with a chat (see :func:`get_chat_id`) are held back until all smaller `update_id`s arrived,
+    so per chat the order is kept. Updates without a chat (inline queries, chosen inline results, ...)
+    don't need an order and are released at once.
+
+    A missing `update_id` is waited for `gap_timeout` seconds at most,
+    and at most `max_buffered` updates are held back. After that the gap is skipped.
+    A skipped update arriving late is released anyway (out of order), already released ones are dropped as duplicates.
+
+    Usage::
+
+        resequencer = UpdateResequencer(gap_timeout=1.0)
+
+        # in the webhook handler threads:
+        resequencer.put(update)
+
+        # in the worker:
+        while True:
+            update = resequencer.get()
+            handle(update)  # or hand it to a worker per get_chat_id(update)
+        # end while
+    """
+    def __init__(self, gap_timeout=1.0, max_buffered=1000, next_update_id=None):
+        """
+        :keyword gap_timeout: Seconds to wait for a missing `update_id`.
+        :type    gap_timeout: float
+
+        :keyword max_buffered: Maximum number of updates held back, waiting for a missing one.
+        :type    max_buffered: int
+
+        :keyword next_update_id: The `update_id` expected next. If `None`, the smallest one received during the first
+                                 `gap_timeout` seconds is used.
+        :type    next_update_id: int
+        """
+        super(UpdateResequencer, self).__init__()
+        assert(gap_timeout is not None and gap_timeout >= 0)
+        assert(max_buffered is not None and max_buffered > 0)
+        assert(next_update_id is None or isinstance(next_update_id, int))
+        self.gap_timeout = gap_timeout
+        self.max_buffered = max_buffered
+        self.next_update_id = next_update_id
+
+        self._buffer = {}  # update_id: (update, arrival time). `update` is `None` if already released.
+        self._first_arrival = None  # arrival time of the oldest held back update, for the gap timeout.
+        self._skipped = deque(maxlen=max_buffered)  # update_ids given up on
+        self._released = deque()
+        self._condition = threading.Condition(threading.Lock())
+    # end def __init__
+
+    def put(self, update):
+        """
+        Adds a received update. Everything which is in order now becomes available to :meth:`get`.
+
+        :param update: The update.
+        :type  update: pytgbot.api_types.receivable.updates.Update | dict
+        """
+        update_id = _get(update, "update_id")
+        assert(isinstance(update_id, int))
+        ordered = get_chat_id(update) is not None
+        with self._condition:
+            now = _now()
+            if self.next_update_id is not None and update_id < self.next_update_id:
+                if update_id in self._skipped:
+                    logger.warning("Update {id} arrived after its gap timed out, releasing it out of order.".format(
+                        id=update_id
+                    ))
+                    self._skipped.remove(update_id)
+                    self._release(update)
+                else:
+                    logger.debug("Dropping duplicate update {id}.".format(id=update_id))
+                # end if
+                return
+            # end if
+            if update_id in self._buffer:
+                logger.debug("Dropping duplicate update {id}.".format(id=update_id))
+                return
+            # end if
+            if not ordered:
+                self._release(update)
+                update = None  # only the update_id is needed to close the gap
+            # end if
+            if not self._buffer:
+                self._first_arrival = now
+            # end if
+            self._buffer[update_id] = (update, now)
+            self._advance(now)
+        # end with
+    # end def put
+
+    def get(self, block=True, timeout=None):
+        """
+        Returns the next update in order.
+
+        :keyword block: If it should wait for an update. If `False`, `None` is returned if there is none.
+        :type    block: bool
+
+        :keyword timeout: Maximum seconds to wait, `None` is forever. Returns `None` if nothing arrived in time.
+        :type    timeout: float
+
+        :return: The next update, or `None`.
+        :rtype: pytgbot.api_types.receivable.updates.Update | dict | None
+        """
+        with self._condition:
+            deadline = None if timeout is None else _now() + timeout
+            while True:
+                now = _now()
+                self._advance(now)
+                if self._released:
+                    return self._released.popleft()
+                # end if
+                if not block:
+                    return None
+                # end if
+                wait = None
+                if self._buffer:  # wake up when the gap times out
+                    wait = max(self._first_arrival + self.gap_timeout - now, 0)
+                # end if
+                if deadline is not None:
+                    if now >= deadline:
+                        return None
+                    # end if
+                    wait = deadline - now if wait is None else min(wait, deadline - now)
+                # end if
+                self._condition.wait(wait)
+            # end while
+        # end with
+    # end def get
+
+    def __len__(self):
+        """
+        Implements `len(resequencer_instance)`, the number of updates held back or waiting in :meth:`get`.
+        """
+        with self._condition:
+            return sum(1 for update, _ in self._buffer.values() if update is not None) + len(self._released)
+        # end with
+    # end def __len__
+
+    def _release(self, update):
+        self._released.append(update)
+        self._condition.notify()
+    # end def _release
+
+    def _advance(self, now):
+        """ Releases the consecutive updates from `next_update_id` on, skipping gaps which timed out. """
+        while self._buffer:
+            if self.next_update_id in self._buffer:
+                update, _ = self._buffer.pop(self.next_update_id)
+                self.next_update_id += 1
+                if update is not None:
+                    self._release(update)
+                # end if
+                continue
+            # end if
+            # the gap timeout starts with the oldest update waiting for it.
+            self._first_arrival = min(arrival for _, arrival in self._buffer.values())
+            if now - self._first_arrival < self.gap_timeout and len(self._buffer) <= self.max_buffered:
+                break  # still waiting for the gap to be filled.
+            # end if
+            lowest = min(self._buffer)
+            if self.next_update_id is not None:
+                logger.warning("Update(s) {first} to {last} missing, skipping.".format(
+                    first=self.next_update_id, last=lowest - 1
+                ))
+                if lowest - self.next_update_id <= self._skipped.maxlen:
+                    self._skipped.extend(range(self.next_update_id, lowest))
+                # end if
+            # end if
+            self.next_update_id = lowest
+        # end while
+    # end def _advance
+# end class UpdateResequencer
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Splitting texts longer than a message allows, see :meth:`pytgbot.bot.Bot.send_long_message`.
+
+    for chunk in split_text(text, parse_mode="html"):
+        bot.send_message(chat_id, chunk, parse_mode="html")
+    # end for
+
+The text is split at paragraphs if possible, else at line breaks, sentences, spaces, or as last resort anywhere.
+Lengths are counted like telegram does: without the markup, in UTF-16 code units (most emoji are 2).
+Formatting open at a split is closed at the end of the chunk, and opened again at the start of the next one,
+so every chunk is valid markup on its own.
+"""
+import re
+
+from luckydonaldUtils.logger import logging
+
+from .api_types.limits import MESSAGE_TEXT
+
+__author__ = 'luckydonald'
+__all__ = ["split_text"]
+logger = logging.getLogger(__name__)
+
+
+# break priorities, the best one in the second half of a chunk is used.
+_BREAK_PARAGRAPH = 3
+_BREAK_LINE = 2
+_BREAK_SENTENCE = 1
+_BREAK_SPACE = 0
+
+_HTML_TOKEN = re.compile(r"<(/?)([a-zA-Z]+)[^>]*>|&#?\w+;")
+_MARKDOWN_TOKEN = re.compile(r"```|`|\*|_|\[[^\]]*\]\([^)]*\)")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\(")
+
+
+class _Token(object):
+    """
+    A part of the text: a character, a markup tag, or something which can't be split (html entity, markdown link).
+    """
+    __slots__ = ["raw", "units", "opens", "closes"]
+
+    def __init__(self, raw, units, opens=None, closes=None):
+        """
+        :param raw: The text of it, with markup.
+        :type  raw: str
+
+        :param units: Length as telegram counts it.
+        :type  units: int
+
+        :keyword opens: Name of the formatting this starts, e.g. `"b"` or `"*"`.
+        :type    opens: str
+
+        :keyword closes: Name of the formatting this ends.
+        :type    closes: str
+        """
+        self.raw = raw
+        self.units = units
+        self.opens = opens
+        self.closes = closes
+    # end def __init__
+# end class _Token
+
+
+def _units(text):
+    """ Length in UTF-16 code units. """
+    return len(text) + sum(1 for char in text if ord(char) > 0xFFFF)
+# end def _units
+
+
+def _characters(text, tokens):
+    for char in text:
+        tokens.append(_Token(char, 2 if ord(char) > 0xFFFF else 1))
+    # end for
+# end def _characters
+
+
+def _tokenize(text, parse_mode):
+    """
+    :return: The text as tokens, with the tags of html and the markers of markdown.
+    :rtype: list of _Token
+    """
+    tokens = []
+    mode = (parse_mode or "").lower()
+    if mode == "html":
+        position = 0
+        for match in _HTML_TOKEN.finditer(text):
+            _characters(text[position:match.start()], tokens)
+            position = match.end()
+            if match.group(2) is None:  # entity, like &amp;
+                tokens.append(_Token(match.group(0), 1))
+            elif match.group(1):
+                tokens.append(_Token(match.group(0), 0, closes=match.group(2).lower()))
+            else:
+                tokens.append(_Token(match.group(0), 0, opens=match.group(2).lower()))
+            # end if
+        # end for
+        _characters(text[position:], tokens)
+    elif mode == "markdown":
+        # no nesting: inside an entity only its own marker is markup.
+        position = 0
+        current = None
+        for match in _MARKDOWN_TOKEN.finditer(text):
+            marker = match.group(0)
+            if current is not None and marker != current:
+                continue  # text inside of the entity
+            # end if
+            _characters(text[position:match.start()], tokens)
+            position = match.end()
+            if marker.startswith("["):
+                link_text = _MARKDOWN_LINK.match(marker).group(1)
+                tokens.append(_Token(marker, _units(link_text)))  # not split, the url would be needed twice.
+            elif current is None:
+                tokens.append(_Token(marker, 0, opens=marker))
+                current = marker
+            else:
+                tokens.append(_Token(marker, 0, closes=marker))
+                current = None
+            # end if
+        # end for
+        _characters(text[position:], tokens)
+    else:
+        _characters(text, tokens)
+    # end if
+    return tokens
+# end def _tokenize
+
+
+def _closing(token, parse_mode):
+    """ The markup closing the formatting the token opened. """
+    if parse_mode.lower() == "html":
+        return "</{name}>".format(name=token.opens)
+    # end if
+    return token.opens
+# end def _closing
+
+
+def _break_priority(tokens, index):
+    """ How good splitting before the whitespace token at `index` is, `None` if it isn't whitespace. """
+    char = tokens[index].raw
+    if char == "\n":
+        if index + 1 < len(tokens) and tokens[index + 1].raw == "\n":
+            return _BREAK_PARAGRAPH
+        # end if
+        return _BREAK_LINE
+    # end if
+    if char.isspace() and tokens[index].units:
+        if index > 0 and tokens[index - 1].raw in (".", "!", "?", u"…"):
+            return _BREAK_SENTENCE
+        # end if
+        return _BREAK_SPACE
+    # end if
+    return None
+# end def _break_priority
+
+
+def split_text(text, parse_mode=None, limit=None):
+    """
+    Splits the text into chunks, each short enough for one message.
+
+    :param text: The text, with markup if `parse_mode` is set.
+    :type  text: str
+
+    :keyword parse_mode: "html" or "markdown", in any case, or `None` for plain text.
+    :type    parse_mode: str
+
+    :keyword limit: Maximum length of a chunk, in UTF-16 code units without the markup.
+                    Defaults to the one of message texts, 4096.
+    :type    limit: int
+
+    :return: The chunks, without whitespace at the splits. At least one, if the text isn't just whitespace.
+    :rtype: list of str
+    """
+    if limit is None:
+        limit = MESSAGE_TEXT.maximum
+    # end if
+    assert(limit > 1)  # room for a character of 2 code units
+    tokens = _tokenize(text, parse_mode)
+    chunks = []
+    start = 0
+    stack = []  # the tokens of the formatting open at `start`
+    while start < len(tokens):
+        # walk as far as the limit allows, remembering the last break of each priority.
+        units = 0
+        end = start
+        breaks = {}  # priority: (index, units before it)
+        while end < len(tokens) and units + tokens[end].units <= limit:
+            priority = _break_priority(tokens, end)
+            if priority is not None and end > start:
+                breaks[priority] = (end, units)
+            # end if
+            units += tokens[end].units
+            end += 1
+        # end while
+        if end == start:
+            end += 1  # a markdown link longer than the limit, telegram will reject that chunk.
+        # end if
+        if end < len(tokens):  # too long, find the best split.
+            for priority in (_BREAK_PARAGRAPH, _BREAK_LINE, _BREAK_SENTENCE, _BREAK_SPACE):
+                if priority in breaks and breaks[priority][1] * 2 >= limit:
+                    end = breaks[priority][0]
+                    break
+                # end if
+            else:
+                if breaks:
+                    end = max(index for index, _ in breaks.values())
+                # end if
+            # end for
+            while end > start + 1 and tokens[end - 1].opens:
+                end -= 1  # don't end the chunk with an empty formatting.
+            # end while
+        # end if
+        chunk_end = end
+        while chunk_end > start and not tokens[chunk_end - 1].opens and not tokens[chunk_end - 1].closes and \
+                tokens[chunk_end - 1].raw.isspace():
+            chunk_end -= 1  # no trailing whitespace
+        # end while
+        parts = [token.raw for token in stack]
+        visible = 0
+        for token in tokens[start:chunk_end]:
+            parts.append(token.raw)
+            visible += token.units
+            if token.opens:
+                stack.append(token)
+            elif token.closes and stack:
+                stack.pop()
+            # end if
+        # end for
+        for token in tokens[chunk_end:end]:  # the formatting of the skipped whitespace still counts.
+            if token.opens:
+                stack.append(token)
+            elif token.closes and stack:
+                stack.pop()
+            # end if
+        # end for
+        parts.extend(_closing(token, parse_mode) for token in reversed(stack))
+        if visible:
+            chunks.append("".join(parts))
+        # end if
+        start = end
+        while start < len(tokens) and not tokens[start].opens and not tokens[start].closes and \
+                tokens[start].raw.isspace():
+            start += 1  # no leading whitespace
+        # end while
+    # end while
+    logger.debug("Split a text of {length} characters into {count} chunks.".format(length=len(text), count=len(chunks)))
+    return chunks
+# end def split_text
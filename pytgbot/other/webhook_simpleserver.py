@@ -9,9 +9,11 @@ from pytgbot import VERSION
 
 try:
     from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
     import urlparse
 except ImportError:
     from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
     import urllib.parse as urlparse
 # end try
 
@@ -28,11 +30,12 @@ logging.basicConfig()
 
 
 def handle_hook(payload):
-    logger.info("payload: " + payload)
+    logger.info("payload: {payload!r}".format(payload=payload))
 
 
 class HookHandler(BaseHTTPRequestHandler):
     server_version = "pytgbot/%s" % VERSION
+    protocol_version = "HTTP/1.1"  # keep-alive, telegram reuses it's connections.
 
     def do_GET(self):
         self.do_STUFF("get")
@@ -45,18 +48,30 @@ class HookHandler(BaseHTTPRequestHandler):
         self.do_STUFF("post")
 
     def do_STUFF(self, how):
-        # logger.warn("asdasd!")
-        length = int(self.headers['Content-Length'])
-        print(self.headers)
-        post_data = urlparse.parse_qs(self.rfile.read().decode('utf-8'))
-        logger.warn("data: " + post_data)
-        payload = json.loads(post_data['payload'][0])
-        self.send_response(200)
+        # Telegram posts the Update as json body.
+        # Read exactly Content-Length bytes, reading until EOF would block the kept alive connection.
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            payload = json.loads(self.rfile.read(length).decode('utf-8')) if length else None
+        except ValueError:
+            logger.warning("Got invalid json.", exc_info=True)
+            self.send_response(400)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        # end try
         self.handle_hook(payload)
+        self.send_response(200)  # only after processing, as telegram waits for us anyway.
+        self.send_header("Content-Length", "0")
+        self.end_headers()
 
     def handle_hook(self, payload):
-        # TODO process
-        self._callback(payload)
+        callback = getattr(self, "_callback", None)
+        if callback is None:
+            handle_hook(payload)
+        else:
+            callback(payload)
+        # end if
 
     @property
     def callback(self):
@@ -71,6 +86,14 @@ class HookHTTPServer(HTTPServer):
         pass
 
 
+class ThreadedHookHTTPServer(ThreadingMixIn, HTTPServer):
+    """
+    Handles each connection in it's own thread,
+    needed to receive more than one update at a time (`max_connections` > 1 in `set_webhook`).
+    """
+    daemon_threads = True
+
+
 if __name__ == '__main__':
     httpd = HTTPServer((HOST_NAME, PORT_NUMBER), HookHandler)
     def handle_request(request,):
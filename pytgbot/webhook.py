@@ -2,7 +2,6 @@
 from luckydonaldUtils.logger import logging
 
 from pytgbot.bot import Bot
-from pytgbot.exceptions import TgApiServerException, TgApiParseException
 
 __author__ = 'luckydonald'
 logger = logging.getLogger(__name__)
@@ -29,20 +28,18 @@ class Webhook(Bot):
         """
         from luckydonaldUtils.encoding import to_native as n
         from pytgbot.api_types.sendable import Sendable
-        from pytgbot.api_types import as_array
-        from DictObject import DictObject
-        import json
+        from pytgbot.dict_view import DictView
 
         params = {}
         for key in query.keys():
             element = query[key]
             if element is not None:
                 if isinstance(element, Sendable):
-                    params[key] = json.dumps(as_array(element))
+                    params[key] = element.to_json()  # cached for frozen ones, see Sendable.freeze()
                 else:
                     params[key] = element
         url = self._base_url.format(api_key=n(self.api_key), command=n(command))
-        return DictObject(url=url, params=params)
+        return DictView(url=url, params=params)
     # end def
 
     def _do_request(self, url, params=None, files=None, use_long_polling=None, request_timeout=None):
@@ -62,42 +59,26 @@ class Webhook(Bot):
         :keyword request_timeout: When the request should time out.
         :type    request_timeout: int
 
-        :return: json data received
-        :rtype: DictObject.DictObject
+        :return: The response, see :meth:`_process_response`.
+        :rtype: requests.Response
         """
         import requests
-        r = requests.post(url, params=params, files=files, stream=use_long_polling,
-                          verify=True, timeout=request_timeout)
-        # No self signed certificates. Telegram should be trustworthy anyway...
-        from DictObject import DictObject
-        try:
-            logger.debug("Response: {}".format(r.json()))
-            json_data = DictObject.objectify(r.json())
-        except Exception:
-            logger.exception("Parsing answer failed.\nRequest: {r!s}\nContent: {r.content}".format(r=r))
-            raise
-        # end if
-        json_data["response"] = r  # TODO: does this failes on json lists? Does TG does that?
-        return json_data
+        return requests.post(url, params=params, files=files, stream=use_long_polling,
+                             verify=True,  # No self signed certificates. Telegram should be trustworthy anyway...
+                             timeout=request_timeout)
     # end def
 
-    def _process_response(self, json_data):
-        # TG should always return an dict, with at least a status or something.
-        if self.return_python_objects:
-            if json_data.ok != True:
-                raise TgApiServerException(
-                    error_code=json_data.error_code if "error_code" in json_data else None,
-                    response=json_data.response if "response" in json_data else None,
-                    description=json_data.description if "description" in json_data else None,
-                    request=r.request
-                )
-            # end if not ok
-            if "result" not in json_data:
-                raise TgApiParseException('Key "result" is missing.')
-            # end if no result
-            return json_data.result
-        # end if return_python_objects
-        return json_data
+    def _process_response(self, r):
+        """
+        Parses the response, like :meth:`pytgbot.bot.Bot._postprocess_request`.
+
+        :param r: the request response
+        :type  r: requests.Response
+
+        :return: The json response from the server, or, if `self.return_python_objects` is `True`, a parsed return type.
+        :rtype: pytgbot.dict_view.DictView | pytgbot.api_types.receivable.Receivable
+        """
+        return self._postprocess_request(r)
     # end def
 
     def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
@@ -131,18 +112,26 @@ class Webhook(Bot):
         :param query: will get json encoded.
 
         :return: The json response from the server, or, if `self.return_python_objects` is `True`, a parsed return type.
-        :rtype: DictObject.DictObject | pytgbot.api_types.receivable.Receivable
+        :rtype: pytgbot.dict_view.DictView | pytgbot.api_types.receivable.Receivable
         """
+        for hook in self.request_hooks:
+            hook(command, query)
+        # end for
+        if self.chat_migrations is not None:
+            query = self.chat_migrations.rewrite(query)
+        # end if
         params = self._prepare_request(command, query)
         r = self._do_request(
             params.url, params=params.params,
-            files=files, stream=use_long_polling,  timeout=request_timeout
+            files=files, use_long_polling=use_long_polling, request_timeout=request_timeout
         )
+        retry_query = self._migrated_query(r, command, query, files)  # learns the migration, like Bot.do
+        if retry_query is not None:
+            params = self._prepare_request(command, retry_query)
+            r = self._do_request(
+                params.url, params=params.params,
+                files=files, use_long_polling=use_long_polling, request_timeout=request_timeout
+            )
+        # end if
         return self._process_response(r)
-
-
-
-
-
-
     # end def do
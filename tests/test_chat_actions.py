@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of :mod:`pytgbot.extra.chat_actions`.
+
+    python -m unittest discover tests
+"""
+import json
+import threading
+import time
+import unittest
+
+import requests
+
+from pytgbot.bot import Bot
+from pytgbot.extra.chat_actions import ChatActionKeeper
+
+__author__ = 'luckydonald'
+
+
+CHAT_ID = 1234
+
+
+class StopOnSendTest(unittest.TestCase):
+    def setUp(self):
+        self.sent = []  # commands, in the order they were sent
+        self.lock = threading.Lock()
+        self.post = requests.post
+        requests.post = self.fake_post
+        self.bot = Bot("123:test")
+        self.keeper = ChatActionKeeper(self.bot, interval=0.01, rate=1000.0)
+    # end def setUp
+
+    def tearDown(self):
+        self.keeper.close()
+        requests.post = self.post
+    # end def tearDown
+
+    def fake_post(self, url, params=None, **kwargs):
+        with self.lock:
+            self.sent.append(url.rpartition("/")[2])
+        # end with
+        time.sleep(0.002)  # so an action can be in flight while the reply is sent
+        r = requests.Response()
+        r.status_code = 200
+        r._content = json.dumps({"ok": True, "result": True}).encode("utf-8")
+        return r
+    # end def fake_post
+
+    def test_reply_stops_the_action(self):
+        with self.keeper.action(CHAT_ID, "upload_photo"):
+            time.sleep(0.1)
+            self.bot.do("sendMessage", chat_id=CHAT_ID, text="Done.")
+            self.assertEqual(self.keeper.active_chats(), [])
+            time.sleep(0.05)  # the worker would have sent it again by now
+        # end with
+        with self.lock:
+            self.assertEqual(self.sent[-1], "sendMessage")
+            self.assertGreater(self.sent.count("sendChatAction"), 1)
+        # end with
+    # end def test_reply_stops_the_action
+
+    def test_other_chats_keep_their_action(self):
+        with self.keeper.action(CHAT_ID):
+            self.bot.do("sendMessage", chat_id=CHAT_ID + 1, text="Unrelated.")
+            self.assertEqual(self.keeper.active_chats(), [CHAT_ID])
+        # end with
+    # end def test_other_chats_keep_their_action
+
+    def test_close_removes_the_hook(self):
+        self.keeper.close()
+        self.assertEqual(self.bot.request_hooks, [])
+    # end def test_close_removes_the_hook
+# end class StopOnSendTest
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
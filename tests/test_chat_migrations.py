@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of :mod:`pytgbot.chat_migrations`, and of the retry of `Bot.do` and `Webhook.do` after a migration.
+
+    python -m unittest discover tests
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+
+import requests
+
+from pytgbot.bot import Bot
+from pytgbot.chat_migrations import ChatMigrations
+from pytgbot.exceptions import TgApiServerException
+from pytgbot.webhook import Webhook
+
+__author__ = 'luckydonald'
+
+
+OLD_CHAT_ID = -1234
+NEW_CHAT_ID = -1001234
+
+
+def response(json_data, status_code=200):
+    """ A :class:`requests.Response` with the given json. """
+    r = requests.Response()
+    r.status_code = status_code
+    r._content = json.dumps(json_data).encode("utf-8")
+    return r
+# end def response
+
+
+def migrated_response():
+    return response({
+        "ok": False, "error_code": 400, "description": "Bad Request: group chat was upgraded to a supergroup chat",
+        "parameters": {"migrate_to_chat_id": NEW_CHAT_ID},
+    }, status_code=400)
+# end def migrated_response
+
+
+class ChatMigrationsTest(unittest.TestCase):
+    def test_rewrite(self):
+        migrations = ChatMigrations()
+        self.assertTrue(migrations.add(OLD_CHAT_ID, NEW_CHAT_ID))
+        self.assertFalse(migrations.add(OLD_CHAT_ID, NEW_CHAT_ID))
+        query = {"chat_id": OLD_CHAT_ID, "from_chat_id": str(OLD_CHAT_ID), "text": "Hello"}
+        rewritten = migrations.rewrite(query)
+        self.assertEqual(rewritten, {"chat_id": NEW_CHAT_ID, "from_chat_id": NEW_CHAT_ID, "text": "Hello"})
+        self.assertEqual(query["chat_id"], OLD_CHAT_ID)  # a copy
+    # end def test_rewrite
+
+    def test_unknown_chats_are_kept(self):
+        migrations = ChatMigrations()
+        migrations.add(OLD_CHAT_ID, NEW_CHAT_ID)
+        query = {"chat_id": "@channel", "text": "Hello"}
+        self.assertIs(migrations.rewrite(query), query)
+        self.assertEqual(migrations.resolve(42), 42)
+    # end def test_unknown_chats_are_kept
+
+    def test_observe(self):
+        migrations = ChatMigrations()
+        migrations.observe({"update_id": 1, "message": {
+            "message_id": 1, "date": 0, "chat": {"id": NEW_CHAT_ID, "type": "supergroup"},
+            "migrate_from_chat_id": OLD_CHAT_ID,
+        }})
+        self.assertEqual(migrations.resolve(OLD_CHAT_ID), NEW_CHAT_ID)
+    # end def test_observe
+
+    def test_file(self):
+        folder = tempfile.mkdtemp()
+        try:
+            path = os.path.join(folder, "chat_migrations.json")
+            ChatMigrations(path).add(OLD_CHAT_ID, NEW_CHAT_ID)
+            self.assertEqual(ChatMigrations(path).resolve(OLD_CHAT_ID), NEW_CHAT_ID)
+        finally:
+            shutil.rmtree(folder)
+        # end try
+    # end def test_file
+# end class ChatMigrationsTest
+
+
+class BotRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.responses = []
+        self.sent = []  # (params, content of the files)
+        self.post = requests.post
+        requests.post = self.fake_post
+        self.migrations = ChatMigrations()
+        self.bot = Bot("123:test", chat_migrations=self.migrations)
+    # end def setUp
+
+    def tearDown(self):
+        requests.post = self.post
+    # end def tearDown
+
+    def fake_post(self, url, params=None, files=None, **kwargs):
+        contents = dict((name, value[1].read()) for name, value in (files or {}).items())
+        self.sent.append((params, contents))
+        return self.responses.pop(0)
+    # end def fake_post
+
+    def test_migrated_chat_is_sent_again(self):
+        self.responses = [migrated_response(), response({"ok": True, "result": {"message_id": 1}})]
+        result = self.bot.do("sendMessage", chat_id=OLD_CHAT_ID, text="Hello")
+        self.assertEqual(result, {"message_id": 1})
+        self.assertEqual([params["chat_id"] for params, _ in self.sent], [OLD_CHAT_ID, NEW_CHAT_ID])
+        self.assertEqual(self.migrations.resolve(OLD_CHAT_ID), NEW_CHAT_ID)
+    # end def test_migrated_chat_is_sent_again
+
+    def test_known_migration_is_sent_to_the_new_chat(self):
+        self.migrations.add(OLD_CHAT_ID, NEW_CHAT_ID)
+        self.responses = [response({"ok": True, "result": {"message_id": 1}})]
+        self.bot.do("sendMessage", chat_id=OLD_CHAT_ID, text="Hello")
+        self.assertEqual([params["chat_id"] for params, _ in self.sent], [NEW_CHAT_ID])
+    # end def test_known_migration_is_sent_to_the_new_chat
+
+    def test_retried_only_once(self):
+        self.responses = [migrated_response(), migrated_response(), migrated_response()]
+        self.assertRaises(TgApiServerException, self.bot.do, "sendMessage", chat_id=OLD_CHAT_ID, text="Hello")
+        self.assertEqual(len(self.sent), 2)
+    # end def test_retried_only_once
+
+    def test_other_errors_are_not_retried(self):
+        self.responses = [response({"ok": False, "error_code": 400, "description": "Bad Request"}, 400)]
+        self.assertRaises(TgApiServerException, self.bot.do, "sendMessage", chat_id=OLD_CHAT_ID, text="Hello")
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(len(self.migrations), 0)
+    # end def test_other_errors_are_not_retried
+
+    def test_files_are_rewound(self):
+        self.responses = [migrated_response(), response({"ok": True, "result": {"message_id": 1}})]
+        photo = BytesIO(b"not really a jpeg")
+        self.bot.do("sendPhoto", files={"photo": ("photo.jpg", photo)}, chat_id=OLD_CHAT_ID)
+        self.assertEqual([contents["photo"] for _, contents in self.sent], [b"not really a jpeg"] * 2)
+    # end def test_files_are_rewound
+# end class BotRetryTest
+
+
+class WebhookRetryTest(BotRetryTest):
+    """ The same, with the :class:`Webhook`. """
+    def setUp(self):
+        super(WebhookRetryTest, self).setUp()
+        self.bot = Webhook("123:test", chat_migrations=self.migrations)
+    # end def setUp
+# end class WebhookRetryTest
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of :mod:`pytgbot.api_types.engine`: the `from_array`/`to_array` of the classes give the same as the engine.
+
+    python -m unittest discover tests
+"""
+import json
+import os
+import sys
+import unittest
+
+from pytgbot.api_types import Frozen, engine
+from pytgbot.api_types.receivable.peer import User, intern_peers
+from pytgbot.api_types.receivable.updates import Update
+from pytgbot.api_types.sendable.inline import InlineQueryResultArticle, InlineQueryResultLocation
+from pytgbot.api_types.sendable.inline import InputTextMessageContent
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardButton, InlineKeyboardMarkup
+from pytgbot.exceptions import TgApiLimitException
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+from sample_updates import mixed_updates  # noqa: E402
+
+__author__ = 'luckydonald'
+
+
+def results():
+    """ Inline query results, with nested objects, optional fields and a float. """
+    keyboard = InlineKeyboardMarkup([[InlineKeyboardButton(u"Vote", callback_data=u"vote:1")]])
+    return [
+        InlineQueryResultArticle(u"1", u"Title", InputTextMessageContent(u"<b>Text</b>", parse_mode=u"html")),
+        InlineQueryResultArticle(u"2", u"Title", InputTextMessageContent(u"Text"), reply_markup=keyboard, url=u"x"),
+        InlineQueryResultLocation(u"3", 1.5, -2.25, u"Somewhere"),
+    ]
+# end def results
+
+
+class SameOutputTest(unittest.TestCase):
+    def setUp(self):
+        self.updates = mixed_updates(300)
+    # end def setUp
+
+    def test_decode(self):
+        for array in self.updates:
+            self.assertEqual(Update.from_array(array), engine.decode(Update, array))
+            self.assertEqual(Update.from_array_keep_raw(array), engine.decode(Update, array))
+        # end for
+    # end def test_decode
+
+    def test_encode(self):
+        for array in self.updates:
+            update = Update.from_array(array)
+            self.assertEqual(update.to_array(), engine.encode(update))
+            self.assertEqual(update.to_array(), array)
+            update = Update.from_array_keep_raw(array)
+            self.assertIs(update.to_array(), array)
+            self.assertIs(engine.encode(update), array)
+        # end for
+    # end def test_encode
+
+    def test_sendable(self):
+        for result in results():
+            self.assertEqual(result.to_array(), engine.encode(result))
+            self.assertEqual(json.loads(engine.dumps(result)), result.to_array())
+        # end for
+        keyboard = results()[1].reply_markup
+        self.assertEqual(InlineKeyboardMarkup.from_array(keyboard.to_array()), keyboard)
+    # end def test_sendable
+
+    def test_values_are_converted(self):
+        user = User(1, u"a")
+        user.id = "1"  # set by hand, past the asserts of __init__.
+        self.assertEqual(user.to_array(), {"id": 1, "first_name": u"a"})
+    # end def test_values_are_converted
+
+    def test_limits_are_checked(self):
+        content = InputTextMessageContent(u"x" * 4097)
+        self.assertRaises(TgApiLimitException, content.to_array)
+        self.assertRaises(TgApiLimitException, engine.encode, content)
+    # end def test_limits_are_checked
+# end class SameOutputTest
+
+
+class InternTest(unittest.TestCase):
+    def tearDown(self):
+        intern_peers(0)
+    # end def tearDown
+
+    def test_engine_interns_peers(self):
+        intern_peers()
+        array = mixed_updates(1)[0]  # a message
+        self.assertIsInstance(engine.decode(Update, array).message.chat, Frozen)
+        self.assertIs(engine.decode(Update, array).message.chat, Update.from_array(array).message.chat)
+    # end def test_engine_interns_peers
+# end class InternTest
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of `==` and `hash()` of the api types: `a == b` has to imply `hash(a) == hash(b)`.
+
+    python -m unittest discover tests
+"""
+import unittest
+
+from pytgbot.api_types.receivable.media import PhotoSize, MessageEntity
+from pytgbot.api_types.receivable.peer import User, Chat
+from pytgbot.api_types.receivable.updates import Message, CallbackGame
+from pytgbot.api_types.sendable.reply_markup import InlineKeyboardButton, InlineKeyboardMarkup, KeyboardButton
+
+__author__ = 'luckydonald'
+
+
+def pairs():
+    """ Pairs of equal objects, built separately. """
+    def entity():
+        return MessageEntity(u"mention", 0, 5, user=User(2, u"b"))
+    # end def entity
+
+    def play():
+        return InlineKeyboardButton(u"Play", callback_game=CallbackGame())
+    # end def play
+
+    def vote():
+        return InlineKeyboardButton(u"Vote", callback_data=u"vote:1")
+    # end def vote
+
+    return [
+        (User(1, u"a"), User(1, u"a")),
+        (User(1, u"a", username=u"b"), User(1, u"a", username=u"b").freeze()),
+        (Chat(-5, u"group", title=u"Group"), Chat(-5, u"group", title=u"Group")),
+        (PhotoSize(u"file", 90, 90), PhotoSize(u"file", 90, 90).freeze()),
+        (entity(), entity()),
+        (entity(), entity().freeze()),
+        (KeyboardButton(u"Yes"), KeyboardButton(u"Yes").freeze()),
+        (play(), play()),
+        (vote(), vote().freeze()),
+    ]
+# end def pairs
+
+
+def markup():
+    """ Not hashable, unless frozen. """
+    return InlineKeyboardMarkup([[InlineKeyboardButton(u"Vote", callback_data=u"vote:1")]])
+# end def markup
+
+
+class HashTest(unittest.TestCase):
+    def test_equal_objects_hash_equal(self):
+        for a, b in pairs():
+            self.assertEqual(a, b)
+            self.assertEqual(b, a)
+            self.assertEqual(hash(a), hash(b), (a, b))
+        # end for
+    # end def test_equal_objects_hash_equal
+
+    def test_sets_and_dict_keys(self):
+        a, b = User(1, u"a"), User(1, u"a")
+        self.assertEqual(len({a, b}), 1)
+        self.assertEqual({a.freeze(): 1}.get(b), 1)  # frozen key, found with its mutable twin
+        self.assertEqual({b: 1}.get(a.freeze()), 1)  # and the reverse
+    # end def test_sets_and_dict_keys
+
+    def test_different_objects(self):
+        self.assertNotEqual(User(1, u"a"), User(2, u"a"))
+        self.assertNotEqual(User(1, u"a"), User(1, u"b"))
+        self.assertEqual(len({User(1, u"a"), User(2, u"a")}), 2)
+    # end def test_different_objects
+
+    def test_frozen_hash_is_cached(self):
+        frozen = markup().freeze()
+        self.assertIsNone(frozen._hash)
+        value = hash(frozen)
+        self.assertEqual(frozen._hash, value)
+        self.assertEqual(hash(markup().freeze()), value)
+    # end def test_frozen_hash_is_cached
+
+    def test_other_mutable_objects_are_unhashable(self):
+        self.assertRaises(TypeError, hash, markup())
+        message = Message(1, 0, Chat(1, u"private"), text=u"Hi")
+        self.assertRaises(TypeError, hash, message)
+        self.assertEqual(hash(message.freeze()), hash(Message(1, 0, Chat(1, u"private"), text=u"Hi").freeze()))
+    # end def test_other_mutable_objects_are_unhashable
+# end class HashTest
+
+
+def chain(length):
+    """ A message replying to a message replying to ... `length` messages deep. """
+    message = None
+    for message_id in range(length):
+        message = Message(message_id, 0, Chat(1, u"private"), text=u"Hi", reply_to_message=message)
+    # end for
+    return message
+# end def chain
+
+
+class DeepChainTest(unittest.TestCase):
+    """ Longer than the recursion limit, nothing may recurse. """
+    LENGTH = 20000
+
+    def test_equal(self):
+        self.assertEqual(chain(self.LENGTH), chain(self.LENGTH))
+        other = chain(self.LENGTH)
+        message = other
+        while message.reply_to_message is not None:
+            message = message.reply_to_message
+        # end while
+        message.text = u"Bye"
+        self.assertNotEqual(chain(self.LENGTH), other)
+    # end def test_equal
+
+    def test_freeze_and_hash(self):
+        frozen = chain(self.LENGTH).freeze()
+        self.assertEqual(frozen, chain(self.LENGTH))
+        self.assertEqual(hash(frozen), hash(chain(self.LENGTH).freeze()))
+        self.assertRaises(AttributeError, setattr, frozen.reply_to_message, "text", u"Bye")
+    # end def test_freeze_and_hash
+# end class DeepChainTest
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of :mod:`pytgbot.api_types.limits`, and the checks of :meth:`pytgbot.bot.Bot.answer_inline_query`.
+
+    python -m unittest discover tests
+"""
+import unittest
+
+from pytgbot.api_types.limits import Limit, BYTES, CALLBACK_DATA, MESSAGE_TEXT, INLINE_QUERY_RESULTS
+from pytgbot.api_types.limits import without_markup
+from pytgbot.api_types.sendable.inline import InlineQueryResultArticle, InputTextMessageContent
+from pytgbot.bot import Bot
+from pytgbot.exceptions import TgApiLimitException
+
+__author__ = 'luckydonald'
+
+
+EMOJI = u"\U0001F600"  # 4 bytes in UTF-8, 2 UTF-16 code units
+
+
+class CountingLimit(Limit):
+    """ Remembers how often the size had to be computed, which the fast path skips. """
+    __slots__ = ["sized"]
+
+    def __init__(self, minimum, maximum, unit):
+        super(CountingLimit, self).__init__(minimum, maximum, unit)
+        self.sized = 0
+    # end def __init__
+
+    def size(self, value, parse_mode=None):
+        self.sized += 1
+        return super(CountingLimit, self).size(value, parse_mode)
+    # end def size
+# end class CountingLimit
+
+
+class FastPathTest(unittest.TestCase):
+    def test_short_values_skip_the_size(self):
+        limit = CountingLimit(1, 64, BYTES)
+        limit.check("x" * 16, "field")
+        limit.check(EMOJI * 16, "field")  # 16 * 4 = 64, the worst case still fits.
+        self.assertEqual(limit.sized, 0)
+    # end def test_short_values_skip_the_size
+
+    def test_longer_values_are_measured(self):
+        limit = CountingLimit(1, 64, BYTES)
+        limit.check("x" * 17, "field")
+        self.assertEqual(limit.sized, 1)
+    # end def test_longer_values_are_measured
+
+    def test_too_short_values_are_measured(self):
+        limit = CountingLimit(1, 64, BYTES)
+        self.assertRaises(TgApiLimitException, limit.check, "", "field")
+        self.assertEqual(limit.sized, 1)
+    # end def test_too_short_values_are_measured
+
+    def test_bytes_edges(self):
+        CALLBACK_DATA.check("x" * 64, "field")
+        CALLBACK_DATA.check(u"\xe9" * 32, "field")  # 2 bytes each
+        self.assertRaises(TgApiLimitException, CALLBACK_DATA.check, "x" * 65, "field")
+        self.assertRaises(TgApiLimitException, CALLBACK_DATA.check, u"\xe9" * 33, "field")
+        self.assertRaises(TgApiLimitException, CALLBACK_DATA.check, EMOJI * 17, "field")
+    # end def test_bytes_edges
+
+    def test_characters_edges(self):
+        MESSAGE_TEXT.check("x" * 4096, "field")
+        MESSAGE_TEXT.check(EMOJI * 2048, "field")
+        self.assertRaises(TgApiLimitException, MESSAGE_TEXT.check, "x" * 4097, "field")
+        self.assertRaises(TgApiLimitException, MESSAGE_TEXT.check, EMOJI * 2049, "field")
+    # end def test_characters_edges
+
+    def test_exception(self):
+        try:
+            CALLBACK_DATA.check("x" * 65, "InlineKeyboardButton.callback_data")
+        except TgApiLimitException as e:
+            self.assertEqual(e.field, "InlineKeyboardButton.callback_data")
+            self.assertEqual(e.size, 65)
+            self.assertIs(e.limit, CALLBACK_DATA)
+            self.assertIn("65 bytes, but must be 1-64 bytes", str(e))
+        else:
+            self.fail("no exception")
+        # end try
+    # end def test_exception
+
+    def test_items(self):
+        INLINE_QUERY_RESULTS.check([None] * 50, "results")
+        self.assertRaises(TgApiLimitException, INLINE_QUERY_RESULTS.check, [None] * 51, "results")
+    # end def test_items
+# end class FastPathTest
+
+
+class WithoutMarkupTest(unittest.TestCase):
+    def test_html(self):
+        self.assertEqual(without_markup('<b>a</b> &amp; <a href="http://example.com">b</a>', "html"), "a & b")
+    # end def test_html
+
+    def test_markdown(self):
+        self.assertEqual(without_markup("*a* [b](http://example.com) _c_ `d`", "Markdown"), "a b c d")
+    # end def test_markdown
+
+    def test_unknown_parse_mode_keeps_the_text(self):
+        self.assertEqual(without_markup("<b>a</b>", "something"), "<b>a</b>")
+    # end def test_unknown_parse_mode_keeps_the_text
+
+    def test_markup_is_not_counted(self):
+        MESSAGE_TEXT.check("<b>" + "x" * 4096 + "</b>", "field", "HTML")
+        MESSAGE_TEXT.check("*" + "x" * 4096 + "*", "field", "markdown")
+        MESSAGE_TEXT.check("&amp;" * 4096, "field", "html")
+        self.assertRaises(TgApiLimitException, MESSAGE_TEXT.check, "<b>" + "x" * 4097 + "</b>", "field", "html")
+        self.assertRaises(TgApiLimitException, MESSAGE_TEXT.check, "<b>" + "x" * 4096 + "</b>", "field")
+    # end def test_markup_is_not_counted
+
+    def test_message_text_of_the_content(self):
+        InputTextMessageContent("<b>" + "x" * 4096 + "</b>", parse_mode="html").to_array()
+        content = InputTextMessageContent("x" * 4097)
+        self.assertRaises(TgApiLimitException, content.to_array)
+    # end def test_message_text_of_the_content
+# end class WithoutMarkupTest
+
+
+class NotSendingBot(Bot):
+    def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
+        raise AssertionError("should have failed before sending")
+    # end def do
+# end class NotSendingBot
+
+
+class InlineResultIdTest(unittest.TestCase):
+    def result(self, result_id):
+        return InlineQueryResultArticle(result_id, "Title", InputTextMessageContent("Text"))
+    # end def result
+
+    def test_duplicate_id(self):
+        bot = NotSendingBot("123:test")
+        try:
+            bot.answer_inline_query("42", [self.result("a"), self.result("b"), self.result("a")])
+        except TgApiLimitException as e:
+            self.assertEqual(e.field, "InlineQueryResult.id")
+            self.assertEqual(e.value, "a")
+            self.assertIn("twice", str(e))
+        else:
+            self.fail("no exception")
+        # end try
+    # end def test_duplicate_id
+
+    def test_unique_ids_are_sent(self):
+        sent = {}
+
+        class SendingBot(Bot):
+            def do(self, command, files=None, use_long_polling=False, request_timeout=None, **query):
+                sent.update(query, command=command)
+                return True
+            # end def do
+        # end class SendingBot
+
+        SendingBot("123:test").answer_inline_query("42", [self.result("a"), self.result("b")])
+        self.assertEqual(sent["command"], "answerInlineQuery")
+        self.assertIn('"id":"b"', sent["results"])
+    # end def test_unique_ids_are_sent
+
+    def test_id_too_long(self):
+        bot = NotSendingBot("123:test")
+        self.assertRaises(TgApiLimitException, bot.answer_inline_query, "42", [self.result("x" * 65)])
+    # end def test_id_too_long
+# end class InlineResultIdTest
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
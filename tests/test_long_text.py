@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of :func:`pytgbot.long_text.split_text`.
+
+    python -m unittest discover tests
+"""
+import re
+import unittest
+
+from pytgbot.long_text import split_text
+
+__author__ = 'luckydonald'
+
+
+EMOJI = u"\U0001F600"  # 2 UTF-16 code units
+_HTML_TAG = re.compile(r"<(/?)([a-zA-Z]+)[^>]*>")
+
+
+def units(text):
+    """ Length like telegram counts it, in UTF-16 code units. """
+    return len(text.encode("utf-16-le")) // 2
+# end def units
+
+
+def html_tags(chunk):
+    """ The names of the tags of the chunk, asserting every one opened is closed again, in order. """
+    stack = []
+    for match in _HTML_TAG.finditer(chunk):
+        if match.group(1):
+            assert stack and stack.pop() == match.group(2), chunk
+        else:
+            stack.append(match.group(2))
+        # end if
+    # end for
+    assert not stack, chunk
+# end def html_tags
+
+
+class SplitPlainTextTest(unittest.TestCase):
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(split_text("Hello world."), ["Hello world."])
+    # end def test_short_text_is_one_chunk
+
+    def test_whitespace_only_has_no_chunks(self):
+        self.assertEqual(split_text("   \n ", limit=5), [])
+    # end def test_whitespace_only_has_no_chunks
+
+    def test_exactly_the_limit_is_one_chunk(self):
+        self.assertEqual(split_text("x" * 10, limit=10), ["x" * 10])
+        self.assertEqual(len(split_text("x" * 4096)), 1)
+    # end def test_exactly_the_limit_is_one_chunk
+
+    def test_one_over_the_limit_is_split(self):
+        self.assertEqual(split_text("x" * 11, limit=10), ["x" * 10, "x"])
+        self.assertEqual([len(chunk) for chunk in split_text("x" * 4097)], [4096, 1])
+    # end def test_one_over_the_limit_is_split
+
+    def test_prefers_paragraphs(self):
+        self.assertEqual(split_text("aaaa\n\nbbbb", limit=6), ["aaaa", "bbbb"])
+        self.assertEqual(split_text("aaa bb\n\ncc", limit=9), ["aaa bb", "cc"])
+    # end def test_prefers_paragraphs
+
+    def test_prefers_sentences_over_spaces(self):
+        self.assertEqual(split_text("aaaa bbbb. cccc", limit=11), ["aaaa bbbb.", "cccc"])
+    # end def test_prefers_sentences_over_spaces
+
+    def test_no_whitespace_at_the_splits(self):
+        for chunk in split_text("word " * 100, limit=23):
+            self.assertEqual(chunk, chunk.strip())
+            self.assertLessEqual(units(chunk), 23)
+        # end for
+    # end def test_no_whitespace_at_the_splits
+
+    def test_nothing_is_lost(self):
+        text = " ".join("word{i}".format(i=i) for i in range(500))
+        self.assertEqual(" ".join(split_text(text, limit=50)), text)
+    # end def test_nothing_is_lost
+# end class SplitPlainTextTest
+
+
+class SplitSurrogatesTest(unittest.TestCase):
+    def test_emoji_count_two(self):
+        self.assertEqual(split_text(u"a" + EMOJI, limit=2), [u"a", EMOJI])
+        self.assertEqual(split_text(EMOJI * 5, limit=4), [EMOJI * 2, EMOJI * 2, EMOJI])
+    # end def test_emoji_count_two
+
+    def test_never_splits_a_surrogate_pair(self):
+        text = (u"ab" + EMOJI) * 50
+        chunks = split_text(text, limit=7)
+        self.assertEqual(u"".join(chunks), text)
+        for chunk in chunks:
+            self.assertLessEqual(units(chunk), 7)
+            chunk.encode("utf-8")  # a lone surrogate would raise
+        # end for
+    # end def test_never_splits_a_surrogate_pair
+
+    def test_emoji_at_the_limit(self):
+        self.assertEqual(split_text(u"x" * 9 + EMOJI, limit=10), [u"x" * 9, EMOJI])
+        self.assertEqual(split_text(u"x" * 8 + EMOJI, limit=10), [u"x" * 8 + EMOJI])
+    # end def test_emoji_at_the_limit
+# end class SplitSurrogatesTest
+
+
+class SplitMarkupTest(unittest.TestCase):
+    def test_html_formatting_is_closed_and_reopened(self):
+        chunks = split_text("<b>" + "word " * 6 + "</b>", "html", limit=12)
+        self.assertEqual(len(chunks), 3)
+        for chunk in chunks:
+            self.assertTrue(chunk.startswith("<b>"), chunk)
+            self.assertTrue(chunk.endswith("</b>"), chunk)
+            html_tags(chunk)
+        # end for
+    # end def test_html_formatting_is_closed_and_reopened
+
+    def test_html_nested_and_attributes(self):
+        chunks = split_text('<b>bold <a href="http://example.com">link text</a> more</b>', "HTML", limit=8)
+        for chunk in chunks:
+            html_tags(chunk)
+            self.assertLessEqual(units(_HTML_TAG.sub("", chunk)), 8)
+        # end for
+        self.assertIn('<a href="http://example.com">', chunks[1])  # reopened with its attributes
+    # end def test_html_nested_and_attributes
+
+    def test_html_markup_does_not_count(self):
+        self.assertEqual(split_text("<b>" + "x" * 10 + "</b>", "html", limit=10), ["<b>" + "x" * 10 + "</b>"])
+    # end def test_html_markup_does_not_count
+
+    def test_html_entities_count_one_and_are_not_split(self):
+        self.assertEqual(split_text("&amp;&lt;&gt;", "html", limit=3), ["&amp;&lt;&gt;"])
+        self.assertEqual(split_text("&amp;&lt;&gt;", "html", limit=2), ["&amp;&lt;", "&gt;"])
+    # end def test_html_entities_count_one_and_are_not_split
+
+    def test_markdown_formatting_is_closed_and_reopened(self):
+        self.assertEqual(split_text("*bold text here*", "markdown", limit=5), ["*bold*", "*text*", "*here*"])
+        self.assertEqual(split_text("_aa bb_", "Markdown", limit=2), ["_aa_", "_bb_"])
+    # end def test_markdown_formatting_is_closed_and_reopened
+
+    def test_markdown_link_is_not_split(self):
+        chunks = split_text("[ab](http://example.com/long) cd", "markdown", limit=3)
+        self.assertEqual(chunks, ["[ab](http://example.com/long)", "cd"])
+    # end def test_markdown_link_is_not_split
+
+    def test_markdown_markers_inside_code(self):
+        self.assertEqual(split_text("`a*b` c", "markdown", limit=3), ["`a*b`", "c"])
+    # end def test_markdown_markers_inside_code
+# end class SplitMarkupTest
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if
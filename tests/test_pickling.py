@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of pickling and copying the api types, see :meth:`pytgbot.api_types.TgBotApiObject.__reduce__`.
+
+    python -m unittest discover tests
+"""
+import copy
+import pickle
+import unittest
+
+from pytgbot.api_types import Frozen
+from pytgbot.api_types.receivable.peer import Chat, User
+from pytgbot.api_types.receivable.updates import Message, Update
+
+__author__ = 'luckydonald'
+
+
+def chain(length):
+    """ A message replying to a message replying to ... `length` messages deep. """
+    chat = Chat(1, u"private")
+    message = None
+    for message_id in range(length):
+        message = Message(message_id, 0, chat, from_peer=User(2, u"a"), text=u"Hi", reply_to_message=message)
+    # end for
+    return message
+# end def chain
+
+
+class PickleTest(unittest.TestCase):
+    def test_round_trip(self):
+        update = Update(1, message=Message(1, 0, Chat(1, u"private"), text=u"Hi"))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(update, protocol)), update)
+        # end for
+    # end def test_round_trip
+
+    def test_frozen_stays_frozen(self):
+        message = chain(3).freeze()
+        loaded = pickle.loads(pickle.dumps(message))
+        self.assertEqual(loaded, message)
+        self.assertIsInstance(loaded, Frozen)
+        self.assertIsInstance(loaded.reply_to_message, Frozen)
+        self.assertEqual(hash(loaded), hash(message))
+    # end def test_frozen_stays_frozen
+
+    def test_shared_message(self):
+        message = chain(2)
+        message.pinned_message = message.reply_to_message
+        loaded = pickle.loads(pickle.dumps(message))
+        self.assertEqual(loaded, message)
+        self.assertIs(loaded.pinned_message, loaded.reply_to_message)
+    # end def test_shared_message
+# end class PickleTest
+
+
+class DeepChainTest(unittest.TestCase):
+    """ Longer than the recursion limit, nothing may recurse. """
+    LENGTH = 20000
+
+    def test_pickle(self):
+        message = chain(self.LENGTH)
+        self.assertEqual(pickle.loads(pickle.dumps(Update(1, message=message))), Update(1, message=message))
+        self.assertEqual(pickle.loads(pickle.dumps(message.freeze())), message)
+    # end def test_pickle
+
+    def test_deepcopy(self):
+        message = chain(self.LENGTH)
+        copied = copy.deepcopy(message)
+        self.assertEqual(copied, message)
+        self.assertIsNot(copied.reply_to_message, message.reply_to_message)
+    # end def test_deepcopy
+# end class DeepChainTest
+
+
+if __name__ == '__main__':
+    unittest.main()
+# end if